@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the draft assistant's hot paths.
+
+Drafts seeded synthetic player pools (500 / 5,000 / 50,000 players, see
+services/synthetic_league.py) in 10, 12, 14 and 32-team leagues, each case
+in its own temporary database, and times:
+
+    load_player_data            cold load and unchanged reload of the pool
+    PlayerSearch                build, find_player (exact and misspelled),
+                                get_suggestions and autocomplete
+    get_best_available          once per pick, top 10 overall
+    get_ai_recommendation       once per pick (the CLI precomputes it each pick)
+    draft_player                every pick of the draft
+    import_draft_log            a generated 12-team draft log in one call
+
+Results go to a JSON file (commit, environment and per-operation latency
+percentiles in milliseconds) so per-pick latency can be compared across
+commits with ``--compare``.
+
+Usage:
+    python benchmark.py                       # full matrix
+    python benchmark.py --quick               # 500/5,000 players, 12 teams
+    python benchmark.py --compare old.json    # print changes against a baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from draft_assistant import FantasyDraftAssistant
+from src.fantasy_assistant.models.pick_schedule import DEFAULT_ROUNDS
+from src.fantasy_assistant.services.synthetic_league import generate_draft, generate_players
+
+POOL_SIZES = (500, 5_000, 50_000)
+LEAGUE_SIZES = (10, 12, 14, 32)
+SEARCH_QUERIES = 200
+
+
+def _stats(samples: List[float]) -> Dict:
+    """Summarize latencies (seconds) in milliseconds."""
+    ordered = sorted(samples)
+
+    def percentile(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        'n': len(ordered),
+        'total_ms': round(sum(ordered) * 1000, 3),
+        'mean_ms': round(sum(ordered) / len(ordered) * 1000, 4),
+        'p50_ms': round(percentile(0.50), 4),
+        'p95_ms': round(percentile(0.95), 4),
+        'p99_ms': round(percentile(0.99), 4),
+        'max_ms': round(ordered[-1] * 1000, 4),
+    }
+
+
+class _Timer:
+    """Collects latency samples per operation for one benchmark case."""
+
+    def __init__(self, pool: int, league: Optional[int]):
+        self.pool = pool
+        self.league = league
+        self.samples: Dict[str, List[float]] = {}
+
+    def __call__(self, operation: str, function: Callable, *args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        self.samples.setdefault(operation, []).append(time.perf_counter() - start)
+        return result
+
+    def results(self) -> List[Dict]:
+        return [{'operation': operation, 'pool': self.pool, 'league': self.league, **_stats(samples)}
+                for operation, samples in self.samples.items()]
+
+
+def _misspell(name: str, rng: random.Random) -> str:
+    """Drop one letter of a name, as a hurried draft-night typo would."""
+    index = rng.randrange(1, len(name) - 1)
+    return name[:index] + name[index + 1:]
+
+
+def bench_load_and_search(players: List[Dict], workdir: str, seed: int = 0) -> List[Dict]:
+    """Time pool loading and player search for one pool."""
+    timer = _Timer(len(players), None)
+    rng = random.Random(seed)
+    assistant = FantasyDraftAssistant(os.path.join(workdir, "load.db"))
+    try:
+        timer('load_player_data', assistant.load_player_data, [players])
+        timer('load_player_data_unchanged', assistant.load_player_data, [players])
+        timer('search_build', lambda: assistant.search)
+
+        search = assistant.search
+        for player in rng.sample(players, min(SEARCH_QUERIES, len(players))):
+            name = player['name']
+            timer('find_player', search.find_player, name.lower())
+            timer('find_player_misspelled', search.find_player, _misspell(name, rng))
+            timer('get_suggestions', search.get_suggestions, _misspell(name, rng))
+            timer('autocomplete', search.autocomplete, name[:3])
+
+        assistant.set_draft_position(1)
+        timer('import_draft_log', assistant.import_draft_log, generate_draft(players, seed=seed))
+    finally:
+        assistant.close()
+    return timer.results()
+
+
+def bench_draft(players: List[Dict], league_size: int, workdir: str,
+                picks: Optional[int] = None) -> List[Dict]:
+    """Time a full draft (best available, recommendation and pick at every pick)."""
+    timer = _Timer(len(players), league_size)
+    assistant = FantasyDraftAssistant(os.path.join(workdir, f"draft_{league_size}.db"))
+    try:
+        assistant.load_player_data([players])
+        assistant.set_draft_position((league_size + 1) // 2, league_size)
+        total = min(picks or league_size * DEFAULT_ROUNDS, len(players))
+        schedule = assistant.state.schedule
+        for _ in range(total):
+            overall = assistant.state.overall_pick
+            user_turn = schedule.slot_for_pick(overall) == schedule.user_slot
+            best = timer('get_best_available', assistant.get_best_available, None, 10)
+            recommendation = timer('get_ai_recommendation', assistant.get_ai_recommendation)
+            choices = recommendation['recommendations'] if user_turn else []
+            player = choices[0]['player'] if choices else best[0]
+            timer('draft_player', assistant.draft_player, player['name'], user_turn, player['id'])
+    finally:
+        assistant.close()
+    return timer.results()
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(pool_sizes: Iterable[int] = POOL_SIZES, league_sizes: Iterable[int] = LEAGUE_SIZES,
+                   picks: Optional[int] = None, seed: int = 0, verbose: bool = True) -> Dict:
+    """
+    Run every benchmark case.
+
+    Args:
+        pool_sizes: Players per generated pool
+        league_sizes: Teams per drafted league
+        picks: Picks per draft (default: every pick of a full draft)
+        seed: Seed of the generated pools and search queries
+        verbose: Print each case's timing as it finishes
+
+    Returns:
+        The report written by ``--output``
+    """
+    results = []
+    for pool_size in pool_sizes:
+        players = list(generate_players(pool_size, seed))
+        cases = [('load/search', lambda workdir: bench_load_and_search(players, workdir, seed))]
+        cases += [(f'{league}-team draft', lambda workdir, league=league:
+                   bench_draft(players, league, workdir, picks)) for league in league_sizes]
+        for label, case in cases:
+            started = time.perf_counter()
+            with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+                results.extend(case(workdir))
+            if verbose:
+                print(f"⏱️  {pool_size:>6,} players, {label}: {time.perf_counter() - started:.2f}s")
+
+    return {
+        'commit': _commit(),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'results': results,
+    }
+
+
+def _key(result: Dict) -> tuple:
+    return result['operation'], result['pool'], result['league']
+
+
+def compare(report: Dict, baseline: Dict) -> List[str]:
+    """Describe the p50/p95 change of every operation also in the baseline."""
+    before = {_key(result): result for result in baseline['results']}
+    lines = []
+    for result in report['results']:
+        old = before.get(_key(result))
+        if old is None:
+            continue
+        league = f"{result['league']}-team" if result['league'] else "-"
+        changes = [f"{stat} {old[stat]:.3f} → {result[stat]:.3f}ms "
+                   f"({(result[stat] / old[stat] - 1) * 100 if old[stat] else 0:+.0f}%)"
+                   for stat in ('p50_ms', 'p95_ms')]
+        lines.append(f"{result['operation']:<28} {result['pool']:>6} {league:>8}  " + "  ".join(changes))
+    return lines
+
+
+def print_report(report: Dict):
+    """Print the results as a table."""
+    print(f"\n{'operation':<28} {'pool':>6} {'league':>8} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'max ms':>9}")
+    for result in report['results']:
+        league = f"{result['league']}-team" if result['league'] else "-"
+        print(f"{result['operation']:<28} {result['pool']:>6} {league:>8} {result['n']:>6} "
+              f"{result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+              f"{result['max_ms']:>9.3f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the draft assistant's hot paths")
+    parser.add_argument("--pools", type=int, nargs="+", default=list(POOL_SIZES),
+                        help="Player pool sizes")
+    parser.add_argument("--leagues", type=int, nargs="+", default=list(LEAGUE_SIZES),
+                        help="League sizes to draft")
+    parser.add_argument("--quick", action="store_true",
+                        help="Only 500 and 5,000-player pools in a 12-team league")
+    parser.add_argument("--picks", type=int, help="Picks per draft (default: a full draft)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated pools")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("--compare", metavar="BASELINE", help="Earlier results to compare against")
+    args = parser.parse_args(argv)
+
+    pools, leagues = (args.pools, args.leagues) if not args.quick else ([500, 5_000], [12])
+    report = run_benchmarks(pools, leagues, args.picks, args.seed)
+    print_report(report)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\n📈 Compared with {args.compare} (commit {baseline.get('commit')}):")
+        for line in compare(report, baseline):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""Shared test fixtures"""
+
+import pytest
+
+from draft_assistant import FantasyDraftAssistant
+
+
+@pytest.fixture
+def assistant(request, tmp_path):
+    """
+    An assistant over a fresh database with the built-in player pool loaded
+    and draft position 8. Tests needing another setup parametrize it
+    indirectly, e.g. ``{"draft_position": None}`` or ``{"load": False}``.
+    """
+    options = getattr(request, "param", {})
+    position = options.get("draft_position", 8)
+    assistant = FantasyDraftAssistant(str(tmp_path / "draft.db"))
+    if options.get("load", True):
+        assistant.load_player_data()
+    if position is not None:
+        assistant.set_draft_position(position)
+    yield assistant
+    assistant.close()
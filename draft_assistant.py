@@ -12,22 +12,73 @@ Features:
 - Real-time draft state management
 """
 
+import argparse
 import sqlite3
-import json
 import os
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-import requests
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from typing import TYPE_CHECKING, List, Dict, Iterable, Optional, Sequence, Set, Tuple, Union
+
+from src.fantasy_assistant.models.adp_stats import AdpSummary, load_adp_stats
+from src.fantasy_assistant.models.availability import AvailabilityIndex
+from src.fantasy_assistant.models.database import DatabaseManager
+from src.fantasy_assistant.models.draft_state import DraftState, PickRecord
+from src.fantasy_assistant.models.migrations import migrate
+from src.fantasy_assistant.models.pool_snapshot import (PoolSnapshot, pool_token, renew_pool_token,
+                                                        write_pool_snapshot)
+from src.fantasy_assistant.services.draft_log import DraftLogEntry, DraftLogReport, iter_draft_log
+from src.fantasy_assistant.services.mock_draft_loader import IngestReport, ingest_mock_drafts
+from src.fantasy_assistant.services.player_loader import PlayerChanges, load_players, upsert_players
+from src.fantasy_assistant.utils.cache import VersionedLRUCache, versioned
+from src.fantasy_assistant.utils.instrumentation import Instrumentation, instrumented
+from src.fantasy_assistant.utils.profiling import SessionProfiler
+
+if TYPE_CHECKING:  # NumPy-backed modules (and asyncio) are imported on first use to keep startup fast
+    from src.fantasy_assistant.services.ai_recommender import AIRecommender
+    from src.fantasy_assistant.services.draft_sync import DraftSync
+    from src.fantasy_assistant.utils.player_search import PlayerSearch
 
 
 class FantasyDraftAssistant:
     def __init__(self, db_path: str = "fantasy_draft.db"):
         self.db_path = db_path
+        self.db = DatabaseManager(db_path)
         self.init_database()
+        self.state = DraftState.load(self.db)
+        self.snapshot_path = None if self.db.is_memory else f"{db_path}.pool"
+        self._snapshot = self._open_snapshot()
+        if self._snapshot is None and self.snapshot_path and self.has_players():
+            self._write_snapshot()  # Missing, unreadable or stale: rebuild it now, not at the next load
+        self._index = None
+        self._recommender = None
+        self._search = None
+        self._adp_stats = None
+        self.cache = VersionedLRUCache(maxsize=256)
+        self.instrumentation = Instrumentation(self.db, self.cache)
+        self.profiler = SessionProfiler()
+        self._lock = threading.RLock()  # Guards draft state against the speculation worker
+        self._speculator = None
+        self._speculation = None
+        self._speculate_lock = threading.Lock()  # Picks are also applied from the draft sync thread
+        self.speculate_lookahead = False
+        self._sync: Optional['DraftSync'] = None
+        
+    def close(self):
+        """Persist pending picks and close all database connections"""
+        self.stop_sync()
+        if self._speculator is not None:
+            self._speculator.shutdown(wait=True, cancel_futures=True)
+            self._speculator = None
+        self.state.close()
+        self.instrumentation.disable()
+        self.profiler.stop()
+        self.db.close()
         
     def init_database(self):
         """Initialize database with schema and data"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.db.connection
         cursor = conn.cursor()
         
         # Check if database exists
@@ -86,19 +137,113 @@ class FantasyDraftAssistant:
         else:
             print("📊 Database already exists")
         
-        conn.commit()
-        conn.close()
+        migrate(self.db)
     
-    def load_player_data(self):
-        """Load all compiled player data into database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Clear existing player data
-        cursor.execute("DELETE FROM players")
-        
+    @instrumented
+    def load_player_data(self, sources: Optional[Sequence[str]] = None,
+                         remove_missing: Optional[bool] = None) -> PlayerChanges:
+        """Load all compiled player data into database, or the player pool from ranking
+        files (Markdown tables, CSV or JSONL; earlier files take priority). Only players
+        whose data changed are rewritten, and only they are patched into the built
+        index, search and recommender. Players missing from the new pool are removed
+        only before the first pick unless remove_missing says otherwise, and drafted
+        players are never removed."""
+        with self._lock:
+            if remove_missing is None:
+                remove_missing = not self.state.picks
+            self.state.flush()  # Removal checks the persisted picks
+            with self.db.transaction() as conn:
+                if sources:
+                    report = load_players(self.db, sources, remove_missing,
+                                          progress=self._report_load_progress)
+                    print(f"\n📥 {report.summary()}")
+                    changes = report.changes
+                else:
+                    changes = upsert_players(self.db, self._builtin_players(), remove_missing)
+                injured = self._load_injury_data(conn.cursor())
+            
+                if changes or injured or pool_token(self.db) is None:
+                    renew_pool_token(conn)
+            
+            rows = None
+            if changes or injured:
+                rows = AvailabilityIndex.pool_rows(self.db)
+                self._apply_pool_changes(changes, injured, rows)
+                self.state.bump_version()
+            if self.snapshot_path and (rows is not None or self._snapshot is None):
+                self._write_snapshot(rows)
+            print(f"✅ Player data loaded successfully ({changes.summary()})")
+            return changes
+    
+    def _apply_pool_changes(self, changes: PlayerChanges, injured: Set[int], rows: List[Dict]):
+        """Patch the built pool structures with only the players a reload touched"""
+        removed = set(changes.removed_ids)
+        touched = (set(changes.added_ids) | set(changes.updated_ids) | injured) - removed
+        rows = [row for row in rows if row['id'] in touched]
+        if self._index is not None:
+            self._index.apply_changes(rows, removed)
+        if self._recommender is not None:  # Only ever built over the index
+            self._recommender.apply_changes(self._index.players(), touched)
+        if self._search is not None:
+            self._search.apply_changes([self._search_record(row) for row in rows], removed)
+    
+    def _open_snapshot(self) -> Optional[PoolSnapshot]:
+        """Map the player pool snapshot if it matches the pool in the database"""
+        token = pool_token(self.db)
+        if not self.snapshot_path or token is None:  # Without a token no snapshot can be trusted
+            return None
+        return PoolSnapshot.open(self.snapshot_path, token)
+    
+    def _write_snapshot(self, rows: Optional[List[Dict]] = None):
+        """Write the player pool snapshot (of the pool rows, read if not given) for
+        the next startup and map it"""
+        if rows is None:
+            rows = AvailabilityIndex.pool_rows(self.db)
+        token = pool_token(self.db)
+        if token is None:
+            with self.db.transaction() as conn:
+                token = renew_pool_token(conn)
+        if self._snapshot is not None:
+            # Unmap before replacing the file (Windows refuses while it is mapped); the
+            # search built over it was detached from the mapping when it was patched
+            self._snapshot.close()
+            self._snapshot = None
+        write_pool_snapshot(self.snapshot_path, rows, token)
+        self._snapshot = self._open_snapshot()
+    
+    def has_players(self) -> bool:
+        """Check if a player pool is loaded, from the snapshot when one is mapped"""
+        if self._snapshot is not None:
+            return len(self._snapshot) > 0
+        return bool(self.db.fetchone("SELECT EXISTS (SELECT 1 FROM players)")[0])
+    
+    @instrumented
+    def load_mock_drafts(self, paths: Optional[Sequence[str]] = None) -> IngestReport:
+        """Ingest mock draft write-ups (files, directories or globs; the shipped
+        mock_drafts directory by default) for ADP modeling. Files ingested before
+        are skipped by content hash."""
+        if not paths:
+            paths = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_drafts")]
+        with self._lock:
+            report = ingest_mock_drafts(self.db, paths)
+            if report.picks:
+                self._adp_stats = None
+                self._recommender = None
+                self.state.bump_version()
+            print(f"🗂️  {report.summary()}")
+            return report
+    
+    @staticmethod
+    def _report_load_progress(rows: int, seconds: float):
+        """Print bulk load progress on one line"""
+        rate = rows / seconds if seconds > 0 else 0
+        print(f"\r   ... {rows:,} rows read ({rate:,.0f} rows/s)", end="", flush=True)
+    
+    @staticmethod
+    def _builtin_players() -> List[tuple]:
+        """Compiled player pool used when no ranking files are given"""
         # Top consensus players with bye weeks and data
-        players_data = [
+        return [
             # Tier 1
             ("Ja'Marr Chase", "WR", "CIN", 10, 1, 1.5, 18.5, 0.28, 100, "Healthy", "Elite target share", None),
             ("Jahmyr Gibbs", "RB", "DET", 8, 2, 1.5, 16.8, 0.18, 52, "Healthy", "Pass-catching stud", "David Montgomery"),
@@ -135,17 +280,10 @@ class FantasyDraftAssistant:
             ("Sam LaPorta", "TE", "DET", 8, 30, 30.0, 11.2, 0.15, 86, "Healthy", "Sophomore success", None),
             ("Trey McBride", "TE", "ARI", 8, 32, 32.0, 10.8, 0.18, 81, "Healthy", "Target monster", None),
         ]
-        
-        # Insert player data
-        for player in players_data:
-            cursor.execute("""
-                INSERT INTO players (name, position, team, bye_week, consensus_rank, adp, 
-                                   ppg_projection, target_share, receptions_2024, injury_status, 
-                                   notes, handcuff)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, player)
-        
-        # Load injury data
+    
+    def _load_injury_data(self, cursor: sqlite3.Cursor) -> Set[int]:
+        """Replace injury reports inside the caller's transaction if they changed; get
+        the ids of the players whose reports changed"""
         injury_data = [
             ("Chris Godwin", "TB", "Ankle", "Out", "Until October", "Critical", "Avoid completely", "2025-08-22", "NFL.com"),
             ("Matthew Stafford", "LAR", "Back", "Questionable", "Week 1 uncertain", "Moderate", "Late round only", "2025-08-22", "ESPN"),
@@ -153,191 +291,481 @@ class FantasyDraftAssistant:
             ("Isaiah Likely", "BAL", "Foot", "Out", "6+ weeks", "Moderate", "Draft replacement", "2025-08-22", "NBC Sports"),
         ]
         
-        cursor.execute("DELETE FROM injury_reports")
-        for injury in injury_data:
-            cursor.execute("""
-                INSERT INTO injury_reports (player_name, team, injury_type, status, timeline, 
-                                          severity, fantasy_impact, report_date, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, injury)
-        
-        conn.commit()
-        conn.close()
-        print("✅ Player data loaded successfully")
-    
-    def set_draft_position(self, position: int):
-        """Set user's draft position (1-12)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM draft_state")
-        cursor.execute("""
-            INSERT INTO draft_state (league_size, current_pick, current_round, user_draft_position)
-            VALUES (12, 1, 1, ?)
-        """, (position,))
+        # Reports reference players by id; names alone can be shared, so match the team too
+        player_ids = {(name, team): player_id for player_id, name, team in cursor.execute(
+            f"SELECT id, name, team FROM players WHERE name IN ({', '.join('?' * len(injury_data))})",
+            [report[0] for report in injury_data]).fetchall()}
+        injury_data = [(player_ids.get(report[:2]), *report) for report in injury_data]
+        
+        stored = cursor.execute("""
+            SELECT player_id, player_name, team, injury_type, status, timeline, severity,
+                   fantasy_impact, report_date, source
+            FROM injury_reports ORDER BY id
+        """).fetchall()
+        if stored == injury_data:
+            return set()
+        
+        statuses = ({}, {})
+        for reports, by_player in zip((stored, injury_data), statuses):
+            for report in reports:
+                if report[0] is not None:
+                    by_player.setdefault(report[0], []).append(report[4])
         
-        conn.commit()
-        conn.close()
-        print(f"🎯 Draft position set to #{position}")
+        cursor.execute("DELETE FROM injury_reports")
+        cursor.executemany("""
+            INSERT INTO injury_reports (player_id, player_name, team, injury_type, status, timeline, 
+                                      severity, fantasy_impact, report_date, source)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, injury_data)
+        old, new = statuses
+        return {player_id for player_id in old.keys() | new.keys() if old.get(player_id) != new.get(player_id)}
     
-    def draft_player(self, player_name: str, drafted_by_user: bool = False):
-        """Record a player being drafted"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get current draft state
-        cursor.execute("SELECT current_pick, current_round FROM draft_state")
-        current_pick, current_round = cursor.fetchone()
-        
-        # Get player info
-        cursor.execute("SELECT position, team FROM players WHERE name = ?", (player_name,))
-        result = cursor.fetchone()
-        if not result:
-            print(f"❌ Player '{player_name}' not found in database")
-            conn.close()
+    def set_draft_position(self, position: int, league_size: int = 12):
+        """Set user's draft position (1-league_size)"""
+        with self._lock:
+            self.state.reset_position(position, league_size=league_size)
+            self.state.save_pointer()
+            
+            print(f"🎯 Draft position set to #{position}")
+    
+    @property
+    def cache_version(self) -> int:
+        """Draft state version that cached query results belong to"""
+        return self.state.version
+    
+    def cache_stats(self) -> Dict:
+        """Get hit/miss counters of the query cache"""
+        return self.cache.stats()
+    
+    @property
+    def index(self) -> AvailabilityIndex:
+        """Best-available index, built from the pool snapshot (or the database) on first use"""
+        if self._index is None:
+            if self._snapshot is not None:
+                self._index = AvailabilityIndex.from_rows(self._snapshot.rows(), self.state.drafted)
+            else:
+                self._index = AvailabilityIndex.from_database(self.db, self.state.drafted)
+        return self._index
+    
+    @property
+    def recommender(self) -> 'AIRecommender':
+        """Vectorized scorer over the full player pool, built on first use"""
+        if self._recommender is None:
+            from src.fantasy_assistant.services.ai_recommender import AIRecommender
+            self._recommender = AIRecommender(self.index.players(), self.state.drafted,
+                                              self.adp_stats)
+        return self._recommender
+    
+    @property
+    def adp_stats(self) -> Dict[str, AdpSummary]:
+        """Mock draft ADP statistics by player name (all sources), read on first use"""
+        if self._adp_stats is None:
+            self._adp_stats = load_adp_stats(self.db)
+        return self._adp_stats
+    
+    @property
+    def search(self) -> 'PlayerSearch':
+        """Name lookup and autocomplete over the player pool, built on first use"""
+        if self._search is None:
+            from src.fantasy_assistant.models.player_table import PlayerTable
+            from src.fantasy_assistant.utils.player_search import PlayerSearch
+            if self._snapshot is not None:
+                self._search = PlayerSearch.from_snapshot(self._snapshot, self.state.is_drafted)
+                return self._search
+            self._search = PlayerSearch(PlayerTable(
+                self._search_record(p) for p in self.index.players()
+            ))
+        return self._search
+    
+    def _search_record(self, player: Dict) -> Dict:
+        """PlayerTable record of an index player or pool row"""
+        return dict(player, consensus_rank=player['rank'], is_drafted=self.state.is_drafted(player['id']))
+    
+    def complete_command(self, line: str, limit: int = 10) -> List[str]:
+        """Complete a partly typed command, including player names after draft/pick"""
+        verb, _, partial = line.lstrip().partition(' ')
+        if verb in ('draft', 'pick') and partial:
+            players = self.search.autocomplete_players(
+                partial, limit, is_drafted=lambda player: self.state.is_drafted(player.id))
+            return [f"{verb} {self._player_label(self.index.get(player.id))}" for player in players]
+        commands = ['draft ', 'pick ', 'best', 'recommend', 'odds', 'plan',
+                    'roster', 'bye', 'undo', 'redo', 'import ', 'sync ', 'stats', 'profile',
+                    'help', 'quit']
+        return [c for c in commands if c.startswith(line.lstrip())]
+    
+    def _install_completer(self):
+        """Enable tab type-ahead for commands and player names where readline exists"""
+        try:
+            import readline
+        except ImportError:  # e.g. Windows without pyreadline
             return
+        matches = []
         
-        position, team = result
+        def completer(text, state):
+            if state == 0:
+                matches[:] = self.complete_command(readline.get_line_buffer())
+            return matches[state] if state < len(matches) else None
         
-        # Record the pick
-        cursor.execute("""
-            INSERT INTO drafted_players (player_name, position, team, pick_number, round, drafted_by_user)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (player_name, position, team, current_pick, current_round, drafted_by_user))
-        
-        # If drafted by user, add to roster
-        if drafted_by_user:
-            cursor.execute("SELECT bye_week FROM players WHERE name = ?", (player_name,))
-            bye_week = cursor.fetchone()[0]
+        readline.set_completer_delims('')  # Complete the whole line so names keep their spaces
+        readline.set_completer(completer)
+        readline.parse_and_bind('tab: complete')
+    
+    def _players_named(self, text: str) -> List[Dict]:
+        """Players a typed name may mean; "Name (TEAM)" or "Name (POS TEAM)" narrows down
+        players who share a name"""
+        name, _, qualifier = text.partition('(')
+        tags = set(qualifier.replace(')', ' ').upper().split())
+        return [p for p in self.index.named(name.strip()) if tags <= {p['position'], p['team']}]
+    
+    def _player_label(self, player: Dict) -> str:
+        """Player's name, qualified with position and team when another player shares it"""
+        if len(self.index.named(player['name'])) > 1:
+            return f"{player['name']} ({player['position']} {player['team']})"
+        return player['name']
+    
+    @instrumented
+    def draft_player(self, player_name: str, drafted_by_user: bool = False,
+                     player_id: Optional[int] = None):
+        """Record a player being drafted, by name ("Name (TEAM)" for players sharing
+        a name) or by players.id"""
+        with self._lock:
+            if player_id is not None:
+                players = [self.index.get(player_id)] if player_id in self.index else []
+            else:
+                players = self._players_named(player_name)
+            if not players:
+                print(f"❌ Player '{player_name}' not found in database")
+                return
+            undrafted = [p for p in players if not self.state.is_drafted(p['id'])]
+            if not undrafted:
+                print(f"❌ Player '{player_name}' has already been drafted")
+                return
+            if len(undrafted) > 1:
+                print(f"❌ More than one player is named '{player_name}': "
+                      f"{', '.join(self._player_label(p) for p in undrafted)}")
+                return
             
-            cursor.execute("""
-                INSERT INTO user_roster (player_name, position, team, bye_week, round_drafted, pick_number)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (player_name, position, team, bye_week, current_round, current_pick))
-        
-        # Update draft state
-        next_pick = current_pick + 1
-        next_round = current_round
-        if next_pick > 12:  # End of round
-            next_pick = 1
-            next_round += 1
-        
-        cursor.execute("""
-            UPDATE draft_state 
-            SET current_pick = ?, current_round = ?
-        """, (next_pick, next_round))
-        
-        conn.commit()
-        conn.close()
-        
-        status = "✅ YOUR PICK" if drafted_by_user else "📝 Drafted"
-        print(f"{status}: {player_name} ({position}, {team}) - Pick {current_pick}, Round {current_round}")
+            player = undrafted[0]
+            player_name, position, team = player['name'], player['position'], player['team']
+            pick = self.state.record_pick(player_name, position, team, player['bye_week'], drafted_by_user,
+                                          player['id'])
+            self._mark_drafted(player['id'])
+            current_pick, current_round = pick.pick_number, pick.round
+            
+            status = "✅ YOUR PICK" if drafted_by_user else "📝 Drafted"
+            print(f"{status}: {player_name} ({position}, {team}) - Pick {current_pick}, Round {current_round}")
+    
+    def _mark_drafted(self, player_id: Optional[int], drafted: bool = True):
+        """Take a player off (or put him back on) the board in every in-memory view"""
+        if drafted:
+            self.index.mark_drafted(player_id)
+        else:
+            self.index.restore(player_id)
+        if self._recommender is not None:
+            if drafted:
+                self._recommender.mark_drafted(player_id)
+            else:
+                self._recommender.restore(player_id)
+        if self._search is not None:
+            self._search.table.mark_drafted(player_id, drafted)
+    
+    @instrumented
+    def undo(self) -> Optional[PickRecord]:
+        """Take back the latest pick; returns it, or None if nothing was picked"""
+        with self._lock:
+            pick = self.state.undo()
+            if pick is None:
+                print("❌ Nothing to undo")
+                return None
+            self._mark_drafted(pick.player_id, False)
+            print(f"↩️  Undid {pick.player_name} - Pick {pick.pick_number}, Round {pick.round}")
+            return pick
+    
+    @instrumented
+    def redo(self) -> Optional[PickRecord]:
+        """Make the latest undone pick again; returns it, or None if nothing was undone"""
+        with self._lock:
+            pick = self.state.redo()
+            if pick is None:
+                print("❌ Nothing to redo")
+                return None
+            self._mark_drafted(pick.player_id)
+            print(f"↪️  Redid {pick.player_name} - Pick {pick.pick_number}, Round {pick.round}")
+            return pick
+    
+    @instrumented
+    def import_draft_log(self, log: Union[str, Iterable[DraftLogEntry]]) -> DraftLogReport:
+        """
+        Replay a pick log (CSV, JSONL or a Sleeper JSON export) onto the board.
+        
+        Entries before the board's current pick are skipped, so a full log can
+        be replayed to catch up after joining late. A log without pick numbers
+        is numbered in order, its leading entries already on the board counting
+        as the picks before the current one. The rest are checked first, then
+        written in one transaction with the draft_state pointer stored once;
+        nothing is recorded if any entry is bad. Picks without a user flag or
+        slot belong to the user when the schedule puts the user on the clock.
+        Players who share a name are told apart by the team and position the
+        log gives.
+        
+        Raises:
+            ValueError: On unknown, ambiguous or repeated players, or gaps in pick numbers
+        """
+        with self._lock:
+            started = time.perf_counter()
+            if isinstance(log, str):
+                log = iter_draft_log(log, self.state.league_size)
+            entries = sorted(self._number_draft_log(list(log)), key=lambda entry: entry.overall_pick)
+            
+            schedule, user_slot = self.state.schedule, self.state.user_draft_position
+            overall = self.state.overall_pick
+            picks, unknown, seen, report = [], [], set(), DraftLogReport()
+            for entry in entries:
+                if entry.overall_pick < self.state.overall_pick:
+                    report.skipped += 1
+                    continue
+                if entry.overall_pick != overall:
+                    raise ValueError(f"Draft log skips from pick {overall} to {entry.overall_pick}")
+                players = self._logged_players(entry)
+                if not players:
+                    unknown.append(entry.player_name)
+                elif len(players) > 1:
+                    raise ValueError(f"Draft log pick {entry.player_name} could be any of "
+                                     f"{', '.join(self._player_label(p) for p in players)}; "
+                                     f"give the player's team")
+                elif players[0]['id'] in seen:
+                    raise ValueError(f"{players[0]['name']} is drafted twice in the draft log")
+                elif self.state.is_drafted(players[0]['id']):
+                    raise ValueError(f"Draft log pick {overall}, {players[0]['name']}, is already on the board")
+                else:
+                    player = players[0]
+                    by_user = entry.drafted_by_user
+                    if by_user is None:
+                        slot = entry.slot or schedule.slot_for_pick(overall)
+                        by_user = user_slot is not None and slot == user_slot
+                    picks.append((player['name'], player['position'], player['team'], player['bye_week'],
+                                  by_user, player['id']))
+                    seen.add(player['id'])
+                overall += 1
+            if unknown:
+                raise ValueError(f"Unknown players in draft log: {', '.join(unknown)}")
+            
+            for pick in self.state.record_picks(picks):
+                self._mark_drafted(pick.player_id)
+            report.imported = len(picks)
+            report.seconds = time.perf_counter() - started
+            return report
+    
+    def _number_draft_log(self, entries: List[DraftLogEntry]) -> List[DraftLogEntry]:
+        """Give entries without a pick number their overall pick, one per entry in log
+        order, so that the leading entries already on the board end at the current pick"""
+        leading = 0
+        for entry in entries:
+            if entry.overall_pick is not None:
+                break
+            players = self._logged_players(entry)
+            if len(players) != 1 or not self.state.is_drafted(players[0]['id']):
+                break
+            leading += 1
+        first = self.state.overall_pick - leading
+        return [entry if entry.overall_pick is not None else replace(entry, overall_pick=first + i)
+                for i, entry in enumerate(entries)]
+    
+    def _logged_players(self, entry: DraftLogEntry) -> List[Dict]:
+        """Players a draft log entry may mean, narrowed by its team and position when
+        those match anyone (feeds may spell teams differently)"""
+        players = self.index.named(entry.player_name)
+        tags = {tag.upper() for tag in (entry.position, entry.team) if tag}
+        return [p for p in players if tags <= {p['position'], p['team']}] or players
+    
+    def start_sync(self, url: str, wait: float = 10.0) -> 'DraftSync':
+        """
+        Follow a live pick feed on a background thread (stopping any current sync).
+        
+        New picks are replayed onto the board as they appear, and the next
+        recommendation is speculated after each batch.
+        
+        Args:
+            url: Pick feed URL (a Sleeper /draft/<id>/picks endpoint or a PickFeedServer)
+            wait: Long-poll seconds to ask the feed for
+        """
+        from src.fantasy_assistant.services.draft_sync import DraftSync
+        
+        self.stop_sync()
+        self._sync = DraftSync(self, url, wait=wait, on_picks=self._on_synced_picks)
+        self._sync.start()
+        return self._sync
+    
+    def stop_sync(self) -> Optional['DraftSync']:
+        """Stop following the pick feed; returns the stopped sync, if any"""
+        sync, self._sync = self._sync, None
+        if sync is not None:
+            sync.stop()
+        return sync
+    
+    def _on_synced_picks(self, report: DraftLogReport):
+        """Announce picks applied by the draft sync and speculate on the new board"""
+        print(f"\n📡 Synced {report.imported} pick(s); now on the clock: "
+              f"{self.state.schedule.label(self.state.overall_pick)}")
+        self.speculate()
     
+    def speculate(self) -> Future:
+        """
+        Start computing the next recommendation in the background.
+        
+        Meant to run after each pick while the user waits on other teams.
+        The result lands in the query cache, so 'recommend' on the clock is
+        a cache hit. A speculation that has not started yet is cancelled
+        when the next one is queued, and one that starts after another pick
+        has landed does nothing.
+        
+        Returns:
+            Future resolving to True if the recommendation was computed
+        """
+        with self._speculate_lock:
+            if self._speculation is not None:
+                self._speculation.cancel()
+            if self._speculator is None:
+                self._speculator = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculate")
+            self._speculation = self._speculator.submit(self._precompute, self.state.version)
+            return self._speculation
+    
+    def _precompute(self, version: int) -> bool:
+        """Fill the cache for a draft state version unless it is already stale"""
+        with self._lock:
+            if self.state.version != version:
+                return False
+            self.get_ai_recommendation()
+            if self.speculate_lookahead:
+                self.get_ai_recommendation(lookahead=True)
+            return True
+    
+    @instrumented
     def get_best_available(self, position: str = None, limit: int = 10) -> List[Dict]:
         """Get best available players, optionally filtered by position"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get drafted players
-        cursor.execute("SELECT player_name FROM drafted_players")
-        drafted = [row[0] for row in cursor.fetchall()]
-        
-        # Build query
-        query = """
-            SELECT p.name, p.position, p.team, p.bye_week, p.consensus_rank, p.adp, 
-                   p.injury_status, p.notes, i.status as injury_report
-            FROM players p
-            LEFT JOIN injury_reports i ON p.name = i.player_name
-            WHERE p.name NOT IN ({})
-        """.format(','.join('?' * len(drafted)))
-        
-        params = drafted.copy()
-        
-        if position:
-            query += " AND p.position = ?"
-            params.append(position)
-        
-        query += " ORDER BY p.consensus_rank LIMIT ?"
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        
-        conn.close()
-        
-        players = []
-        for row in results:
-            players.append({
-                'name': row[0],
-                'position': row[1], 
-                'team': row[2],
-                'bye_week': row[3],
-                'rank': row[4],
-                'adp': row[5],
-                'injury_status': row[6],
-                'notes': row[7],
-                'injury_report': row[8]
-            })
-        
-        return players
-    
-    def get_ai_recommendation(self, num_recommendations: int = 3) -> Dict:
-        """Generate AI-powered draft recommendation based on current state"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get current draft state
-        cursor.execute("SELECT current_pick, current_round, user_draft_position FROM draft_state")
-        current_pick, current_round, user_position = cursor.fetchone()
-        
-        # Get user's current roster
-        cursor.execute("""
-            SELECT position, COUNT(*) as count 
-            FROM user_roster 
-            GROUP BY position
-        """)
-        roster_counts = dict(cursor.fetchall())
-        
-        # Get best available overall
-        best_available = self.get_best_available(limit=20)
-        
-        # Calculate needs
-        needs = self._calculate_position_needs(roster_counts, current_round)
-        
-        # Get bye week conflicts for user's team
-        bye_conflicts = self._check_bye_week_conflicts()
-        
-        conn.close()
-        
-        # AI reasoning logic
-        recommendations = []
-        
-        for player in best_available[:10]:
-            score = self._calculate_recommendation_score(
-                player, current_round, needs, bye_conflicts, user_position, current_pick
-            )
+        return [dict(player) for player in self._top_available(position, limit)]
+    
+    @versioned
+    def _top_available(self, position: Optional[str], limit: int) -> List[Dict]:
+        """Best available players, cached per draft state version (shared, do not mutate)"""
+        with self._lock:
+            return self.index.top(position, limit)
+    
+    @instrumented
+    @versioned
+    def get_ai_recommendation(self, num_recommendations: int = 3, lookahead: bool = False) -> Dict:
+        """Generate AI-powered draft recommendation based on current state (cached per
+        draft state version; the result is shared, do not mutate)"""
+        with self._lock:
+            # Get current draft state
+            current_pick = self.state.current_pick
+            current_round = self.state.current_round
+            user_position = self.state.user_draft_position
+            overall_pick = self.state.overall_pick
+            
+            # Get user's current roster
+            roster_counts = self.state.user_roster.position_counts()
+            
+            # Calculate needs
+            needs = self._calculate_position_needs(roster_counts, current_round)
+            
+            # Get bye week conflicts for user's team
+            bye_conflicts = self._check_bye_week_conflicts()
             
-            if score > 0:
+            # Score every available player and keep the best
+            recommendations = []
+            
+            for player, score in self.recommender.top(current_round, needs, num_recommendations,
+                                                      overall_pick):
                 recommendations.append({
-                    'player': player,
+                    'player': dict(player),
                     'score': score,
-                    'reasoning': self._generate_reasoning(player, current_round, needs, bye_conflicts)
+                    'reasoning': self._generate_reasoning(player, current_round, needs, bye_conflicts,
+                                                          overall_pick)
                 })
-        
-        # Sort by score and return top recommendations
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        
-        return {
-            'current_situation': {
-                'pick': current_pick,
-                'round': current_round,
-                'position': user_position,
-                'roster_needs': needs
-            },
-            'recommendations': recommendations[:num_recommendations],
-            'bye_week_alerts': bye_conflicts
-        }
+            
+            recommendation = {
+                'current_situation': {
+                    'pick': current_pick,
+                    'round': current_round,
+                    'overall_pick': overall_pick,
+                    'next_user_pick': self.state.schedule.next_user_pick(overall_pick),
+                    'position': user_position,
+                    'roster_needs': needs
+                },
+                'recommendations': recommendations,
+                'bye_week_alerts': bye_conflicts
+            }
+            
+            if lookahead:
+                recommendation['plan'] = self.get_lookahead_plan()
+            
+            return recommendation
+    
+    def _simulate_user_turns(self, n_sims: int, max_turns: Optional[int] = None,
+                             workers: int = 1, seed: Optional[int] = None):
+        """Simulate availability of every available player at the user's remaining turns"""
+        from src.fantasy_assistant.services.draft_simulator import DraftSimulator, load_adp_distributions
+        with self._lock:
+            current = self.state.overall_pick
+            user_picks = self.state.schedule.remaining_user_picks(current)[:max_turns]
+            
+            # Opponent picks before each turn, not counting the user's own picks
+            opponent_picks = [pick - current - i for i, pick in enumerate(user_picks)]
+            
+            available = [p for p in self.index.players() if self.index.is_available(p['id'])]
+            simulator = DraftSimulator(available, load_adp_distributions(self.db))
+            probabilities = simulator.availability(opponent_picks, n_sims=n_sims,
+                                                   workers=workers, seed=seed)
+            return user_picks, available, probabilities
+    
+    @instrumented
+    def simulate_availability(self, n_sims: int = 10000, limit: int = 15,
+                              workers: int = 1, seed: Optional[int] = None) -> Dict:
+        """Estimate the chance each available player lasts to the user's upcoming picks"""
+        with self._lock:
+            user_picks, available, probabilities = self._simulate_user_turns(
+                n_sims, workers=workers, seed=seed)
+            if user_picks and user_picks[0] == self.state.overall_pick:
+                # On the clock now; look past the pick being made
+                user_picks, probabilities = user_picks[1:], probabilities[:, 1:]
+            
+            odds = []
+            for player, player_odds in zip(available[:limit], probabilities):
+                odds.append({
+                    'player': dict(player),
+                    'next_pick': float(player_odds[0]) if user_picks else None,
+                    'by_pick': [float(p) for p in player_odds]
+                })
+            
+            return {
+                'current_pick': self.state.overall_pick,
+                'user_picks': user_picks,
+                'simulations': n_sims,
+                'odds': odds
+            }
+    
+    @instrumented
+    def get_lookahead_plan(self, horizon: int = 3, time_budget: float = 0.5,
+                           n_sims: int = 2000, seed: Optional[int] = None) -> Dict:
+        """Plan positions for the user's next few picks to maximize expected lineup points"""
+        with self._lock:
+            user_picks, available, probabilities = self._simulate_user_turns(
+                n_sims, max_turns=horizon, seed=seed)
+            
+            roster_values = {}
+            for entry in self.state.user_roster.entries:
+                roster_values.setdefault(entry.position, []).append(
+                    self.index.projection(entry.player_id) or 0.0)
+            
+            from src.fantasy_assistant.services.lookahead import LookaheadPlanner
+            planner = LookaheadPlanner(
+                available, self.index.projections(), probabilities, user_picks,
+                [self.state.schedule.label(pick) for pick in user_picks], roster_values
+            )
+            return planner.plan(horizon, time_budget)
     
+    @versioned
     def _calculate_position_needs(self, roster_counts: Dict, current_round: int) -> Dict:
         """Calculate position needs based on roster and round"""
         needs = {
@@ -356,20 +784,11 @@ class FantasyDraftAssistant:
         
         return needs
     
+    @versioned
     def _check_bye_week_conflicts(self) -> List[str]:
         """Check for bye week conflicts in user's roster"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT bye_week, position, COUNT(*) as count
-            FROM user_roster 
-            GROUP BY bye_week, position
-            HAVING count > 1
-        """)
-        
         conflicts = []
-        for bye_week, position, count in cursor.fetchall():
+        for bye_week, position, count in self.state.user_roster.bye_week_stacks():
             if bye_week == 8:
                 conflicts.append(f"⚠️ Week 8 BYEPOCALYPSE: {count} {position}s")
             elif bye_week == 14:
@@ -377,47 +796,11 @@ class FantasyDraftAssistant:
             else:
                 conflicts.append(f"Week {bye_week}: {count} {position}s")
         
-        conn.close()
         return conflicts
     
-    def _calculate_recommendation_score(self, player: Dict, current_round: int, 
-                                      needs: Dict, bye_conflicts: List, 
-                                      user_position: int, current_pick: int) -> float:
-        """Calculate recommendation score for a player"""
-        score = 0.0
-        
-        # Base value (inverse of consensus rank)
-        if player['rank']:
-            score += (200 - player['rank']) / 10
-        
-        # Position need multiplier
-        position_need = needs.get(player['position'], 0)
-        if position_need > 0:
-            score *= (1 + position_need * 0.5)
-        
-        # Round appropriateness
-        if player['position'] in ['QB'] and current_round < 6:
-            score *= 0.3  # Penalize early QB
-        elif player['position'] in ['K', 'DEF'] and current_round < 15:
-            score *= 0.1  # Heavily penalize early K/DEF
-        
-        # Injury penalty
-        if player['injury_status'] != 'Healthy':
-            if player['injury_report'] == 'Out':
-                score *= 0.2
-            elif player['injury_report'] == 'Questionable':
-                score *= 0.7
-        
-        # Bye week penalty
-        if player['bye_week'] == 8:  # Byepocalypse week
-            score *= 0.8
-        elif player['bye_week'] == 14:  # Playoff week
-            score *= 0.9
-        
-        return score
-    
     def _generate_reasoning(self, player: Dict, current_round: int, 
-                          needs: Dict, bye_conflicts: List) -> str:
+                          needs: Dict, bye_conflicts: List,
+                          overall_pick: Optional[int] = None) -> str:
         """Generate AI reasoning for recommendation"""
         reasons = []
         
@@ -429,9 +812,12 @@ class FantasyDraftAssistant:
         # Value
         if player['rank'] and player['rank'] <= current_round * 12:
             reasons.append("Good value at current ADP")
+        stats = self.adp_stats.get(player['name'])
+        if overall_pick is not None and stats and stats.mean + stats.sd < overall_pick:
+            reasons.append(f"Falling past mock ADP {stats.mean:.1f}")
         
         # PPR specific
-        if player['position'] in ['WR', 'RB'] and 'target' in player.get('notes', '').lower():
+        if player['position'] in ['WR', 'RB'] and 'target' in (player.get('notes') or '').lower():
             reasons.append("PPR upside")
         
         # Injury concerns
@@ -448,17 +834,7 @@ class FantasyDraftAssistant:
     
     def show_roster(self):
         """Display current user roster"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT player_name, position, team, bye_week, round_drafted
-            FROM user_roster
-            ORDER BY round_drafted, position
-        """)
-        
-        roster = cursor.fetchall()
-        conn.close()
+        roster = self.state.user_roster.sorted_entries()
         
         if not roster:
             print("📋 Your roster is empty")
@@ -466,93 +842,213 @@ class FantasyDraftAssistant:
         
         print("\n📋 YOUR CURRENT ROSTER")
         print("=" * 50)
-        for player_name, position, team, bye_week, round_drafted in roster:
-            print(f"R{round_drafted:2d} | {player_name:20s} | {position:2s} {team:3s} | Bye {bye_week:2d}")
+        for entry in roster:
+            print(f"R{entry.round_drafted:2d} | {entry.player_name:20s} | "
+                  f"{entry.position:2s} {entry.team:3s} | Bye {entry.bye_week:2d}")
         
         # Show position counts
-        cursor = sqlite3.connect(self.db_path).cursor()
-        cursor.execute("""
-            SELECT position, COUNT(*) as count
-            FROM user_roster
-            GROUP BY position
-            ORDER BY position
-        """)
-        
-        counts = cursor.fetchall()
+        counts = sorted(self.state.user_roster.position_counts().items())
         if counts:
             print("\nPosition Summary:")
             for pos, count in counts:
                 print(f"  {pos}: {count}")
     
-    def run_interactive_draft(self):
-        """Run interactive draft interface"""
+    def run_interactive_draft(self, league_size: Optional[int] = None):
+        """Run interactive draft interface (league_size defaults to the saved draft's)"""
         print("🏈 FANTASY FOOTBALL DRAFT ASSISTANT")
         print("=" * 50)
         
         # Get draft position if not set
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT user_draft_position FROM draft_state")
-        result = cursor.fetchone()
-        
-        if not result or not result[0]:
+        if not self.state.user_draft_position:
+            league_size = league_size or self.state.league_size
             while True:
                 try:
-                    position = int(input("Enter your draft position (1-12): "))
-                    if 1 <= position <= 12:
-                        self.set_draft_position(position)
+                    position = int(input(f"Enter your draft position (1-{league_size}): "))
+                    if 1 <= position <= league_size:
+                        self.set_draft_position(position, league_size)
                         break
                     else:
-                        print("Please enter a number between 1 and 12")
+                        print(f"Please enter a number between 1 and {league_size}")
                 except ValueError:
                     print("Please enter a valid number")
         
-        conn.close()
-        
         print("\nCommands:")
         print("  'draft [player name]' - Record your pick")
         print("  'pick [player name]' - Record someone else's pick")  
         print("  'best' - Show best available overall")
         print("  'best [pos]' - Show best available by position (QB/RB/WR/TE)")
         print("  'recommend' - Get AI recommendation")
+        print("  'odds' - Chance top players last to your next pick")
+        print("  'plan' - Plan positions for your next few picks")
         print("  'roster' - Show your current roster")
         print("  'bye' - Check bye week conflicts")
+        print("  'undo' / 'redo' - Take back or restore the latest pick")
+        print("  'import [file]' - Replay a pick log (CSV/JSONL/JSON)")
+        print("  'sync [url]' - Follow a live pick feed ('sync stop' to stop)")
+        print("  'stats' - Command latency and query stats ('stats on|off|reset')")
+        print("  'profile on|off' - Profile commands; hotspots written on exit")
         print("  'help' - Show commands")
         print("  'quit' - Exit")
+        print("  (Tab completes commands and player names)")
         
+        self._install_completer()
         while True:
             try:
-                command = input("\n> ").strip().lower()
+                line = input("\n> ").strip()
+                command = line.lower()
                 
                 if command == 'quit' or command == 'exit':
                     break
-                elif command == 'help':
-                    self._show_help()
-                elif command == 'best':
-                    self._show_best_available()
-                elif command.startswith('best '):
-                    position = command.split()[1].upper()
-                    self._show_best_available(position)
-                elif command == 'recommend':
-                    self._show_recommendations()
-                elif command == 'roster':
-                    self.show_roster()
-                elif command == 'bye':
-                    self._show_bye_conflicts()
-                elif command.startswith('draft '):
-                    player_name = ' '.join(command.split()[1:]).title()
-                    self.draft_player(player_name, drafted_by_user=True)
-                elif command.startswith('pick '):
-                    player_name = ' '.join(command.split()[1:]).title()
-                    self.draft_player(player_name, drafted_by_user=False)
-                else:
-                    print("Unknown command. Type 'help' for available commands.")
+                elif command == 'stats' or command.startswith('stats '):
+                    self._stats_command(line.split()[1:])
+                elif command == 'profile' or command.startswith('profile '):
+                    self._profile_command(line.split()[1:])
+                elif command == 'sync' or command.startswith('sync '):
+                    self._sync_command(line.split()[1:])
+                elif command:
+                    with self.instrumentation.measure(f"command:{command.split()[0]}"), \
+                            self.profiler.profile():
+                        self._dispatch(line, command)
                     
             except KeyboardInterrupt:
                 print("\nExiting draft assistant...")
                 break
             except Exception as e:
                 print(f"Error: {e}")
+        
+        self._write_profile()
+    
+    def _dispatch(self, line: str, command: str):
+        """Run one interactive command (``command`` is the lowercased line)"""
+        if command == 'help':
+            self._show_help()
+        elif command == 'best':
+            self._show_best_available()
+        elif command.startswith('best '):
+            position = command.split()[1].upper()
+            self._show_best_available(position)
+        elif command == 'recommend':
+            self._show_recommendations()
+        elif command == 'odds':
+            self._show_availability_odds()
+        elif command == 'plan':
+            self._show_lookahead_plan()
+        elif command == 'roster':
+            self.show_roster()
+        elif command == 'bye':
+            self._show_bye_conflicts()
+        elif command.startswith('draft '):
+            player_name = ' '.join(command.split()[1:]).title()
+            self.draft_player(player_name, drafted_by_user=True)
+            self.speculate()
+        elif command.startswith('pick '):
+            player_name = ' '.join(command.split()[1:]).title()
+            self.draft_player(player_name, drafted_by_user=False)
+            self.speculate()
+        elif command in ('undo', 'redo'):
+            getattr(self, command)()
+            self.speculate()
+        elif command.startswith('import '):
+            self._import_draft_log(line.split(maxsplit=1)[1])
+        else:
+            print("Unknown command. Type 'help' for available commands.")
+    
+    def _stats_command(self, args: List[str]):
+        """Handle 'stats', 'stats on [trace.jsonl]', 'stats off' and 'stats reset'"""
+        action = args[0].lower() if args else 'show'
+        if action == 'on':
+            self.instrumentation.enable(args[1] if len(args) > 1 else None)
+            trace = self.instrumentation.trace_path
+            print("📈 Command stats on" + (f" (tracing to {trace})" if trace else ""))
+        elif action == 'off':
+            self.instrumentation.disable()
+            print("📈 Command stats off")
+        elif action == 'reset':
+            self.instrumentation.reset()
+            print("📈 Command stats cleared")
+        else:
+            self._show_stats()
+    
+    def _profile_command(self, args: List[str]):
+        """Handle 'profile on [path]', 'profile off' and 'profile' (top hotspots so far)"""
+        action = args[0].lower() if args else 'show'
+        if action == 'on':
+            self.profiler.start(args[1] if len(args) > 1 else None)
+            print(f"🔬 Profiling commands (written to {self.profiler.path}.pstats/.collapsed on exit)")
+        elif action == 'off':
+            self.profiler.stop()
+            print(f"🔬 Profiling paused after {self.profiler.commands} command(s)")
+        else:
+            self._show_hotspots()
+    
+    def _sync_command(self, args: List[str]):
+        """Handle 'sync <url>', 'sync stop' and 'sync' (status)"""
+        if args and args[0].lower() == 'stop':
+            sync = self.stop_sync()
+            print(f"📡 Sync stopped: {sync.stats.summary()}" if sync else "📡 Not syncing")
+        elif args:
+            try:
+                self.start_sync(args[0])
+            except ValueError as e:
+                print(f"❌ Sync not started: {e}")
+                return
+            print(f"📡 Following {args[0]}; picks appear as they are made")
+        elif self._sync is None:
+            print("📡 Not syncing ('sync <url>' to follow a pick feed)")
+        else:
+            state = "running" if self._sync.running else "finished"
+            print(f"📡 Sync {state} ({self._sync.url}): {self._sync.stats.summary()}")
+    
+    def _show_hotspots(self, limit: int = 10):
+        """Show the functions with the most self time across profiled commands"""
+        hotspots = self.profiler.hotspots(limit)
+        if not hotspots:
+            state = "on" if self.profiler.enabled else "off ('profile on' to start)"
+            print(f"No commands profiled yet; profiling is {state}")
+            return
+        
+        print(f"\n🔬 HOTSPOTS ({self.profiler.commands} profiled commands)")
+        print("=" * 78)
+        print(f"{'function':48s} {'calls':>8} {'self s':>9} {'total s':>9}")
+        for name, calls, own, total in hotspots:
+            print(f"{name[:48]:48s} {calls:8d} {own:9.3f} {total:9.3f}")
+    
+    def _write_profile(self):
+        """Write the session profile, if any command was profiled"""
+        paths = self.profiler.write()
+        if paths:
+            self._show_hotspots(5)
+            print(f"\n🔬 Profile of {self.profiler.commands} command(s) written to {paths[0]} "
+                  f"and {paths[1]} (flamegraph.pl / speedscope)")
+    
+    def _show_stats(self):
+        """Show per-command latency percentiles, SQL work and cache hits"""
+        stats = self.instrumentation.stats()
+        if not stats:
+            state = "on" if self.instrumentation.enabled else "off ('stats on' to start)"
+            print(f"No commands measured yet; stats are {state}")
+            return
+        
+        minutes = (time.time() - self.instrumentation.started) / 60
+        print(f"\n📈 SESSION STATS ({minutes:.1f} min, p50/p95/p99 over the last "
+              f"{self.instrumentation.window} calls)")
+        print("=" * 92)
+        print(f"{'':24s} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} "
+              f"{'queries':>8} {'sql steps':>10} {'cache':>6}")
+        for title, commands in (("Commands", {name[8:]: summary for name, summary in stats.items()
+                                             if name.startswith('command:')}),
+                                ("Methods", {name: summary for name, summary in stats.items()
+                                             if not name.startswith('command:')})):
+            if not commands:
+                continue
+            print(f"{title}:")
+            for name, summary in commands.items():
+                hit_rate = summary['cache_hit_rate']
+                cache = f"{hit_rate:.0%}" if hit_rate is not None else "-"
+                print(f"  {name:22s} {summary['calls']:6d} {summary['p50_ms']:9.2f} {summary['p95_ms']:9.2f} "
+                      f"{summary['p99_ms']:9.2f} {summary['max_ms']:9.2f} {summary['queries_per_call']:8.1f} "
+                      f"{summary['sql_steps_per_call']:10.0f} {cache:>6}")
+        print("(queries, sql steps: per call on the command's thread; cache: query cache hit rate)")
     
     def _show_help(self):
         """Show help commands"""
@@ -563,8 +1059,18 @@ class FantasyDraftAssistant:
         print("best           - Show top available players")
         print("best QB/RB/WR/TE - Show best by position")  
         print("recommend      - Get AI recommendation")
+        print("odds           - Chance players last to your next pick")
+        print("plan           - Plan your next few picks")
         print("roster         - Show your current roster")
         print("bye           - Check bye week conflicts")
+        print("undo / redo   - Take back or restore the latest pick")
+        print("import [file] - Replay a pick log (CSV/JSONL/JSON)")
+        print("sync [url]    - Follow a live pick feed (Sleeper /draft/<id>/picks)")
+        print("sync / sync stop - Sync status / stop following the feed")
+        print("stats         - Command latency and query stats")
+        print("stats on [file] / off / reset - Measure commands (optionally trace to JSONL)")
+        print("profile        - Top hotspots of profiled commands")
+        print("profile on [path] / off - Profile commands (pstats + collapsed stacks on exit)")
         print("quit          - Exit program")
     
     def _show_best_available(self, position: str = None):
@@ -584,14 +1090,18 @@ class FantasyDraftAssistant:
             bye_flag = "🚨" if player['bye_week'] in [8, 14] else ""
             
             print(f"{i:2d}. {player['name']:18s} | {player['position']:2s} {player['team']:3s} | "
-                  f"Bye {player['bye_week']:2d} | Rank {player['rank']:3d} {injury_flag}{bye_flag}")
+                  f"Bye {player['bye_week']:2d} | Rank {player['rank'] or '-':>3} {injury_flag}{bye_flag}")
     
     def _show_recommendations(self):
         """Show AI recommendations"""
         rec_data = self.get_ai_recommendation()
         
-        print(f"\n🤖 AI RECOMMENDATIONS - Pick {rec_data['current_situation']['pick']}, "
-              f"Round {rec_data['current_situation']['round']}")
+        situation = rec_data['current_situation']
+        print(f"\n🤖 AI RECOMMENDATIONS - Pick {situation['pick']}, Round {situation['round']}")
+        next_pick = situation['next_user_pick']
+        if next_pick is not None and next_pick != situation['overall_pick']:
+            print(f"   Your next turn: {self.state.schedule.label(next_pick)} "
+                  f"({next_pick - situation['overall_pick']} picks away)")
         print("=" * 60)
         
         for i, rec in enumerate(rec_data['recommendations'], 1):
@@ -605,6 +1115,51 @@ class FantasyDraftAssistant:
             for alert in rec_data['bye_week_alerts']:
                 print(f"   {alert}")
     
+    def _show_availability_odds(self):
+        """Show how likely top players are to be there at the user's next pick"""
+        sim_data = self.simulate_availability()
+        
+        if not sim_data['user_picks']:
+            print("No picks left for your team")
+            return
+        
+        next_pick = sim_data['user_picks'][0]
+        print(f"\n🎲 AVAILABILITY AT YOUR NEXT PICK ({self.state.schedule.label(next_pick)}, "
+              f"{sim_data['simulations']:,} simulated drafts)")
+        print("=" * 60)
+        
+        for i, entry in enumerate(sim_data['odds'], 1):
+            player = entry['player']
+            print(f"{i:2d}. {player['name']:18s} | {player['position']:2s} {player['team']:3s} | "
+                  f"Rank {player['rank'] or '-':>3} | {entry['next_pick']:6.1%}")
+    
+    def _show_lookahead_plan(self):
+        """Show the lookahead plan for the user's next picks"""
+        plan = self.get_lookahead_plan()
+        
+        if not plan['steps']:
+            print("No picks left to plan")
+            return
+        
+        print(f"\n🧭 LOOKAHEAD PLAN - next {len(plan['steps'])} picks "
+              f"({plan['expected_lineup_points']:.1f} expected lineup PPG)")
+        print("=" * 60)
+        for step in plan['steps']:
+            print(f"{step.label:>6s} | {step.position:2s} | {step.player['name']:18s} | "
+                  f"{step.availability:6.1%} available | {step.expected_ppg:4.1f} exp. PPG")
+        print(f"\n💡 {plan['summary']}")
+    
+    def _import_draft_log(self, path: str):
+        """Replay a pick log and report the outcome"""
+        try:
+            report = self.import_draft_log(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Draft log not imported: {e}")
+            return
+        print(f"📥 {report.summary()}; now on the clock: "
+              f"{self.state.schedule.label(self.state.overall_pick)}")
+        self.speculate()
+    
     def _show_bye_conflicts(self):
         """Show bye week conflicts"""
         conflicts = self._check_bye_week_conflicts()
@@ -620,21 +1175,61 @@ class FantasyDraftAssistant:
 
 def main():
     """Main function to run the draft assistant"""
+    parser = argparse.ArgumentParser(description="Fantasy football draft assistant")
+    parser.add_argument("rankings", nargs="*",
+                        help="Ranking files (Markdown tables, CSV or JSONL) to load as the player pool")
+    parser.add_argument("--mock-drafts", nargs="+", metavar="PATH",
+                        help="Mock draft write-ups (files, directories or globs) to ingest")
+    parser.add_argument("--draft-log", metavar="PATH",
+                        help="Pick log (CSV, JSONL or Sleeper JSON export) to replay before starting")
+    parser.add_argument("--sync", metavar="URL",
+                        help="Follow a live pick feed (see the 'sync' command)")
+    parser.add_argument("--stats", action="store_true",
+                        help="Measure command latency and queries from the start (see the 'stats' command)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Also append every measurement to this JSONL file (implies --stats)")
+    parser.add_argument("--profile", nargs="?", const="draft_profile", metavar="PATH",
+                        help="Profile every command (about 2-3x slower where pure Python); "
+                             "writes PATH.pstats and PATH.collapsed on exit")
+    parser.add_argument("--league-size", type=int, metavar="TEAMS",
+                        help="Number of teams in a new draft (default: the saved draft's, else 12)")
+    args = parser.parse_args()
+    if args.league_size is not None and args.league_size < 2:
+        parser.error("--league-size must be at least 2")
+    
     assistant = FantasyDraftAssistant()
+    if (args.league_size and assistant.state.user_draft_position
+            and args.league_size != assistant.state.league_size):
+        print(f"⚠️ Saved draft has {assistant.state.league_size} teams; ignoring --league-size")
+    if args.stats or args.trace:
+        assistant.instrumentation.enable(args.trace)
+    if args.profile:
+        assistant.profiler.start(args.profile)
     
-    # Load data if database is empty
-    conn = sqlite3.connect(assistant.db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM players")
-    player_count = cursor.fetchone()[0]
-    conn.close()
+    # Load data if database is empty or new rankings were given
+    first_run = not assistant.has_players()
     
-    if player_count == 0:
+    if first_run or args.rankings:
         print("Loading player data...")
-        assistant.load_player_data()
+        assistant.load_player_data(args.rankings)
+    
+    # Shipped mock drafts are ingested once; unchanged files are skipped cheaply
+    if first_run or args.mock_drafts:
+        assistant.load_mock_drafts(args.mock_drafts)
+    
+    if args.draft_log:
+        if not assistant.state.user_draft_position:
+            print("⚠️ Draft position not set; logged picks without a user flag count as other teams'")
+        assistant._import_draft_log(args.draft_log)
+    
+    if args.sync:
+        assistant._sync_command([args.sync])
     
     # Run interactive draft
-    assistant.run_interactive_draft()
+    try:
+        assistant.run_interactive_draft(args.league_size)
+    finally:
+        assistant.close()
 
 
 if __name__ == "__main__":
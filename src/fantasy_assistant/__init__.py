@@ -12,14 +12,25 @@ __version__ = "1.0.0"
 __author__ = "Evan Smelser"
 __email__ = "your.email@example.com"
 
-from .models.database import DatabaseManager
-from .models.player import Player
-from .services.draft_engine import DraftEngine
-from .services.ai_recommender import AIRecommender
+from importlib import import_module
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in NumPy.
+_EXPORTS = {
+    "DatabaseManager": ".models.database",
+    "Player": ".models.player",
+    "AIRecommender": ".services.ai_recommender",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "DatabaseManager",
     "Player", 
-    "DraftEngine",
     "AIRecommender",
 ]
\ No newline at end of file
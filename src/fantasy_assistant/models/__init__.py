@@ -1,8 +1,23 @@
 """Data models for the fantasy football draft assistant."""
 
-from .database import DatabaseManager
-from .player import Player
-from .draft_state import DraftState
-from .roster import UserRoster
+from importlib import import_module
 
-__all__ = ["DatabaseManager", "Player", "DraftState", "UserRoster"]
\ No newline at end of file
+# Imported on first access (PEP 562); PlayerTable needs NumPy
+_EXPORTS = {
+    "AdpStats": ".adp_stats",
+    "load_adp_stats": ".adp_stats",
+    "DatabaseManager": ".database",
+    "Player": ".player",
+    "PlayerTable": ".player_table",
+    "DraftState": ".draft_state",
+    "UserRoster": ".roster",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["AdpStats", "load_adp_stats", "DatabaseManager", "Player", "PlayerTable", "DraftState", "UserRoster"]
@@ -0,0 +1,180 @@
+"""
+Materialized ADP statistics for the fantasy football draft assistant.
+
+The ``adp_stats`` table holds one row per (player, source) plus one row per
+player for all sources combined, stored under the source name ``'*'``
+(``OVERALL``, which mock draft sources may not use): pick count, mean,
+sum of squared deviations (for the standard deviation), min/max, the
+10th/50th/90th percentile picks and the pick histogram they come from.
+Rows are merged with each batch of new picks (Chan et al.'s parallel form of
+Welford's algorithm), so ingesting mock drafts never rescans old picks and
+readers fetch one row per player.
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from .database import DatabaseManager
+
+OVERALL = '*'
+QUANTILES = (0.1, 0.5, 0.9)
+
+_COLUMNS = "player_name, source, picks, mean, m2, min_pick, max_pick, p10, p50, p90, histogram"
+
+
+class AdpSummary(NamedTuple):
+    """Read-only ADP statistics of one player for one source."""
+
+    picks: int
+    mean: float
+    sd: float
+    min_pick: int
+    max_pick: int
+    p10: float
+    p50: float
+    p90: float
+
+
+@dataclass
+class AdpStats:
+    """
+    Running pick statistics that can absorb single picks or whole batches.
+
+    Attributes:
+        picks: Number of picks seen
+        mean: Mean overall pick
+        m2: Sum of squared deviations from the mean
+        min_pick: Earliest pick
+        max_pick: Latest pick
+        histogram: Number of times the player went at each pick
+    """
+
+    picks: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min_pick: Optional[int] = None
+    max_pick: Optional[int] = None
+    histogram: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def sd(self) -> float:
+        """Population standard deviation of the picks."""
+        return (self.m2 / self.picks) ** 0.5 if self.picks else 0.0
+
+    def add(self, pick: int):
+        """Account for one pick (Welford's update)."""
+        self.picks += 1
+        delta = pick - self.mean
+        self.mean += delta / self.picks
+        self.m2 += delta * (pick - self.mean)
+        self.min_pick = pick if self.min_pick is None else min(self.min_pick, pick)
+        self.max_pick = pick if self.max_pick is None else max(self.max_pick, pick)
+        self.histogram[pick] = self.histogram.get(pick, 0) + 1
+
+    def merge(self, other: 'AdpStats'):
+        """Absorb the statistics of a disjoint set of picks."""
+        if not other.picks:
+            return
+        total = self.picks + other.picks
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.picks * other.picks / total
+        self.mean += delta * other.picks / total
+        self.picks = total
+        self.min_pick = other.min_pick if self.min_pick is None else min(self.min_pick, other.min_pick)
+        self.max_pick = other.max_pick if self.max_pick is None else max(self.max_pick, other.max_pick)
+        for pick, count in other.histogram.items():
+            self.histogram[pick] = self.histogram.get(pick, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """Get the nearest-rank q-quantile pick from the histogram."""
+        if not self.picks:
+            return 0.0
+        target, seen = max(1, q * self.picks), 0
+        for pick in sorted(self.histogram):
+            seen += self.histogram[pick]
+            if seen >= target:
+                return float(pick)
+        return float(self.max_pick)
+
+
+def _to_row(player: str, source: str, stats: AdpStats) -> tuple:
+    quantiles = [stats.quantile(q) for q in QUANTILES]
+    histogram = json.dumps(sorted(stats.histogram.items()), separators=(',', ':'))
+    return (player, source, stats.picks, stats.mean, stats.m2,
+            stats.min_pick, stats.max_pick, *quantiles, histogram)
+
+
+def _from_row(row: tuple) -> AdpStats:
+    picks, mean, m2, min_pick, max_pick = row[2:7]
+    return AdpStats(picks, mean, m2, min_pick, max_pick,
+                    {pick: count for pick, count in json.loads(row[10])})
+
+
+def update_adp_stats(conn: sqlite3.Connection, picks: Iterable[Tuple[str, str, int]],
+                     chunk_size: int = 500) -> int:
+    """
+    Fold new picks into the adp_stats table.
+
+    Picks are aggregated in memory first, then merged into the stored rows
+    of the players they touch; other rows are not read.
+
+    Args:
+        conn: Connection to write with (callers hold the transaction)
+        picks: (source name, player name, overall pick) triples
+        chunk_size: Player names per lookup query
+
+    Returns:
+        Number of adp_stats rows written
+    """
+    batch: Dict[Tuple[str, str], AdpStats] = {}
+    for source, player, pick in picks:
+        if player is None or pick is None:
+            continue
+        for key in ((player, source), (player, OVERALL)):
+            stats = batch.get(key)
+            if stats is None:
+                stats = batch[key] = AdpStats()
+            stats.add(pick)
+    if not batch:
+        return 0
+
+    players = sorted({player for player, _ in batch})
+    for start in range(0, len(players), chunk_size):
+        names = players[start:start + chunk_size]
+        for row in conn.execute(f"""
+            SELECT {_COLUMNS} FROM adp_stats
+            WHERE player_name IN ({', '.join('?' * len(names))})
+        """, names):
+            stats = batch.get((row[0], row[1]))
+            if stats is not None:
+                stored = _from_row(row)
+                stored.merge(stats)
+                batch[row[0], row[1]] = stored
+
+    conn.executemany(f"""
+        INSERT OR REPLACE INTO adp_stats ({_COLUMNS})
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [_to_row(player, source, stats) for (player, source), stats in batch.items()])
+    return len(batch)
+
+
+def load_adp_stats(db: DatabaseManager, source: str = OVERALL) -> Dict[str, AdpSummary]:
+    """
+    Read the precomputed ADP statistics of every player for one source.
+
+    Args:
+        db: Database manager to read from
+        source: Mock draft source name, or OVERALL for all sources combined
+
+    Returns:
+        Mapping of player name to AdpSummary
+    """
+    return {
+        name: AdpSummary(picks, mean, (m2 / picks) ** 0.5, min_pick, max_pick, p10, p50, p90)
+        for name, picks, mean, m2, min_pick, max_pick, p10, p50, p90 in db.fetchall("""
+            SELECT player_name, picks, mean, m2, min_pick, max_pick, p10, p50, p90
+            FROM adp_stats WHERE source = ? AND picks > 0
+        """, (source,))
+    }
@@ -0,0 +1,212 @@
+"""Best-available index for the fantasy football draft assistant."""
+
+import bisect
+from typing import Dict, Iterable, List, Optional
+
+from .database import DatabaseManager
+
+
+class AvailabilityIndex:
+    """
+    Rank-ordered view of the undrafted player pool.
+
+    Keeps one list ordered by consensus rank for the whole pool and one per
+    position. Drafting a player only marks it as taken (lazy deletion); each
+    list keeps a head pointer past its drafted prefix, so top-N queries walk
+    N live entries plus the few drafted players interleaved with them, no
+    matter how many players are gone. Players are keyed by players.id, as
+    two players can share a name.
+    """
+
+    # Same columns, names and order that get_best_available has always returned, plus the id
+    QUERY = """
+        SELECT p.name, p.position, p.team, p.bye_week, p.consensus_rank, p.adp,
+               p.injury_status, p.notes, i.status as injury_report, p.id, p.ppg_projection
+        FROM players p
+        LEFT JOIN injury_reports i ON i.player_id = p.id
+        ORDER BY p.consensus_rank IS NULL, p.consensus_rank, p.id
+    """
+
+    # Keys of QUERY rows; the first ten form the player dicts
+    FIELDS = ('name', 'position', 'team', 'bye_week', 'rank', 'adp', 'injury_status', 'notes',
+              'injury_report', 'id', 'ppg_projection')
+
+    def __init__(self, players: Iterable[Dict], drafted: Iterable[int] = (),
+                 projections: Optional[Dict[int, float]] = None):
+        """
+        Build the index.
+
+        Args:
+            players: Player dicts (with ``id``) already ordered by consensus rank
+            drafted: Ids of players that are already off the board
+            projections: Projected points per game by player id
+        """
+        self._projections = projections or {}
+        self._players: Dict[int, Dict] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._ordered: Dict[Optional[str], List[int]] = {None: []}
+        for player in players:
+            player_id = player['id']
+            if player_id in self._players:  # Extra injury report rows
+                continue
+            self._players[player_id] = player
+            self._by_name.setdefault(player['name'].casefold(), []).append(player_id)
+            self._ordered[None].append(player_id)
+            self._ordered.setdefault(player['position'], []).append(player_id)
+
+        self._slots = {
+            key: {player_id: i for i, player_id in enumerate(ids)}
+            for key, ids in self._ordered.items()
+        }
+        self._heads = {key: 0 for key in self._ordered}
+        self._drafted = set()
+        for player_id in drafted:
+            self.mark_drafted(player_id)
+
+    @classmethod
+    def pool_rows(cls, db: DatabaseManager) -> List[Dict]:
+        """Read the pool as the index sees it, with projections (FIELDS keys)."""
+        return [dict(zip(cls.FIELDS, row)) for row in db.fetchall(cls.QUERY)]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict], drafted: Iterable[int] = ()) -> 'AvailabilityIndex':
+        """Build the index from pool rows (see pool_rows)."""
+        rows = list(rows)
+        players = [{key: row[key] for key in cls.FIELDS[:10]} for row in rows]
+        projections = {row['id']: row['ppg_projection'] for row in rows
+                       if row['ppg_projection'] is not None}
+        return cls(players, drafted, projections)
+
+    @classmethod
+    def from_database(cls, db: DatabaseManager, drafted: Iterable[int] = ()) -> 'AvailabilityIndex':
+        """Build the index from the players and injury_reports tables."""
+        return cls.from_rows(cls.pool_rows(db), drafted)
+
+    def apply_changes(self, rows: Iterable[Dict], removed: Iterable[int] = ()):
+        """
+        Patch the index after a reload, touching only the players it changed.
+
+        Other players keep their records (the same dicts) and drafted flags;
+        only the rank lists of the positions involved are re-sorted.
+
+        Args:
+            rows: Pool rows (see pool_rows) of the added and updated players
+            removed: Ids of players that left the pool
+        """
+        rows = list(rows)
+        replaced = {row['id'] for row in rows}
+        self._drafted.difference_update(removed)
+        keys = {None}
+        for player_id in replaced.union(removed):
+            player = self._players.pop(player_id, None)
+            if player is None:
+                continue
+            keys.add(player['position'])
+            namesakes = self._by_name[player['name'].casefold()]
+            namesakes.remove(player_id)
+            if not namesakes:
+                del self._by_name[player['name'].casefold()]
+            self._projections.pop(player_id, None)
+
+        added = []
+        for row in rows:
+            player_id = row['id']
+            if player_id in self._players:  # Extra injury report rows
+                continue
+            self._players[player_id] = {key: row[key] for key in self.FIELDS[:10]}
+            if row['ppg_projection'] is not None:
+                self._projections[player_id] = row['ppg_projection']
+            namesakes = self._by_name.setdefault(row['name'].casefold(), [])
+            bisect.insort(namesakes, player_id, key=self._rank_key)
+            keys.add(row['position'])
+            added.append(player_id)
+
+        for key in keys:
+            ids = [player_id for player_id in self._ordered.get(key, ())
+                   if player_id in self._players and player_id not in replaced]
+            for player_id in added:
+                if key is None or self._players[player_id]['position'] == key:
+                    bisect.insort(ids, player_id, key=self._rank_key)
+            self._ordered[key] = ids
+            self._slots[key] = {player_id: i for i, player_id in enumerate(ids)}
+            self._heads[key] = 0
+
+    def _rank_key(self, player_id: int) -> tuple:
+        """Sort key of QUERY's order (ranked players first, then by rank and id)."""
+        rank = self._players[player_id]['rank']
+        return (rank is None, rank or 0, player_id)
+
+    def __len__(self) -> int:
+        """Number of players still available."""
+        return len(self._players) - len(self._drafted)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._players
+
+    def get(self, player_id: int) -> Optional[Dict]:
+        """Get a player's record whether or not they have been drafted."""
+        return self._players.get(player_id)
+
+    def named(self, name: str) -> List[Dict]:
+        """Get every player with a name (case-insensitive), best rank first."""
+        return [self._players[player_id] for player_id in self._by_name.get(name.casefold(), ())]
+
+    def players(self) -> List[Dict]:
+        """Get every player record in rank order, drafted or not (shared, do not mutate)."""
+        return [self._players[player_id] for player_id in self._ordered[None]]
+
+    def projection(self, player_id: int) -> Optional[float]:
+        """Get a player's projected points per game."""
+        return self._projections.get(player_id)
+
+    def projections(self) -> Dict[int, float]:
+        """Get projected points per game by player id for every player that has one."""
+        return dict(self._projections)
+
+    def is_available(self, player_id: int) -> bool:
+        """Check if a player is in the pool and still undrafted."""
+        return player_id in self._players and player_id not in self._drafted
+
+    def mark_drafted(self, player_id: int):
+        """Take a player off the board."""
+        if player_id in self._players:
+            self._drafted.add(player_id)
+
+    def restore(self, player_id: int):
+        """Put a drafted player back on the board."""
+        if player_id not in self._drafted:
+            return
+        self._drafted.discard(player_id)
+        position = self._players[player_id]['position']
+        for key in (None, position):
+            slot = self._slots[key][player_id]
+            if slot < self._heads[key]:
+                self._heads[key] = slot
+
+    def top(self, position: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """
+        Get the best available players.
+
+        Args:
+            position: Optional position filter (QB, RB, WR, TE, K, DEF)
+            limit: Maximum players to return
+
+        Returns:
+            Copies of player dicts ordered by consensus rank
+        """
+        ids = self._ordered.get(position)
+        if not ids:
+            return []
+
+        i = self._heads[position]
+        while i < len(ids) and ids[i] in self._drafted:
+            i += 1
+        self._heads[position] = i
+
+        results = []
+        while i < len(ids) and len(results) < limit:
+            player_id = ids[i]
+            if player_id not in self._drafted:
+                results.append(dict(self._players[player_id]))
+            i += 1
+        return results
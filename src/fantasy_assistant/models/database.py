@@ -0,0 +1,159 @@
+"""
+Database connection management for the fantasy football draft assistant.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+
+class DatabaseManager:
+    """
+    Owns the SQLite connections used by the draft assistant.
+
+    Each thread gets one long-lived connection that is opened lazily and
+    reused for every query, so commands no longer pay connection setup on
+    every call. Connections run in autocommit mode; writes that must land
+    together go through ``transaction()``.
+    """
+
+    def __init__(self, db_path: str, cached_statements: int = 256,
+                 timeout: float = 5.0):
+        """
+        Initialize the manager without opening any connection.
+
+        Args:
+            db_path: Path to the SQLite database file (or ":memory:")
+            cached_statements: Size of sqlite3's per-connection prepared
+                statement cache
+            timeout: Seconds to wait on a locked database before failing
+        """
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._hooks: Optional[tuple] = None
+
+    @property
+    def is_memory(self) -> bool:
+        """Check if the database lives in memory (one database per connection)."""
+        return self.db_path == ":memory:" or self.db_path.startswith("file::memory:")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            isolation_level=None,  # Autocommit; transactions are explicit
+            check_same_thread=False,  # Only so close() can run from any thread
+            cached_statements=self.cached_statements,
+        )
+        if not self.is_memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL only fsyncs at checkpoints, not on every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+        if self._hooks is not None:
+            self._apply_hooks(conn, *self._hooks)
+        return conn
+
+    @staticmethod
+    def _apply_hooks(conn: sqlite3.Connection, trace: Optional[Callable[[str], None]],
+                     progress: Optional[Callable[[], int]], steps: int):
+        conn.set_trace_callback(trace)
+        conn.set_progress_handler(progress, steps)
+
+    def set_hooks(self, trace: Optional[Callable[[str], None]] = None,
+                  progress: Optional[Callable[[], int]] = None, steps: int = 1000):
+        """
+        Install (or, called without arguments, remove) instrumentation hooks
+        on every connection, including ones opened later.
+
+        Args:
+            trace: Called with the SQL of every statement executed
+            progress: Called every ``steps`` SQLite virtual machine
+                instructions; a truthy return aborts the statement
+            steps: Instructions between progress calls
+        """
+        self._hooks = None if trace is None and progress is None else (trace, progress, steps)
+        with self._lock:
+            connections = list(self._connections)
+        for conn in connections:
+            self._apply_hooks(conn, trace, progress, steps)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of statements as one transaction.
+
+        Nested scopes join the outermost transaction, which commits when it
+        exits cleanly and rolls back if an exception escapes. The write lock
+        is taken up front (BEGIN IMMEDIATE): a deferred transaction that
+        reads first fails at once with "database is locked" when another
+        connection commits before its first write, instead of waiting.
+
+        Yields:
+            This thread's connection
+        """
+        conn = self.connection
+        if self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        else:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("COMMIT")
+
+    @property
+    def in_transaction(self) -> bool:
+        """Check if this thread is inside a transaction scope."""
+        return getattr(self._local, 'depth', 0) > 0
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Execute a single statement on this thread's connection."""
+        return self.connection.execute(sql, params)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> sqlite3.Cursor:
+        """Execute a statement once per parameter set."""
+        return self.connection.executemany(sql, seq_of_params)
+
+    def executescript(self, script: str) -> sqlite3.Cursor:
+        """Execute a multi-statement SQL script."""
+        return self.connection.executescript(script)
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        """Execute a query and return its first row."""
+        return self.connection.execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Execute a query and return all rows."""
+        return self.connection.execute(sql, params).fetchall()
+
+    def close(self):
+        """Close every connection opened by this manager."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
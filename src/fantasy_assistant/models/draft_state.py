@@ -0,0 +1,447 @@
+"""In-memory draft state for the fantasy football draft assistant."""
+
+import atexit
+import itertools
+import json
+import queue
+import threading
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Optional, Sequence, Set
+
+from .database import DatabaseManager
+from .pick_schedule import PickSchedule
+from .roster import RosterEntry, UserRoster
+
+
+@dataclass
+class PickRecord:
+    """
+    A single pick made during the draft.
+
+    Attributes:
+        player_name: Player's full name
+        position: Player position
+        team: NFL team abbreviation
+        bye_week: Week number for team's bye
+        pick_number: Pick number within the round
+        round: Draft round
+        drafted_by_user: Whether the user made the pick
+        player_id: players.id of the player, when known
+    """
+
+    player_name: str
+    position: str
+    team: str
+    bye_week: Optional[int]
+    pick_number: int
+    round: int
+    drafted_by_user: bool = False
+    player_id: Optional[int] = None
+
+    def same_pick(self, other: 'PickRecord') -> bool:
+        """Check if two records are the same player taken at the same pick."""
+        return (self.player_id, self.player_name, self.round, self.pick_number) == \
+            (other.player_id, other.player_name, other.round, other.pick_number)
+
+
+class DraftState:
+    """
+    Authoritative in-memory state of a live draft.
+
+    Picks mutate the state in O(1) and are handed to a background writer
+    that appends them to ``drafted_players``/``user_roster`` and moves the
+    ``draft_state`` pointer. SQLite is the durable log: only a pick still
+    queued for the writer can be lost in a crash.
+
+    ``drafted_players`` is append-only: undoing a pick appends an ``undo``
+    event and redoing it appends the pick again, so undo/redo are O(1)
+    here and in the database. Every SNAPSHOT_INTERVAL events the current
+    picks and redo stack are saved to ``draft_snapshots``; loading restores
+    the latest snapshot and replays only the events after it.
+    """
+
+    SNAPSHOT_INTERVAL = 24
+
+    def __init__(self, db: DatabaseManager, league_size: int = 12,
+                 current_pick: int = 1, current_round: int = 1,
+                 user_draft_position: Optional[int] = None,
+                 async_writes: bool = True):
+        """
+        Initialize draft state.
+
+        Args:
+            db: Database manager used for persistence
+            league_size: Number of teams in the league
+            current_pick: Pick number within the current round
+            current_round: Current draft round
+            user_draft_position: User's draft slot (1-league_size)
+            async_writes: Persist picks on a background thread. Ignored for
+                in-memory databases, which are private to one connection.
+        """
+        self.db = db
+        self.league_size = league_size
+        self.current_pick = current_pick
+        self.current_round = current_round
+        self.user_draft_position = user_draft_position
+        self.schedule = PickSchedule(league_size, user_slot=user_draft_position)
+
+        self.picks: List[PickRecord] = []
+        self.drafted: Set[int] = set()  # players.id of every player on the board
+        self.team_rosters: Dict[int, List[PickRecord]] = {}
+        self.user_roster = UserRoster()
+        self.redo_stack: List[PickRecord] = []
+        self.version = 0  # Bumped on every change that can alter query results
+
+        self._async = async_writes and not db.is_memory
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._write_error: Optional[BaseException] = None
+        self._events_since_snapshot = 0
+
+    @classmethod
+    def load(cls, db: DatabaseManager, async_writes: bool = True) -> 'DraftState':
+        """
+        Rebuild draft state from the database.
+
+        Args:
+            db: Database manager to read from
+            async_writes: Persist new picks on a background thread
+
+        Returns:
+            DraftState reflecting every persisted pick and undo
+        """
+        row = db.fetchone("""
+            SELECT league_size, current_pick, current_round, user_draft_position
+            FROM draft_state
+        """)
+        if row:
+            state = cls(db, row[0] or 12, row[1], row[2], row[3], async_writes=async_writes)
+        else:
+            state = cls(db, async_writes=async_writes)
+
+        snapshot = db.fetchone("""
+            SELECT event_id, picks, redo FROM draft_snapshots ORDER BY event_id DESC LIMIT 1
+        """)
+        after = 0
+        if snapshot:
+            after = snapshot[0]
+            for values in json.loads(snapshot[1]):
+                state._apply(PickRecord(*values))
+            state.redo_stack = [PickRecord(*values) for values in json.loads(snapshot[2])]
+
+        tail = db.fetchall("""
+            SELECT d.event, d.player_name, d.position, d.team, p.bye_week, d.pick_number, d.round,
+                   d.drafted_by_user, d.player_id
+            FROM drafted_players d
+            LEFT JOIN players p ON p.id = d.player_id
+            WHERE d.id > ?
+            ORDER BY d.id
+        """, (after,))
+        for event, name, position, team, bye_week, pick_number, round_num, by_user, player_id in tail:
+            if event == 'undo':
+                state.redo_stack.append(state._revert())
+                continue
+            pick = PickRecord(name, position, team, bye_week, pick_number, round_num,
+                              bool(by_user), player_id)
+            if state.redo_stack and state.redo_stack[-1].same_pick(pick):
+                state.redo_stack.pop()
+            else:
+                state.redo_stack.clear()
+            state._apply(pick)
+        state._events_since_snapshot = len(tail)
+        return state
+
+    @property
+    def overall_pick(self) -> int:
+        """Get the overall pick number (1-based) currently on the clock."""
+        return self.schedule.overall_pick(self.current_round, self.current_pick)
+
+    @property
+    def on_the_clock(self) -> int:
+        """Get the draft slot that owns the current pick."""
+        return self.schedule.slot_for_pick(self.overall_pick)
+
+    def is_drafted(self, player_id: Optional[int]) -> bool:
+        """Check if a player (by players.id) has already been drafted."""
+        return player_id in self.drafted
+
+    def team_for_pick(self, pick_number: int, round_num: int) -> int:
+        """Get the draft slot that owns a pick."""
+        return self.schedule.slot_for_pick(self.schedule.overall_pick(round_num, pick_number))
+
+    def pointer(self) -> tuple:
+        """Get the persisted pointer columns as one immutable tuple."""
+        return (self.league_size, self.current_pick, self.current_round,
+                self.user_draft_position, self.schedule.direction(self.current_round))
+
+    def bump_version(self) -> int:
+        """Mark derived results (recommendations, best available) as stale."""
+        self.version += 1
+        return self.version
+
+    def reset_position(self, user_draft_position: int, league_size: int = 12):
+        """Move the pick pointer back to 1.01 and rebuild the pick schedule."""
+        self.bump_version()
+        self.league_size = league_size
+        self.user_draft_position = user_draft_position
+        self.schedule = PickSchedule(league_size, user_slot=user_draft_position)
+        self.current_pick = 1
+        self.current_round = 1
+        self.team_rosters = {}
+        for pick in self.picks:
+            self.team_rosters.setdefault(self.team_for_pick(pick.pick_number, pick.round),
+                                         []).append(pick)
+
+    def record_pick(self, player_name: str, position: str, team: str,
+                    bye_week: Optional[int], drafted_by_user: bool = False,
+                    player_id: Optional[int] = None) -> PickRecord:
+        """
+        Record a pick at the current pointer and advance to the next pick.
+
+        Args:
+            player_name: Player's full name
+            position: Player position
+            team: NFL team abbreviation
+            bye_week: Week number for team's bye
+            drafted_by_user: Whether the user made the pick
+            player_id: players.id of the player, when known
+
+        Returns:
+            The recorded pick
+        """
+        pick = PickRecord(player_name, position, team, bye_week,
+                          self.current_pick, self.current_round, drafted_by_user, player_id)
+        self.redo_stack.clear()
+        self._record(pick)
+        return pick
+
+    def _record(self, pick: PickRecord):
+        """Apply a pick at the current pointer, advance the pointer and persist it."""
+        self._apply(pick)
+        self.bump_version()
+
+        next_overall = self.overall_pick + 1
+        self.current_round = self.schedule.round_for_pick(next_overall)
+        self.current_pick = self.schedule.pick_in_round(next_overall)
+
+        self._persist('pick', pick, self.pointer())
+
+    def undo(self) -> Optional[PickRecord]:
+        """
+        Take back the latest pick and move the pointer back to it.
+
+        Returns:
+            The undone pick, or None when there is nothing to undo
+        """
+        if not self.picks:
+            return None
+        pick = self._revert()
+        self.redo_stack.append(pick)
+        self.current_round, self.current_pick = pick.round, pick.pick_number
+        self.bump_version()
+        self._persist('undo', pick, self.pointer())
+        return pick
+
+    def redo(self) -> Optional[PickRecord]:
+        """
+        Make the most recently undone pick again.
+
+        Returns:
+            The redone pick, or None when there is nothing to redo
+        """
+        if not self.redo_stack:
+            return None
+        pick = self.redo_stack.pop()
+        self.current_round, self.current_pick = pick.round, pick.pick_number
+        self._record(pick)
+        return pick
+
+    def record_picks(self, picks: Sequence[tuple]) -> List[PickRecord]:
+        """
+        Record a run of picks starting at the current pointer.
+
+        The picks and the final pointer are written synchronously in one
+        transaction before the in-memory state changes, so a failed write
+        leaves both untouched; the version is bumped once.
+
+        Args:
+            picks: (player_name, position, team, bye_week, drafted_by_user,
+                player_id) tuples in draft order
+
+        Returns:
+            The recorded picks
+        """
+        self.flush()  # Keep the durable log in pick order
+        start = self.overall_pick
+        records = [
+            PickRecord(name, position, team, bye_week, self.schedule.pick_in_round(overall),
+                       self.schedule.round_for_pick(overall), drafted_by_user, player_id)
+            for overall, (name, position, team, bye_week, drafted_by_user, player_id)
+            in enumerate(picks, start)
+        ]
+        if not records:
+            return records
+
+        end = start + len(records)
+        pointer = (self.league_size, self.schedule.pick_in_round(end), self.schedule.round_for_pick(end),
+                   self.user_draft_position, self.schedule.direction(self.schedule.round_for_pick(end)))
+        redo_stack, self.redo_stack = self.redo_stack, []
+        snapshot = self._snapshot(self.picks + records)
+        try:
+            self._write_batch([('pick', pick, pointer) for pick in records]
+                              + [('snapshot', snapshot, pointer)])
+        except BaseException:
+            self.redo_stack = redo_stack
+            raise
+
+        for pick in records:
+            self._apply(pick)
+        self.current_round, self.current_pick = pointer[2], pointer[1]
+        self._events_since_snapshot = 0
+        self.bump_version()
+        return records
+
+    def _apply(self, pick: PickRecord):
+        """Add a pick to the in-memory indexes."""
+        self.picks.append(pick)
+        if pick.player_id is not None:
+            self.drafted.add(pick.player_id)
+        slot = self.team_for_pick(pick.pick_number, pick.round)
+        self.team_rosters.setdefault(slot, []).append(pick)
+        if pick.drafted_by_user:
+            self.user_roster.add(RosterEntry(pick.player_name, pick.position, pick.team,
+                                             pick.bye_week, pick.round, pick.pick_number,
+                                             pick.player_id))
+
+    def _revert(self) -> PickRecord:
+        """Remove the latest pick from the in-memory indexes."""
+        pick = self.picks.pop()
+        self.drafted.discard(pick.player_id)
+        self.team_rosters[self.team_for_pick(pick.pick_number, pick.round)].pop()
+        if pick.drafted_by_user:
+            self.user_roster.remove_last()
+        return pick
+
+    def _snapshot(self, picks: List[PickRecord]) -> tuple:
+        """Serialize picks and the redo stack for draft_snapshots."""
+        return (json.dumps([astuple(pick) for pick in picks]),
+                json.dumps([astuple(pick) for pick in self.redo_stack]))
+
+    def _persist(self, event: str, pick: PickRecord, pointer: tuple):
+        """Hand an event and the pointer that follows it to the writer."""
+        items = [(event, pick, pointer)]
+        self._events_since_snapshot += 1
+        if self._events_since_snapshot >= self.SNAPSHOT_INTERVAL:
+            items.append(('snapshot', self._snapshot(self.picks), pointer))
+            self._events_since_snapshot = 0
+
+        if not self._async:
+            self._write_batch(items)
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop,
+                                            name="draft-state-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)  # Don't drop queued picks on a clean exit
+        for item in items:
+            self._queue.put(item)
+
+    def _write_loop(self):
+        """Drain queued picks and write each burst in one transaction."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            items = [item for item in batch if item is not None]
+            try:
+                if items:
+                    self._write_batch(items)
+            except BaseException as e:  # Surfaced by the next flush()
+                self._write_error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if len(items) != len(batch):  # Shutdown sentinel
+                return
+
+    def _write_batch(self, items: List[tuple]):
+        """Append (event, payload, pointer) items to the durable tables in order
+        and store the latest pointer."""
+        with self.db.transaction() as conn:
+            for event, group in itertools.groupby(items, key=lambda item: item[0]):
+                payloads = [payload for _, payload, _ in group]
+                if event == 'snapshot':
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO draft_snapshots (event_id, picks, redo)
+                        VALUES ((SELECT COALESCE(MAX(id), 0) FROM drafted_players), ?, ?)
+                    """, payloads[-1:])
+                    continue
+
+                conn.executemany("""
+                    INSERT INTO drafted_players (event, player_id, player_name, position, team, pick_number,
+                                                 round, drafted_by_user)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(event, p.player_id, p.player_name, p.position, p.team, p.pick_number, p.round,
+                       p.drafted_by_user) for p in payloads])
+                user_picks = [p for p in payloads if p.drafted_by_user]
+                if event == 'pick':
+                    conn.executemany("""
+                        INSERT INTO user_roster (player_id, player_name, position, team, bye_week,
+                                                 round_drafted, pick_number)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, [(p.player_id, p.player_name, p.position, p.team, p.bye_week, p.round,
+                           p.pick_number) for p in user_picks])
+                else:  # The roster table holds current state, not history
+                    conn.executemany("""
+                        DELETE FROM user_roster
+                        WHERE player_id IS ? AND round_drafted = ? AND pick_number = ?
+                    """, [(p.player_id, p.round, p.pick_number) for p in user_picks])
+            self._write_pointer(conn, items[-1][2])
+
+    @staticmethod
+    def _write_pointer(conn, params: tuple):
+        """Store a pick pointer in the single draft_state row."""
+        cursor = conn.execute("""
+            UPDATE draft_state
+            SET league_size = ?, current_pick = ?, current_round = ?, user_draft_position = ?,
+                snake_direction = ?
+        """, params)
+        if cursor.rowcount == 0:
+            conn.execute("""
+                INSERT INTO draft_state (league_size, current_pick, current_round, user_draft_position,
+                                         snake_direction)
+                VALUES (?, ?, ?, ?, ?)
+            """, params)
+
+    def save_pointer(self):
+        """Synchronously store the pick pointer after queued picks land."""
+        self.flush()
+        with self.db.transaction() as conn:
+            self._write_pointer(conn, self.pointer())
+
+    def flush(self):
+        """
+        Block until every queued pick is persisted.
+
+        Raises:
+            Exception: The first error the background writer hit
+        """
+        if self._writer is not None:
+            self._queue.join()
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def close(self):
+        """Flush queued picks and stop the background writer."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            atexit.unregister(self.close)
+        self.flush()
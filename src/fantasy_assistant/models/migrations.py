@@ -0,0 +1,155 @@
+"""Schema migrations for the fantasy football draft assistant database."""
+
+import sqlite3
+from typing import Callable, List, Tuple
+
+from .adp_stats import update_adp_stats
+from .database import DatabaseManager
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set:
+    """Get the column names of a table."""
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _player_upserts(conn: sqlite3.Connection):
+    """Track a content hash per player for incremental reloads, which match stored
+    players on name, position and team (two players may share a name)."""
+    columns = _columns(conn, 'players')
+    if 'content_hash' not in columns:
+        conn.execute("ALTER TABLE players ADD COLUMN content_hash TEXT")
+    if 'updated_at' not in columns:  # Minimal inline schema
+        conn.execute("ALTER TABLE players ADD COLUMN updated_at TIMESTAMP")
+    # Not unique: existing databases may already hold look-alike rows
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_players_identity ON players(name, position, team)")
+
+
+def _mock_draft_hashes(conn: sqlite3.Connection):
+    """Record the content hash of the file each mock draft source came from."""
+    # The minimal inline schema has no mock draft tables
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS mock_draft_sources (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_name TEXT NOT NULL,
+            date TEXT NOT NULL,
+            sample_size INTEGER,
+            confidence_level TEXT,
+            url TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS mock_draft_picks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_id INTEGER,
+            pick_number INTEGER,
+            player_name TEXT,
+            position TEXT,
+            team TEXT,
+            round INTEGER,
+            FOREIGN KEY (source_id) REFERENCES mock_draft_sources (id)
+        )
+    """)
+    if 'content_hash' not in _columns(conn, 'mock_draft_sources'):
+        conn.execute("ALTER TABLE mock_draft_sources ADD COLUMN content_hash TEXT")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_mock_draft_sources_hash
+        ON mock_draft_sources(content_hash)
+    """)
+
+
+def _adp_stats(conn: sqlite3.Connection):
+    """Materialize per-player ADP statistics, seeded from the picks already stored."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS adp_stats (
+            player_name TEXT NOT NULL,
+            source TEXT NOT NULL,
+            picks INTEGER NOT NULL,
+            mean REAL NOT NULL,
+            m2 REAL NOT NULL,
+            min_pick INTEGER,
+            max_pick INTEGER,
+            p10 REAL,
+            p50 REAL,
+            p90 REAL,
+            histogram TEXT NOT NULL,
+            PRIMARY KEY (player_name, source)
+        ) WITHOUT ROWID
+    """)
+    update_adp_stats(conn, conn.execute("""
+        SELECT s.source_name, p.player_name, p.pick_number
+        FROM mock_draft_picks p JOIN mock_draft_sources s ON s.id = p.source_id
+    """).fetchall())
+
+
+def _player_ids(conn: sqlite3.Connection):
+    """Reference players by integer id and index the injury join by it."""
+    for table in ('drafted_players', 'user_roster', 'injury_reports'):
+        if 'player_id' not in _columns(conn, table):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN player_id INTEGER REFERENCES players (id)")
+        conn.execute(f"""
+            UPDATE {table}
+            SET player_id = (SELECT id FROM players WHERE players.name = {table}.player_name)
+        """)
+
+    conn.execute("DROP INDEX IF EXISTS idx_injury_reports_player")  # Name join is gone
+    # The pool query joins injury reports by id; picks and roster are answered from memory
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_injury_reports_player_id ON injury_reports(player_id, status)")
+
+
+def _draft_events(conn: sqlite3.Connection):
+    """Make drafted_players an append-only pick/undo log with state snapshots."""
+    if 'event' not in _columns(conn, 'drafted_players'):
+        conn.execute("ALTER TABLE drafted_players ADD COLUMN event TEXT NOT NULL DEFAULT 'pick'")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS draft_snapshots (
+            event_id INTEGER PRIMARY KEY,
+            picks TEXT NOT NULL,
+            redo TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _metadata(conn: sqlite3.Connection):
+    """Key-value store for database-wide markers such as the pool snapshot token."""
+    conn.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+
+# (version, description, step), applied in order; never edit a released step
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "player content hashes and identity index", _player_upserts),
+    (2, "content hashes for mock draft sources", _mock_draft_hashes),
+    (3, "materialized ADP statistics", _adp_stats),
+    (4, "integer player ids", _player_ids),
+    (5, "draft event log and snapshots", _draft_events),
+    (6, "metadata table", _metadata),
+]
+
+
+def schema_version(db: DatabaseManager) -> int:
+    """Get the schema version recorded in the database (PRAGMA user_version)."""
+    return db.fetchone("PRAGMA user_version")[0]
+
+
+def migrate(db: DatabaseManager) -> List[int]:
+    """
+    Bring the database schema up to date.
+
+    Each pending migration runs in its own transaction together with the
+    user_version bump that records it.
+
+    Args:
+        db: Database manager to migrate
+
+    Returns:
+        Versions of the migrations that were applied
+    """
+    applied = []
+    for version, _, step in MIGRATIONS:
+        if version <= schema_version(db):
+            continue
+        with db.transaction() as conn:
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        applied.append(version)
+    return applied
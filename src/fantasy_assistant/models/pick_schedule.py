@@ -0,0 +1,111 @@
+"""Snake draft pick schedule for the fantasy football draft assistant."""
+
+from typing import Dict, List, Optional
+
+DEFAULT_ROUNDS = 16
+
+
+class PickSchedule:
+    """
+    Precomputed snake draft order.
+
+    Maps every overall pick (1-based) to the draft slot that owns it, its
+    round and its pick number within the round. For the user's slot it also
+    stores the next turn at or after every overall pick, so "picks until my
+    next turn" and "my remaining picks" are table lookups.
+    """
+
+    def __init__(self, league_size: int = 12, rounds: int = DEFAULT_ROUNDS,
+                 user_slot: Optional[int] = None):
+        """
+        Build the schedule.
+
+        Args:
+            league_size: Number of teams in the league
+            rounds: Number of draft rounds
+            user_slot: User's draft slot (1-league_size)
+        """
+        if league_size < 1 or rounds < 1:
+            raise ValueError(f"league_size and rounds must be positive, got {league_size}, {rounds}")
+        if user_slot is not None and not 1 <= user_slot <= league_size:
+            raise ValueError(f"user_slot must be between 1-{league_size}, got {user_slot}")
+
+        self.league_size = league_size
+        self.rounds = rounds
+        self.user_slot = user_slot
+        self.total_picks = league_size * rounds
+
+        # Index 0 is unused so overall pick numbers index directly
+        self._slots = [0] * (self.total_picks + 1)
+        self._team_picks: Dict[int, List[int]] = {slot: [] for slot in range(1, league_size + 1)}
+        for overall in range(1, self.total_picks + 1):
+            slot = self._compute_slot(overall)
+            self._slots[overall] = slot
+            self._team_picks[slot].append(overall)
+
+        # _next_turn[o] = index into the user's picks of their first turn at or after o
+        self._user_picks = self._team_picks.get(user_slot, [])
+        self._next_turn = [0] * (self.total_picks + 2)
+        turn = len(self._user_picks)
+        for overall in range(self.total_picks, 0, -1):
+            if turn and self._user_picks[turn - 1] == overall:
+                turn -= 1
+            self._next_turn[overall] = turn
+        self._next_turn[self.total_picks + 1] = len(self._user_picks)
+
+    def _compute_slot(self, overall: int) -> int:
+        """Work out the owner of a pick from snake order."""
+        round_index, index = divmod(overall - 1, self.league_size)
+        return index + 1 if round_index % 2 == 0 else self.league_size - index
+
+    def slot_for_pick(self, overall: int) -> int:
+        """Get the draft slot that owns an overall pick."""
+        if 1 <= overall <= self.total_picks:
+            return self._slots[overall]
+        return self._compute_slot(overall)
+
+    def round_for_pick(self, overall: int) -> int:
+        """Get the round an overall pick falls in."""
+        return (overall - 1) // self.league_size + 1
+
+    def pick_in_round(self, overall: int) -> int:
+        """Get the pick number within its round (1-league_size)."""
+        return (overall - 1) % self.league_size + 1
+
+    def overall_pick(self, round_num: int, pick_in_round: int) -> int:
+        """Get the overall pick number for a round and pick within it."""
+        return (round_num - 1) * self.league_size + pick_in_round
+
+    def direction(self, round_num: int) -> str:
+        """Get the snake direction of a round ('forward' or 'reverse')."""
+        return 'forward' if round_num % 2 == 1 else 'reverse'
+
+    def label(self, overall: int) -> str:
+        """Format an overall pick as round.pick (e.g. 3.04)."""
+        return f"{self.round_for_pick(overall)}.{self.pick_in_round(overall):02d}"
+
+    def team_picks(self, slot: int) -> List[int]:
+        """Get every overall pick owned by a draft slot."""
+        return list(self._team_picks.get(slot, []))
+
+    def next_user_pick(self, overall: int) -> Optional[int]:
+        """Get the user's first turn at or after an overall pick."""
+        turn = self._turn_index(overall)
+        return self._user_picks[turn] if turn < len(self._user_picks) else None
+
+    def picks_until_next_turn(self, overall: int) -> Optional[int]:
+        """Get how many picks come before the user's next turn (0 when on the clock)."""
+        pick = self.next_user_pick(overall)
+        return None if pick is None else pick - overall
+
+    def remaining_user_picks(self, overall: int) -> List[int]:
+        """Get the user's turns at or after an overall pick."""
+        return self._user_picks[self._turn_index(overall):]
+
+    def _turn_index(self, overall: int) -> int:
+        """Get the index of the user's first turn at or after an overall pick."""
+        if overall < 1:
+            return 0
+        if overall > self.total_picks:
+            return len(self._user_picks)
+        return self._next_turn[overall]
@@ -0,0 +1,408 @@
+"""Columnar player pool for the fantasy football draft assistant."""
+
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .player import InjuryStatus, Player, Position
+
+if TYPE_CHECKING:
+    from .pool_snapshot import PoolSnapshot
+
+POSITIONS = tuple(Position)
+INJURY_STATUSES = tuple(InjuryStatus)
+_POSITION_CODES = {position: code for code, position in enumerate(POSITIONS)}
+_INJURY_CODES = {status: code for code, status in enumerate(INJURY_STATUSES)}
+_OUT = _INJURY_CODES[InjuryStatus.OUT]
+_HEALTHY = _INJURY_CODES[InjuryStatus.HEALTHY]
+
+# Sort positions by name, as sorting Player.position.value does
+_POSITION_ORDER = np.argsort(np.argsort([p.value for p in POSITIONS])).astype(np.int8)
+
+# Stand-in for missing integer values; missing floats are NaN
+MISSING = -1
+
+# Rank used for players without one, matching `consensus_rank or 999`
+UNRANKED = 999
+
+
+class PlayerRow:
+    """
+    Read view of one player in a PlayerTable.
+
+    Has the same attributes, properties and methods as Player, reading each
+    field from the table's columns on access. Only ``is_drafted`` and
+    ``injury_status`` can be assigned; assignments write through to the
+    table so its vectorized filters see them.
+    """
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: 'PlayerTable', row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def id(self) -> Optional[int]:
+        value = int(self._table.ids[self._row])
+        return None if value == MISSING else value
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._row]
+
+    @property
+    def position(self) -> Position:
+        return POSITIONS[self._table.position_codes[self._row]]
+
+    @property
+    def team(self) -> str:
+        return self._table.teams[self._row]
+
+    @property
+    def bye_week(self) -> int:
+        return int(self._table.bye_weeks[self._row])
+
+    @property
+    def consensus_rank(self) -> Optional[int]:
+        value = int(self._table.ranks[self._row])
+        return None if value == MISSING else value
+
+    @property
+    def adp(self) -> Optional[float]:
+        return self._table._float(self._table.adps, self._row)
+
+    @property
+    def ppg_projection(self) -> Optional[float]:
+        return self._table._float(self._table.ppg_projections, self._row)
+
+    @property
+    def target_share(self) -> Optional[float]:
+        return self._table._float(self._table.target_shares, self._row)
+
+    @property
+    def receptions_2024(self) -> Optional[int]:
+        value = int(self._table.receptions_2024[self._row])
+        return None if value == MISSING else value
+
+    @property
+    def injury_status(self) -> InjuryStatus:
+        return INJURY_STATUSES[self._table.injury_codes[self._row]]
+
+    @injury_status.setter
+    def injury_status(self, status) -> None:
+        self._table.injury_codes[self._row] = _INJURY_CODES[InjuryStatus(status)]
+
+    @property
+    def notes(self) -> Optional[str]:
+        return self._table.notes[self._row]
+
+    @property
+    def handcuff(self) -> Optional[str]:
+        return self._table.handcuffs[self._row]
+
+    @property
+    def is_drafted(self) -> bool:
+        return bool(self._table.drafted[self._row])
+
+    @is_drafted.setter
+    def is_drafted(self, drafted: bool) -> None:
+        self._table.drafted[self._row] = drafted
+
+    # Derived properties and formatting are Player's own, read off this view
+    is_injured = Player.is_injured
+    is_available = Player.is_available
+    has_ppr_upside = Player.has_ppr_upside
+    bye_week_risk = Player.bye_week_risk
+    __str__ = Player.__str__
+    __repr__ = Player.__repr__
+    to_dict = Player.to_dict
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PlayerRow):
+            return self._table is other._table and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._row))
+
+    def to_player(self) -> Player:
+        """Copy this row out as a standalone Player."""
+        return Player.from_dict(self.to_dict())
+
+
+class PlayerTable:
+    """
+    Player pool stored column by column.
+
+    Numeric fields are NumPy arrays (missing values are NaN or MISSING),
+    position and injury status are small integer codes, and names and teams
+    are interned strings. Rows are exposed as PlayerRow views, so code
+    written against Player keeps working, while filters and sorts over the
+    whole pool run as array operations.
+    """
+
+    # Per-row columns: NumPy arrays, then Python lists
+    ARRAYS = ('ids', 'position_codes', 'injury_codes', 'bye_weeks', 'ranks', 'receptions_2024',
+              'adps', 'ppg_projections', 'target_shares', 'drafted')
+    LISTS = ('names', 'teams', 'notes', 'handcuffs')
+
+    def __init__(self, records: Iterable[Dict]):
+        """
+        Build the table.
+
+        Args:
+            records: Player dicts shaped like Player.to_dict (only name,
+                position, team and bye_week are required)
+        """
+        ids, names, teams, notes, handcuffs = [], [], [], [], []
+        positions, injuries, byes, ranks, receptions = [], [], [], [], []
+        adps, ppgs, shares, drafted = [], [], [], []
+
+        for record in records:
+            ids.append(self._int(record.get('id')))
+            names.append(sys.intern(record['name']))
+            positions.append(_POSITION_CODES[Position(record['position'])])
+            teams.append(sys.intern(record['team']))
+            byes.append(record['bye_week'])
+            ranks.append(self._int(record.get('consensus_rank')))
+            adps.append(record.get('adp'))
+            ppgs.append(record.get('ppg_projection'))
+            shares.append(record.get('target_share'))
+            receptions.append(self._int(record.get('receptions_2024')))
+            injuries.append(_INJURY_CODES[InjuryStatus(record.get('injury_status') or 'Healthy')])
+            notes.append(record.get('notes'))
+            handcuffs.append(record.get('handcuff'))
+            drafted.append(bool(record.get('is_drafted', False)))
+
+        self.ids = np.array(ids, dtype=np.int64)
+        self.names: List[str] = names
+        self.teams: List[str] = teams
+        self.notes: List[Optional[str]] = notes
+        self.handcuffs: List[Optional[str]] = handcuffs
+        self.position_codes = np.array(positions, dtype=np.int8)
+        self.injury_codes = np.array(injuries, dtype=np.int8)
+        self.bye_weeks = np.array(byes, dtype=np.int8)
+        self.ranks = np.array(ranks, dtype=np.int32)
+        self.receptions_2024 = np.array(receptions, dtype=np.int16)
+        self.adps = np.array(adps, dtype=np.float64)
+        self.ppg_projections = np.array(ppgs, dtype=np.float64)
+        self.target_shares = np.array(shares, dtype=np.float64)
+        self.drafted = np.array(drafted, dtype=bool)
+        self._finish()
+
+    def _finish(self) -> None:
+        """Validate the columns and build the name and id lookups."""
+        self._validate()
+        self._build_lookups()
+        self._views: List[Optional[PlayerRow]] = [None] * len(self.names)
+
+    def _build_lookups(self) -> None:
+        """Build the lowercased names and the name and id lookups."""
+        self.names_lower = np.array([name.lower() for name in self.names], dtype=np.str_)
+        self._rows: Dict[str, int] = {}
+        for row, name in enumerate(self.names):
+            self._rows.setdefault(name, row)
+        self._id_rows: Dict[int, int] = {int(player_id): row for row, player_id in enumerate(self.ids)
+                                         if player_id != MISSING}
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> 'PlayerTable':
+        """Build a table from Player objects."""
+        return cls(player.to_dict() for player in players)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: 'PoolSnapshot',
+                      is_drafted: Optional[Callable[[int], bool]] = None) -> 'PlayerTable':
+        """
+        Build a table over a mapped pool snapshot.
+
+        Numeric columns are views of the mapped file when every snapshot row
+        is a distinct player (extra injury report rows are dropped otherwise).
+
+        Args:
+            snapshot: Mapped player pool snapshot
+            is_drafted: Tells whether a player (by id) is already off the board
+        """
+        ids = snapshot.array('id')
+        first = np.sort(np.unique(ids, return_index=True)[1])
+        rows = slice(None) if first.size == ids.size else first
+        strings = snapshot.strings()
+
+        def codes(column: str, lookup: Dict, default: int) -> np.ndarray:
+            # Code per string-table entry, plus the default for missing values
+            table = np.array([lookup.get(value, MISSING) for value in strings] + [default], dtype=np.int8)
+            refs = snapshot.array(column)[rows]
+            result = table[np.minimum(refs, len(strings))]
+            if (result == MISSING).any():
+                bad = strings[refs[np.flatnonzero(result == MISSING)[0]]]
+                raise ValueError(f"Invalid {column} in pool snapshot: {bad!r}")
+            return result
+
+        def texts(column: str) -> List[Optional[str]]:
+            return [None if ref >= len(strings) else strings[ref] for ref in snapshot.array(column)[rows]]
+
+        table = cls.__new__(cls)
+        table.ids = ids[rows]
+        table.names = texts('name')
+        table.teams = texts('team')
+        table.notes = texts('notes')
+        table.handcuffs = [None] * len(table.names)
+        table.position_codes = codes('position', {p.value: code for p, code in _POSITION_CODES.items()},
+                                     MISSING)
+        table.injury_codes = codes('injury_status', {s.value: code for s, code in _INJURY_CODES.items()},
+                                   _HEALTHY)
+        table.bye_weeks = snapshot.array('bye_week')[rows].astype(np.int8)
+        table.ranks = snapshot.array('rank')[rows]
+        table.receptions_2024 = np.full(len(table.names), MISSING, dtype=np.int16)
+        table.adps = snapshot.array('adp')[rows]
+        table.ppg_projections = snapshot.array('ppg_projection')[rows]
+        table.target_shares = np.full(len(table.names), np.nan)
+        table.drafted = np.array([bool(is_drafted and is_drafted(int(player_id))) for player_id in table.ids],
+                                 dtype=bool)
+        table._finish()
+        return table
+
+    def apply_changes(self, records: Iterable[Dict], removed: Iterable[int] = ()) -> None:
+        """
+        Patch the table after a reload.
+
+        Updated players are rewritten in their rows, added ones appended and
+        removed ones dropped. Every other player keeps its row view (the same
+        PlayerRow object), renumbered if rows before it were dropped. Columns
+        mapped from a pool snapshot are copied, so the table no longer reads
+        the old file.
+
+        Args:
+            records: Player dicts (as for __init__, with ``id``) of the added
+                and updated players
+            removed: Ids of players that left the pool
+        """
+        patch = PlayerTable(records)
+        keep = np.ones(len(self), dtype=bool)
+        keep[[self._id_rows[player_id] for player_id in removed if player_id in self._id_rows]] = False
+        renumbered = np.cumsum(keep) - 1
+        targets = [self._id_rows.get(int(player_id)) for player_id in patch.ids]
+        updates = [(int(renumbered[row]), i) for i, row in enumerate(targets) if row is not None]
+        appended = [i for i, row in enumerate(targets) if row is None]
+        rows, sources = [row for row, _ in updates], [i for _, i in updates]
+
+        for name in self.ARRAYS:
+            column, values = getattr(self, name)[keep], getattr(patch, name)
+            column[rows] = values[sources]
+            setattr(self, name, np.concatenate([column, values[appended]]))
+        for name in self.LISTS:
+            column, values = getattr(self, name), getattr(patch, name)
+            column = [value for value, kept in zip(column, keep) if kept]
+            for row, i in updates:
+                column[row] = values[i]
+            setattr(self, name, column + [values[i] for i in appended])
+
+        views = [view for view, kept in zip(self._views, keep) if kept]
+        for row, view in enumerate(views):
+            if view is not None:
+                view._row = row
+        self._views = views + [None] * len(appended)
+        self._build_lookups()
+
+    @staticmethod
+    def _int(value) -> int:
+        return MISSING if value is None else int(value)
+
+    @staticmethod
+    def _float(column: np.ndarray, row: int) -> Optional[float]:
+        value = float(column[row])
+        return None if value != value else value  # NaN marks a missing value
+
+    def _validate(self) -> None:
+        """Apply Player's field checks to whole columns."""
+        bad = np.flatnonzero((self.bye_weeks < 1) | (self.bye_weeks > 18))
+        if bad.size:
+            raise ValueError(f"bye_week must be between 1-18, got {self.bye_weeks[bad[0]]}")
+        bad = np.flatnonzero((self.adps < 1) & (self.adps != 0))  # NaN compares False
+        if bad.size:
+            raise ValueError(f"adp must be positive, got {self.adps[bad[0]]}")
+        bad = np.flatnonzero((self.target_shares < 0) | (self.target_shares > 1))
+        if bad.size:
+            raise ValueError(f"target_share must be 0-1, got {self.target_shares[bad[0]]}")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, row: int) -> PlayerRow:
+        """Get the view of a row (the same object on every call)."""
+        view = self._views[row]
+        if view is None:
+            view = self._views[row] = PlayerRow(self, row)
+        return view
+
+    def __iter__(self) -> Iterator[PlayerRow]:
+        return (self[row] for row in range(len(self)))
+
+    def row_of(self, name: str) -> Optional[int]:
+        """Get the row of a player by exact name (the first, if the name is shared)."""
+        return self._rows.get(name)
+
+    def row_of_id(self, player_id: int) -> Optional[int]:
+        """Get the row of a player by players.id."""
+        return self._id_rows.get(player_id)
+
+    def mark_drafted(self, player_id: int, drafted: bool = True) -> None:
+        """Set a player's drafted flag by players.id."""
+        row = self._id_rows.get(player_id)
+        if row is not None:
+            self.drafted[row] = drafted
+
+    def position_mask(self, position: str) -> np.ndarray:
+        """Rows at a position (e.g. 'WR'); none for an unknown position."""
+        try:
+            code = _POSITION_CODES[Position(position.upper())]
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+        return self.position_codes == code
+
+    def available_mask(self) -> np.ndarray:
+        """Rows that are undrafted and not ruled out (Player.is_available)."""
+        return ~self.drafted & (self.injury_codes != _OUT)
+
+    def injured_mask(self) -> np.ndarray:
+        """Rows with any injury designation (Player.is_injured)."""
+        return self.injury_codes != _HEALTHY
+
+    def name_contains(self, text: str) -> np.ndarray:
+        """Rows whose lowercased name contains some lowercased text."""
+        if not len(self):
+            return np.zeros(0, dtype=bool)
+        return np.char.find(self.names_lower, text.lower()) >= 0
+
+    def sort_rows(self, rows: np.ndarray, sort_by: str = "rank") -> np.ndarray:
+        """
+        Order rows the way PlayerSearch has always sorted players.
+
+        Args:
+            rows: Row numbers to order
+            sort_by: "rank", "adp", "name" or "position" (position name,
+                then rank); anything else keeps the given order
+
+        Returns:
+            The rows in sorted order (ties keep their given order)
+        """
+        if sort_by == "rank":
+            keys = (self._rank_keys(rows),)
+        elif sort_by == "adp":
+            adps = self.adps[rows]
+            # `adp or 999`: missing and zero both sort as 999
+            keys = (np.where(np.isnan(adps) | (adps == 0), UNRANKED, adps),)
+        elif sort_by == "name":
+            keys = (np.array([self.names[row] for row in rows], dtype=np.str_),)
+        elif sort_by == "position":
+            keys = (self._rank_keys(rows), _POSITION_ORDER[self.position_codes[rows]])
+        else:
+            return rows
+        # lexsort is stable; the last key is the primary one
+        return rows[np.lexsort(keys)] if rows.size else rows
+
+    def _rank_keys(self, rows: np.ndarray) -> np.ndarray:
+        ranks = self.ranks[rows]
+        return np.where(ranks > 0, ranks, UNRANKED)
@@ -0,0 +1,214 @@
+"""
+Binary snapshot of the player pool for fast startup.
+
+The pool, as AvailabilityIndex reads it (players joined with injury
+reports, in rank order), is written to one file after each load:
+
+    header      magic, format version, player count, string count, pool token
+    directory   byte offset of every column and of the string table
+    columns     fixed-width little-endian arrays, one value per player
+    strings     uint32 offsets followed by the UTF-8 blob they index
+
+Text fields are stored as indexes into the string table. Opening a snapshot
+only maps the file; columns are zero-copy memoryviews (or NumPy views, for
+callers that already use NumPy) and strings are decoded on first use. The
+pool token, also stored in the database, tells a current snapshot from a
+stale one.
+"""
+
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import uuid
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .database import DatabaseManager
+
+MAGIC = b'FFPOOL\x00\x01'
+FORMAT_VERSION = 1
+NO_STRING = 0xFFFFFFFF
+MISSING = -1
+
+# (column, memoryview format); 'I' columns reference the string table
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('id', 'q'), ('bye_week', 'i'), ('rank', 'i'), ('adp', 'd'), ('ppg_projection', 'd'),
+    ('name', 'I'), ('position', 'I'), ('team', 'I'), ('injury_status', 'I'),
+    ('notes', 'I'), ('injury_report', 'I'),
+)
+_FORMATS = dict(COLUMNS)
+_HEADER = struct.Struct('<8sIII32s')
+_DIRECTORY = struct.Struct(f'<{len(COLUMNS) + 2}Q')
+
+
+def pool_token(db: DatabaseManager) -> Optional[str]:
+    """Get the token of the player pool currently in the database."""
+    row = db.fetchone("SELECT value FROM metadata WHERE key = 'pool_token'")
+    return row[0] if row else None
+
+
+def renew_pool_token(conn: sqlite3.Connection) -> str:
+    """Mark the player pool as changed (inside the transaction that changed it)."""
+    token = uuid.uuid4().hex
+    conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('pool_token', ?)", (token,))
+    return token
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_pool_snapshot(path: str, rows: Sequence[Dict], token: str) -> int:
+    """
+    Write a player pool snapshot, replacing any previous one atomically.
+
+    Args:
+        path: Snapshot file to write
+        rows: Player dicts in AvailabilityIndex shape plus ``id`` and
+            ``ppg_projection``, in rank order
+        token: Pool token recorded in the database for this pool
+
+    Returns:
+        Size of the snapshot in bytes
+    """
+    strings: Dict[str, int] = {}
+
+    def ref(value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        return strings.setdefault(value, len(strings))
+
+    sections = []
+    for column, fmt in COLUMNS:
+        if fmt == 'I':
+            values = [ref(row[column]) for row in rows]
+        elif fmt == 'd':
+            values = [float('nan') if row[column] is None else row[column] for row in rows]
+        else:
+            values = [MISSING if row[column] is None else row[column] for row in rows]
+        sections.append(struct.pack(f'<{len(values)}{fmt}', *values))
+
+    blob = b''.join(value.encode('utf-8') for value in strings)
+    offsets, position = [], 0
+    for value in strings:
+        offsets.append(position)
+        position += len(value.encode('utf-8'))
+    offsets.append(position)
+    sections.append(struct.pack(f'<{len(offsets)}I', *offsets))
+    sections.append(blob)
+
+    directory, offset = [], _align(_HEADER.size + _DIRECTORY.size)
+    for section in sections:
+        directory.append(offset)
+        offset = _align(offset + len(section))
+
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(rows), len(strings), token.encode('ascii')))
+        f.write(_DIRECTORY.pack(*directory))
+        for start, section in zip(directory, sections):
+            f.write(b'\0' * (start - f.tell()))
+            f.write(section)
+        size = f.tell()
+    os.replace(temporary, path)
+    return size
+
+
+class PoolSnapshot:
+    """Read-only, memory-mapped view of a player pool snapshot."""
+
+    def __init__(self, buffer: mmap.mmap):
+        magic, version, self.count, self.string_count, token = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a player pool snapshot")
+        self.token = token.rstrip(b'\0').decode('ascii')
+        self._buffer = buffer
+        self._directory = _DIRECTORY.unpack_from(buffer, _HEADER.size)
+        self._offsets = self._string_offsets()
+        self._strings: Optional[List[Optional[str]]] = None
+
+    @classmethod
+    def open(cls, path: str, token: Optional[str] = None) -> Optional['PoolSnapshot']:
+        """
+        Map a snapshot file.
+
+        Args:
+            path: Snapshot file
+            token: Expected pool token; a snapshot of another pool is ignored
+
+        Returns:
+            The snapshot, or None if it is missing, unreadable or stale
+        """
+        try:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            snapshot = cls(buffer)
+        except (OSError, ValueError, struct.error):
+            return None
+        if token is not None and snapshot.token != token:
+            return None
+        return snapshot
+
+    def _string_offsets(self) -> memoryview:
+        start = self._directory[-2]
+        return memoryview(self._buffer)[start:start + (self.string_count + 1) * 4].cast('I')
+
+    def close(self):
+        """
+        Unmap the snapshot file (a mapped file cannot be replaced on Windows).
+
+        Raises:
+            BufferError: A column view (memoryview or NumPy array) is still in
+                use; the snapshot stays mapped
+        """
+        if self._buffer.closed:
+            return
+        self._offsets.release()
+        try:
+            self._buffer.close()
+        except BufferError:
+            self._offsets = self._string_offsets()
+            raise
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, name: str) -> memoryview:
+        """Get a column as a zero-copy memoryview."""
+        index = [column for column, _ in COLUMNS].index(name)
+        start = self._directory[index]
+        fmt = _FORMATS[name]
+        return memoryview(self._buffer)[start:start + self.count * struct.calcsize(fmt)].cast(fmt)
+
+    def array(self, name: str):
+        """Get a column as a read-only NumPy view (imports NumPy on first use)."""
+        import numpy as np
+        return np.frombuffer(self.column(name), dtype=np.dtype(f'<{_FORMATS[name]}'))
+
+    def strings(self) -> List[Optional[str]]:
+        """Get the decoded string table (index NO_STRING is not included)."""
+        if self._strings is None:
+            blob = self._buffer[self._directory[-1]:]
+            offsets = self._offsets
+            self._strings = [sys.intern(blob[offsets[i]:offsets[i + 1]].decode('utf-8'))
+                             for i in range(self.string_count)]
+        return self._strings
+
+    def texts(self, name: str) -> List[Optional[str]]:
+        """Get a text column as Python strings (None for missing values)."""
+        strings = self.strings()
+        return [None if ref == NO_STRING else strings[ref] for ref in self.column(name)]
+
+    def rows(self) -> List[Dict]:
+        """Get every player as a dict with the columns of the snapshot."""
+        columns = {}
+        for name, fmt in COLUMNS:
+            if fmt == 'I':
+                columns[name] = self.texts(name)
+            elif fmt == 'd':
+                columns[name] = [None if value != value else value for value in self.column(name)]
+            else:
+                columns[name] = [None if value == MISSING else value for value in self.column(name)]
+        names = [name for name, _ in COLUMNS]
+        return [dict(zip(names, values)) for values in zip(*(columns[name] for name in names))]
@@ -0,0 +1,90 @@
+"""Roster model for the fantasy football draft assistant."""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class RosterEntry:
+    """
+    A single drafted player on a roster.
+
+    Attributes:
+        player_name: Player's full name
+        position: Player position (QB, RB, WR, TE, K, DEF)
+        team: NFL team abbreviation
+        bye_week: Week number for team's bye
+        round_drafted: Round the player was taken in
+        pick_number: Pick number within the round
+        player_id: players.id of the player, when known
+    """
+
+    player_name: str
+    position: str
+    team: str
+    bye_week: Optional[int]
+    round_drafted: int
+    pick_number: int
+    player_id: Optional[int] = None
+
+
+class UserRoster:
+    """
+    The user's drafted roster with position and bye week tallies.
+
+    Counts are maintained as players are added, so roster needs and bye
+    week conflicts never have to be recomputed from the database.
+    """
+
+    def __init__(self, entries: Optional[List[RosterEntry]] = None):
+        """
+        Initialize roster.
+
+        Args:
+            entries: Players already on the roster
+        """
+        self.entries: List[RosterEntry] = []
+        self._position_counts: Counter = Counter()
+        self._bye_counts: Counter = Counter()
+        for entry in entries or []:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: RosterEntry):
+        """Add a drafted player to the roster."""
+        self.entries.append(entry)
+        self._position_counts[entry.position] += 1
+        self._bye_counts[(entry.bye_week, entry.position)] += 1
+
+    def remove_last(self) -> RosterEntry:
+        """Take the most recently added player off the roster."""
+        entry = self.entries.pop()
+        self._position_counts[entry.position] -= 1
+        if not self._position_counts[entry.position]:
+            del self._position_counts[entry.position]
+        self._bye_counts[(entry.bye_week, entry.position)] -= 1
+        return entry
+
+    def position_counts(self) -> Dict[str, int]:
+        """Get number of rostered players at each position."""
+        return dict(self._position_counts)
+
+    def bye_week_stacks(self) -> List[tuple]:
+        """
+        Get (bye_week, position, count) for every bye week shared by
+        more than one player at the same position, ordered by week.
+        """
+        stacks = [
+            (bye_week, position, count)
+            for (bye_week, position), count in self._bye_counts.items()
+            if count > 1
+        ]
+        stacks.sort(key=lambda s: (s[0] is None, s[0] or 0, s[1]))
+        return stacks
+
+    def sorted_entries(self) -> List[RosterEntry]:
+        """Get roster entries ordered by round drafted, then position."""
+        return sorted(self.entries, key=lambda e: (e.round_drafted, e.position))
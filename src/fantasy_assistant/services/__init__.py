@@ -0,0 +1,18 @@
+"""Business logic services for the fantasy football draft assistant."""
+
+from importlib import import_module
+
+# Imported on first access (PEP 562); both services need NumPy
+_EXPORTS = {
+    "AIRecommender": ".ai_recommender",
+    "DraftSimulator": ".draft_simulator",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["AIRecommender", "DraftSimulator"]
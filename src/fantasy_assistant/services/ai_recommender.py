@@ -0,0 +1,168 @@
+"""
+Vectorized recommendation scoring for the fantasy football draft assistant.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+POSITIONS = ('QB', 'RB', 'WR', 'TE', 'K', 'DEF')
+_POSITION_CODES = {position: code for code, position in enumerate(POSITIONS)}
+_OTHER = len(POSITIONS)  # Code for positions outside POSITIONS
+FALLER_BONUS = 1.15  # Still on the board a standard deviation past mock draft ADP
+
+
+class AIRecommender:
+    """
+    Scores the whole available player pool in one NumPy pass.
+
+    Scores rank value, position need, round timing, injury and bye week
+    penalties and mock draft ADP value over column arrays instead of one player
+    dict at a time. The parts that do not depend on draft state are folded into
+    one static column when the pool is loaded.
+    """
+
+    def __init__(self, players: Sequence[Dict], drafted: Iterable[int] = (),
+                 adp_stats: Optional[Mapping] = None):
+        """
+        Build score columns for a player pool.
+
+        Args:
+            players: Player dicts in get_best_available shape, in rank order
+            drafted: Ids of players that are already off the board
+            adp_stats: Mock draft ADP statistics (with ``mean`` and ``sd``) by
+                player name, as returned by load_adp_stats
+        """
+        self.players = list(players)
+        self._rows = {player['id']: i for i, player in enumerate(self.players)}
+        self._adp_stats = adp_stats or {}
+        self._static, self._positions, self._falls_after = self._columns(self.players)
+        self._available = np.ones(len(self.players), dtype=bool)
+        for player_id in drafted:
+            self.mark_drafted(player_id)
+
+    def _columns(self, players: Sequence[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the static score, position code and falling-after pick of players."""
+        rank = np.array([player['rank'] or 0 for player in players], dtype=float)
+        bye = np.array([player['bye_week'] or 0 for player in players], dtype=int)
+        injured = np.array([player['injury_status'] != 'Healthy' for player in players], dtype=bool)
+        report = np.array([player['injury_report'] or '' for player in players], dtype=object)
+        positions = np.array([_POSITION_CODES.get(player['position'], _OTHER) for player in players],
+                             dtype=np.intp)
+
+        base = np.where(rank != 0, (200 - rank) / 10, 0.0)
+        injury_mult = np.select(
+            [injured & (report == 'Out'), injured & (report == 'Questionable')],
+            [0.2, 0.7], default=1.0,
+        )
+        bye_mult = np.select([bye == 8, bye == 14], [0.8, 0.9], default=1.0)
+
+        # Pick after which a player counts as falling; infinite without mock data
+        falls_after = np.array([
+            stats.mean + stats.sd if stats is not None else np.inf
+            for stats in (self._adp_stats.get(player['name']) for player in players)
+        ], dtype=float)
+        return base * injury_mult * bye_mult, positions, falls_after
+
+    def apply_changes(self, players: Sequence[Dict], changed: Iterable[int]):
+        """
+        Follow a reloaded pool, scoring only the players a reload changed.
+
+        Args:
+            players: The new pool in rank order (player dicts with ``id``)
+            changed: Ids of the added and updated players; players missing
+                from ``players`` are dropped
+        """
+        players = list(players)
+        changed = set(changed)
+        rows = np.array([-1 if player['id'] in changed else self._rows.get(player['id'], -1)
+                         for player in players], dtype=np.intp)
+        kept = rows >= 0
+        fresh = np.flatnonzero(~kept)
+
+        static = np.zeros(len(players))
+        positions = np.zeros(len(players), dtype=np.intp)
+        falls_after = np.zeros(len(players))
+        for column, old in ((static, self._static), (positions, self._positions),
+                            (falls_after, self._falls_after)):
+            column[kept] = old[rows[kept]]
+        if fresh.size:
+            columns = self._columns([players[row] for row in fresh])
+            for column, values in zip((static, positions, falls_after), columns):
+                column[fresh] = values
+
+        # Updated players keep their drafted flag; added ones start available
+        old_rows = [self._rows.get(player['id']) for player in players]
+        self._available = np.array([True if row is None else self._available[row] for row in old_rows],
+                                   dtype=bool)
+        self.players = players
+        self._rows = {player['id']: i for i, player in enumerate(players)}
+        self._static, self._positions, self._falls_after = static, positions, falls_after
+
+    def mark_drafted(self, player_id: int):
+        """Take a player out of consideration."""
+        row = self._rows.get(player_id)
+        if row is not None:
+            self._available[row] = False
+
+    def restore(self, player_id: int):
+        """Put a drafted player back into consideration."""
+        row = self._rows.get(player_id)
+        if row is not None:
+            self._available[row] = True
+
+    def scores(self, current_round: int, needs: Dict[str, int],
+               overall_pick: Optional[int] = None) -> np.ndarray:
+        """
+        Score every player in the pool, drafted or not.
+
+        Args:
+            current_round: Current draft round
+            needs: Remaining need per position
+            overall_pick: Current overall pick, to reward players falling past
+                their mock draft ADP
+
+        Returns:
+            Array of scores aligned with ``self.players``
+        """
+        need = np.array([needs.get(position, 0) for position in POSITIONS] + [0], dtype=float)
+        need_mult = np.where(need > 0, 1 + need * 0.5, 1.0)
+
+        round_mult = np.ones(len(POSITIONS) + 1)
+        if current_round < 6:
+            round_mult[_POSITION_CODES['QB']] = 0.3  # Penalize early QB
+        if current_round < 15:
+            round_mult[_POSITION_CODES['K']] = 0.1  # Heavily penalize early K/DEF
+            round_mult[_POSITION_CODES['DEF']] = 0.1
+
+        scores = self._static * need_mult[self._positions] * round_mult[self._positions]
+        if overall_pick is not None:
+            scores = scores * np.where(self._falls_after < overall_pick, FALLER_BONUS, 1.0)
+        return scores
+
+    def top(self, current_round: int, needs: Dict[str, int], k: int = 3,
+            overall_pick: Optional[int] = None) -> List[Tuple[Dict, float]]:
+        """
+        Get the k best-scoring available players.
+
+        Args:
+            current_round: Current draft round
+            needs: Remaining need per position
+            k: Number of players to return
+            overall_pick: Current overall pick (see ``scores``)
+
+        Returns:
+            (player, score) pairs with positive scores, best first. Ties keep
+            consensus rank order.
+        """
+        scores = self.scores(current_round, needs, overall_pick)
+        candidates = np.flatnonzero(self._available & (scores > 0))
+        if k <= 0 or candidates.size == 0:
+            return []
+
+        if candidates.size > k:
+            cutoff = np.partition(scores[candidates], -k)[-k]
+            candidates = candidates[scores[candidates] >= cutoff]
+
+        order = candidates[np.lexsort((candidates, -scores[candidates]))][:k]
+        return [(self.players[row], float(scores[row])) for row in order]
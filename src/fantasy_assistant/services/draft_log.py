@@ -0,0 +1,151 @@
+"""
+Draft log parsing for the fantasy football draft assistant.
+
+Reads pick logs (CSV, JSONL, or a JSON array such as a Sleeper
+``/draft/<id>/picks`` export) into DraftLogEntry records that the assistant
+replays in one transaction.
+"""
+
+import csv
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+
+_NAME_KEYS = ('player', 'name', 'player_name')
+_OVERALL_KEYS = ('overall', 'overall_pick', 'pick_no')
+_USER_KEYS = ('drafted_by_user', 'by_user', 'user', 'mine')
+_SLOT_KEYS = ('slot', 'draft_slot', 'team_slot')
+_TEAM_KEYS = ('team', 'tm', 'nfl_team')
+_POSITION_KEYS = ('position', 'pos')
+_TRUE = {'1', 'true', 'yes', 'y', 'x'}
+
+
+@dataclass
+class DraftLogEntry:
+    """
+    One pick read from a draft log.
+
+    Attributes:
+        player_name: Player's full name
+        overall_pick: Overall pick number (1-based), if the log has one
+        drafted_by_user: Whether the user made the pick, if the log says
+        slot: Draft slot that made the pick, if the log says
+        team: Player's NFL team, if the log says (tells apart players sharing a name)
+        position: Player's position, if the log says
+    """
+
+    player_name: str
+    overall_pick: Optional[int] = None
+    drafted_by_user: Optional[bool] = None
+    slot: Optional[int] = None
+    team: Optional[str] = None
+    position: Optional[str] = None
+
+
+@dataclass
+class DraftLogReport:
+    """
+    Outcome of a draft log import.
+
+    Attributes:
+        imported: Picks recorded
+        skipped: Log entries already on the board
+        seconds: Wall time of the import
+    """
+
+    imported: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Describe the import in one line."""
+        return (f"Imported {self.imported} picks ({self.skipped} already recorded) "
+                f"in {self.seconds * 1000:.1f}ms")
+
+
+def _first(record: Dict, keys) -> Optional[str]:
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _int(value) -> Optional[int]:
+    return None if value in (None, '') else int(value)
+
+
+def parse_entry(record: Dict, league_size: int = 12) -> DraftLogEntry:
+    """
+    Normalize one log record.
+
+    Accepts ``player``/``name`` columns or Sleeper's ``metadata`` first and
+    last names; ``overall``/``pick_no`` overall picks, or ``round`` plus an
+    in-round ``pick`` (a ``pick`` past the league size is taken as overall);
+    optional user flags, draft slots and the player's team and position
+    (also read from Sleeper's ``metadata``).
+
+    Args:
+        record: Log record with lowercased keys
+        league_size: Teams per round, to turn round picks into overall picks
+
+    Returns:
+        The normalized entry
+
+    Raises:
+        ValueError: If the record names no player
+    """
+    name = _first(record, _NAME_KEYS)
+    metadata = record.get('metadata') or {}
+    if name is None and metadata.get('last_name'):
+        name = f"{metadata.get('first_name', '')} {metadata['last_name']}".strip()
+    if name is None:
+        raise ValueError(f"Draft log record has no player: {record}")
+
+    overall = _int(_first(record, _OVERALL_KEYS))
+    if overall is None and record.get('pick') not in (None, ''):
+        overall = int(record['pick'])
+        if record.get('round') not in (None, '') and overall <= league_size:
+            overall += (int(record['round']) - 1) * league_size
+
+    user = _first(record, _USER_KEYS)
+    if isinstance(user, str):
+        user = user.strip().lower() in _TRUE
+    team = _first(record, _TEAM_KEYS) or metadata.get('team')
+    position = _first(record, _POSITION_KEYS) or metadata.get('position')
+    return DraftLogEntry(name.strip(), overall, None if user is None else bool(user),
+                         _int(_first(record, _SLOT_KEYS)), team and team.strip().upper(),
+                         position and position.strip().upper())
+
+
+def _records(path: str) -> Iterator[Dict]:
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline='', encoding='utf-8') as f:
+        if extension == '.csv':
+            for row in csv.DictReader(f):
+                yield {key.strip().replace(' ', '_'): value for key, value in row.items() if key}
+        elif extension == '.jsonl':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif extension == '.json':
+            data = json.load(f)
+            yield from data['picks'] if isinstance(data, dict) else data
+        else:
+            raise ValueError(f"Unsupported draft log format: {path} (use .csv, .jsonl or .json)")
+
+
+def iter_draft_log(path: str, league_size: int = 12) -> Iterator[DraftLogEntry]:
+    """
+    Stream the picks of a draft log file.
+
+    Args:
+        path: CSV, JSONL or JSON file
+        league_size: Teams per round in the logged draft
+
+    Yields:
+        DraftLogEntry per logged pick, in file order
+    """
+    for record in _records(path):
+        yield parse_entry({key.lower(): value for key, value in record.items()}, league_size)
@@ -0,0 +1,362 @@
+"""
+Live draft sync for the fantasy football draft assistant.
+
+DraftSync polls a pick feed (a Sleeper-style ``/draft/<id>/picks``
+endpoint, or the stand-in in pick_feed_server) and replays new picks onto
+the board through the assistant's import_draft_log, so other teams' picks
+no longer have to be typed in.
+
+Polling is kept cheap on both ends:
+
+- every request goes over one keep-alive connection, reopened only when
+  the server drops it, from one worker thread so the asyncio loop never
+  blocks on the network;
+- requests are conditional (``If-None-Match``; a 304 means nothing new)
+  and ask only for picks after the board's latest (``since``), with a
+  long-poll ``wait`` that servers without long polling ignore;
+- the poll interval adapts: back to the minimum as soon as picks arrive,
+  growing while the feed is quiet, and exponential with jitter after
+  errors. Long polls the server honoured are repeated at once.
+"""
+
+import asyncio
+import http.client
+import json
+import random
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .draft_log import DraftLogReport, parse_entry
+
+# Connection failures worth one retry on a fresh connection (the server may
+# have closed an idle keep-alive connection between polls)
+_STALE_CONNECTION = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                     ConnectionResetError, BrokenPipeError)
+
+
+class KeepAliveClient:
+    """
+    Blocking HTTP/1.1 GETs against one host over a reused connection.
+
+    Not thread-safe; DraftSync only calls it from its single worker thread.
+
+    Attributes:
+        connections_opened: TCP connections opened so far
+    """
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        """
+        Initialize the client without connecting.
+
+        Args:
+            url: Any URL on the host to talk to (http or https)
+            timeout: Socket timeout in seconds
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported feed URL: {url}")
+        self.scheme, self.netloc = parts.scheme, parts.netloc
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._aborted = False
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            factory = (http.client.HTTPSConnection if self.scheme == 'https'
+                       else http.client.HTTPConnection)
+            self._conn = factory(self.netloc, timeout=self.timeout)
+            self.connections_opened += 1
+        return self._conn
+
+    def get(self, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        GET a path (with query) on the host.
+
+        Returns:
+            (status, lowercased response headers, body)
+
+        Raises:
+            OSError, http.client.HTTPException: If the request fails
+        """
+        for attempt in range(2):
+            if self._aborted:
+                raise ConnectionAbortedError("pick feed client was aborted")
+            conn = self._connection()
+            try:
+                conn.request('GET', target, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION:
+                self.close()
+                if attempt:
+                    raise
+                continue
+            except BaseException:
+                self.close()
+                raise
+            if response.will_close:
+                self.close()
+            return (response.status, {name.lower(): value for name, value in response.getheaders()},
+                    body)
+
+    def abort(self):
+        """Break off a request in flight (from any thread) and refuse new ones."""
+        self._aborted = True
+        conn = self._conn
+        sock = conn.sock if conn is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def close(self):
+        """Close the connection; the next request opens a new one."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+@dataclass
+class Backoff:
+    """
+    Adaptive delay between polls.
+
+    Attributes:
+        min_interval: Delay after a poll that brought picks (seconds)
+        max_interval: Longest delay while the feed is quiet
+        growth: Factor the delay grows by per quiet poll
+        max_error_delay: Longest delay after consecutive errors
+    """
+
+    min_interval: float = 0.5
+    max_interval: float = 5.0
+    growth: float = 1.5
+    max_error_delay: float = 30.0
+    interval: float = 0.0
+    errors: int = 0
+
+    def __post_init__(self):
+        self.interval = self.min_interval
+
+    def on_picks(self) -> float:
+        """Get the delay after a poll that brought picks."""
+        self.errors = 0
+        self.interval = self.min_interval
+        return self.interval
+
+    def on_idle(self) -> float:
+        """Get the delay after a poll that brought nothing."""
+        self.errors = 0
+        self.interval = min(self.max_interval, self.interval * self.growth)
+        return self.interval
+
+    def on_error(self) -> float:
+        """Get the delay after a failed poll: doubling per error, with jitter."""
+        self.errors += 1
+        delay = min(self.max_error_delay, self.min_interval * 2 ** self.errors)
+        return random.uniform(delay / 2, delay)
+
+
+@dataclass
+class SyncStats:
+    """
+    Counters of one sync session.
+
+    Attributes:
+        polls: Requests made
+        not_modified: Polls answered 304 (or with no new picks)
+        picks: Picks applied to the board
+        errors: Failed polls
+        last_error: Description of the latest failure
+        connections: TCP connections opened
+    """
+
+    polls: int = 0
+    not_modified: int = 0
+    picks: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+    connections: int = 0
+
+    def summary(self) -> str:
+        """Describe the session in one line."""
+        text = (f"{self.picks} picks synced over {self.polls} polls "
+                f"({self.not_modified} unchanged, {self.errors} errors) "
+                f"on {self.connections} connection(s)")
+        return text + (f"; last error: {self.last_error}" if self.last_error else "")
+
+
+class DraftSync:
+    """
+    Keeps an assistant's board in step with a pick feed.
+
+    Run ``await sync.run()`` in an event loop, or ``start()`` it on a
+    background thread next to the interactive prompt.
+    """
+
+    def __init__(self, assistant, url: str, wait: float = 10.0,
+                 backoff: Optional[Backoff] = None, timeout: float = 30.0,
+                 on_picks: Optional[Callable[[DraftLogReport], None]] = None):
+        """
+        Initialize the sync without polling yet.
+
+        Args:
+            assistant: FantasyDraftAssistant whose board picks are applied to
+            url: Pick feed URL
+            wait: Long-poll seconds to ask the server for (0 for plain polls)
+            backoff: Poll interval policy (defaults to Backoff())
+            timeout: Socket timeout in seconds; raised to cover ``wait``
+            on_picks: Called with the import report after picks are applied
+        """
+        parts = urlsplit(url)
+        self.assistant = assistant
+        self.url = url
+        self.wait = wait
+        self.backoff = backoff or Backoff()
+        self.on_picks = on_picks
+        self.stats = SyncStats()
+        self.client = KeepAliveClient(url, max(timeout, wait + 5))
+        self._path = parts.path or '/'
+        self._query = parts.query
+        self._etag: Optional[Tuple[int, str]] = None  # (since, ETag) of the last full answer
+        self._long_poll = False
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="draft-sync")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._stop_requested = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def draft_complete(self) -> bool:
+        """Check if every pick of the draft is on the board."""
+        state = self.assistant.state
+        return state.overall_pick > state.schedule.total_picks
+
+    @property
+    def running(self) -> bool:
+        """Check if the sync loop is running."""
+        return self._stop is not None and not self._stop.is_set()
+
+    def _fetch(self) -> Tuple[int, Dict[str, str], bytes]:
+        since = self.assistant.state.overall_pick - 1
+        params = {'since': since}
+        if self.wait:
+            params['wait'] = f"{self.wait:g}"
+        target = f"{self._path}?{'&'.join(filter(None, (self._query, urlencode(params))))}"
+        headers = {'Accept': 'application/json'}
+        # The ETag only stands for "nothing new" while the board is where it left it (no undo)
+        if self._etag is not None and self._etag[0] == since:
+            headers['If-None-Match'] = self._etag[1]
+        try:
+            return self.client.get(target, headers)
+        finally:
+            self.stats.connections = self.client.connections_opened
+
+    def _apply(self, body: bytes) -> DraftLogReport:
+        data = json.loads(body)
+        records = data['picks'] if isinstance(data, dict) else data
+        league_size = self.assistant.state.league_size
+        entries = [parse_entry({key.lower(): value for key, value in record.items()}, league_size)
+                   for record in records]
+        # Feeds without ``since`` support send the whole draft; keep only what is new
+        current = self.assistant.state.overall_pick
+        entries = [entry for entry in entries
+                   if entry.overall_pick is None or entry.overall_pick >= current]
+        if not entries:
+            return DraftLogReport()
+        return self.assistant.import_draft_log(entries)
+
+    def _poll(self) -> int:
+        status, headers, body = self._fetch()
+        self.stats.polls += 1
+        self._long_poll = bool(self.wait) and 'x-long-poll' in headers
+        if status == 304:
+            self.stats.not_modified += 1
+            return 0
+        if status != 200:
+            raise http.client.HTTPException(f"pick feed answered HTTP {status}")
+        report = self._apply(body)
+        etag = headers.get('etag')
+        self._etag = (self.assistant.state.overall_pick - 1, etag) if etag else None
+        if not report.imported:
+            self.stats.not_modified += 1
+            return 0
+        self.stats.picks += report.imported
+        if self.on_picks is not None:
+            self.on_picks(report)
+        return report.imported
+
+    async def poll_once(self) -> int:
+        """
+        Fetch the feed once and apply any new picks.
+
+        Returns:
+            Number of picks applied
+
+        Raises:
+            OSError, http.client.HTTPException: If the request fails
+            ValueError: If the feed is malformed or its picks do not fit the board
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._worker, self._poll)
+
+    async def run(self):
+        """Poll until the draft is complete or stop() is called."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        stopped = asyncio.ensure_future(self._stop.wait())
+        poll = None
+        try:
+            while not (self._stop_requested or self._stop.is_set() or self.draft_complete):
+                poll = asyncio.ensure_future(self.poll_once())
+                await asyncio.wait((poll, stopped), return_when=asyncio.FIRST_COMPLETED)
+                if not poll.done():
+                    break
+                try:
+                    picks = poll.result()
+                except (OSError, ValueError, http.client.HTTPException) as e:
+                    self.stats.errors += 1
+                    self.stats.last_error = str(e) or type(e).__name__
+                    delay = self.backoff.on_error()
+                else:
+                    if picks:
+                        delay = self.backoff.on_picks()
+                    elif self._long_poll:
+                        delay = 0.0
+                    else:
+                        delay = self.backoff.on_idle()
+                if delay:
+                    await asyncio.wait((stopped,), timeout=delay)
+        finally:
+            self._stop.set()
+            stopped.cancel()
+            if poll is not None and not poll.done():
+                # Break off the long poll so the worker thread is free to exit
+                self.client.abort()
+                poll.add_done_callback(lambda future: future.cancelled() or future.exception())
+            self._worker.submit(self.client.close)
+            self._worker.shutdown(wait=False)
+
+    def start(self) -> threading.Thread:
+        """Run the sync loop on a daemon thread."""
+        self._thread = threading.Thread(target=asyncio.run, args=(self.run(),),
+                                        name="draft-sync-loop", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the sync loop, breaking off a long poll in flight, and wait for it."""
+        self._stop_requested = True
+        if self._loop is not None and self._stop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._stop.set)
+            except RuntimeError:  # Loop already closed
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
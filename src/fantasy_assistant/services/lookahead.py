@@ -0,0 +1,222 @@
+"""
+Multi-pick lookahead planning for the fantasy football draft assistant.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+STARTERS = {'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1}
+FLEX_POSITIONS = ('RB', 'WR', 'TE')
+
+
+def lineup_points(values: Dict[str, Sequence[float]], starters: Dict[str, int] = STARTERS,
+                  flex: int = 1, bench_weight: float = 0.1) -> float:
+    """
+    Score a roster by its best starting lineup.
+
+    Args:
+        values: Projected points per game of rostered players by position
+        starters: Starting slots per position
+        flex: Number of RB/WR/TE flex slots
+        bench_weight: Credit given to bench points (bye and injury cover)
+
+    Returns:
+        Starting lineup points plus weighted bench points
+    """
+    total = 0.0
+    flex_pool, bench = [], []
+    for position, position_values in values.items():
+        ordered = sorted(position_values, reverse=True)
+        count = starters.get(position, 0)
+        total += sum(ordered[:count])
+        (flex_pool if position in FLEX_POSITIONS else bench).extend(ordered[count:])
+    flex_pool.sort(reverse=True)
+    total += sum(flex_pool[:flex])
+    bench.extend(flex_pool[flex:])
+    return total + bench_weight * sum(bench)
+
+
+@dataclass
+class PlanStep:
+    """
+    One pick in a lookahead plan.
+
+    Attributes:
+        pick: Overall pick number of the user's turn
+        label: Pick as round.pick (e.g. 3.04)
+        position: Position to take at this turn
+        player: Most likely best player at that position when the turn comes
+        availability: Chance that player is still on the board
+        expected_ppg: Expected points per game of the best available player
+            at the position at this turn
+    """
+
+    pick: int
+    label: str
+    position: str
+    player: Optional[Dict]
+    availability: float
+    expected_ppg: float
+
+
+class _OutOfTime(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class LookaheadPlanner:
+    """
+    Plans positions for the user's next several picks.
+
+    Searches over which position to take at each upcoming turn and maximizes
+    the expected starting lineup points of the resulting roster. The value of
+    taking a position at a turn is the expected best projection among players
+    at that position still available then, using per-turn availability
+    probabilities (e.g. from DraftSimulator). Roster states reached along
+    different paths share memoized subproblems, and the search deepens one
+    turn at a time until the horizon or the time budget is reached.
+    """
+
+    def __init__(self, players: Sequence[Dict], projections: Dict[int, float],
+                 availability: np.ndarray, turns: Sequence[int], labels: Sequence[str],
+                 roster_values: Optional[Dict[str, List[float]]] = None,
+                 candidates_per_position: int = 25):
+        """
+        Initialize planner.
+
+        Args:
+            players: Available player dicts (get_best_available shape)
+            projections: Projected points per game by player id
+            availability: Array (players x turns) of availability probabilities
+            turns: Overall pick numbers of the user's upcoming turns
+            labels: Display label of each turn
+            roster_values: Projections of players already on the roster by position
+            candidates_per_position: Top projected players considered per position
+        """
+        self.turns = list(turns)
+        self.labels = list(labels)
+        self.availability = availability
+        self.players = list(players)
+        self.projections = projections
+        self.positions = tuple(STARTERS)
+
+        self._candidates: Dict[str, List[int]] = {}
+        for position in self.positions:
+            rows = [i for i, player in enumerate(self.players)
+                    if player['position'] == position and projections.get(player['id'])]
+            rows.sort(key=lambda i: projections[self.players[i]['id']], reverse=True)
+            self._candidates[position] = rows[:candidates_per_position]
+
+        roster_values = roster_values or {}
+        self._initial = tuple(tuple(sorted(roster_values.get(p, ()), reverse=True))
+                              for p in self.positions)
+        self._options: Dict[Tuple[str, int, int], Optional[Tuple[float, int, float]]] = {}
+        self._memo: Dict[tuple, Tuple[float, tuple]] = {}
+        self._deadline = float('inf')
+
+    def _expected_best(self, position: str, turn: int, taken: int) -> Optional[Tuple[float, int, float]]:
+        """
+        Expected best projection at a position at one of the user's turns.
+
+        The plan's own earlier picks at the position are assumed to have used
+        the top ``taken`` projected players.
+
+        Returns:
+            (expected ppg, row of the most likely best player, its availability),
+            or None if nobody is left at the position
+        """
+        key = (position, turn, taken)
+        if key not in self._options:
+            expected, none_left = 0.0, 1.0
+            likely, likely_chance = None, 0.0
+            for row in self._candidates[position][taken:]:
+                chance = float(self.availability[row, turn])
+                is_best = none_left * chance
+                expected += is_best * self.projections[self.players[row]['id']]
+                if is_best > likely_chance:
+                    likely, likely_chance = row, is_best
+                none_left *= 1 - chance
+            self._options[key] = (expected, likely, float(self.availability[likely, turn])) \
+                if likely is not None else None
+        return self._options[key]
+
+    def _solve(self, turn: int, horizon: int, state: tuple) -> Tuple[float, tuple]:
+        """Best (lineup points, steps) from a turn onward for a roster state."""
+        if turn == horizon:
+            return lineup_points(dict(zip(self.positions, state))), ()
+        key = (turn, horizon, state)
+        if key in self._memo:
+            return self._memo[key]
+        if time.perf_counter() > self._deadline:
+            raise _OutOfTime()
+
+        best = (float('-inf'), ())
+        for i, position in enumerate(self.positions):
+            taken = len(state[i]) - len(self._initial[i])
+            option = self._expected_best(position, turn, taken)
+            if option is None:
+                continue
+            values = tuple(sorted(state[i] + (round(option[0], 3),), reverse=True))
+            value, steps = self._solve(turn + 1, horizon, state[:i] + (values,) + state[i + 1:])
+            if value > best[0]:
+                best = (value, ((position,) + option,) + steps)
+
+        if not best[1]:  # Board is empty by this turn; the plan ends here
+            best = (lineup_points(dict(zip(self.positions, state))), ())
+        self._memo[key] = best
+        return best
+
+    def plan(self, horizon: int = 3, time_budget: float = 0.5) -> Dict:
+        """
+        Plan positions for the user's upcoming turns.
+
+        Args:
+            horizon: Maximum number of turns to plan
+            time_budget: Seconds to spend before returning the deepest
+                completed plan
+
+        Returns:
+            Dict with the plan steps, expected lineup points, the horizon
+            actually searched and a one-line summary
+        """
+        self._deadline = time.perf_counter() + time_budget
+        horizon = min(horizon, len(self.turns))
+        result, searched = (lineup_points(dict(zip(self.positions, self._initial))), ()), 0
+
+        for depth in range(1, horizon + 1):
+            try:
+                result, searched = self._solve(0, depth, self._initial), depth
+            except _OutOfTime:
+                break
+
+        steps = []
+        for turn, (position, expected, row, chance) in enumerate(result[1]):
+            steps.append(PlanStep(
+                pick=self.turns[turn],
+                label=self.labels[turn],
+                position=position,
+                player=dict(self.players[row]),
+                availability=chance,
+                expected_ppg=expected,
+            ))
+
+        return {
+            'steps': steps,
+            'expected_lineup_points': result[0],
+            'horizon': searched,
+            'summary': self.summarize(steps),
+        }
+
+    @staticmethod
+    def summarize(steps: List[PlanStep]) -> str:
+        """Describe a plan in one line (e.g. "WR now, RB likely available at 3.04")."""
+        parts = []
+        for i, step in enumerate(steps):
+            if i == 0 and step.availability >= 0.999:
+                parts.append(f"{step.position} now ({step.player['name']})")
+            else:
+                parts.append(f"{step.position} likely available at {step.label} "
+                             f"({step.player['name']}, {step.availability:.0%})")
+        return ", ".join(parts)
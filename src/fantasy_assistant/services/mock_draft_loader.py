@@ -0,0 +1,301 @@
+"""
+Mock draft ingestion for the fantasy football draft assistant.
+
+Parses mock draft write-ups (numbered pick lists such as ``mock_drafts/*.md``
+and comparison tables with one column per draft) into
+``mock_draft_sources``/``mock_draft_picks`` rows. Files flow through a
+generator pipeline and picks are inserted in batches, so thousands of
+files load in one pass; files already ingested are recognized by content
+hash and skipped. The adp_stats table is updated with every batch.
+"""
+
+import glob
+import hashlib
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models.adp_stats import OVERALL, update_adp_stats
+from ..models.database import DatabaseManager
+
+TEAM_ABBREVIATIONS = {
+    'cardinals': 'ARI', 'falcons': 'ATL', 'ravens': 'BAL', 'bills': 'BUF',
+    'panthers': 'CAR', 'bears': 'CHI', 'bengals': 'CIN', 'browns': 'CLE',
+    'cowboys': 'DAL', 'broncos': 'DEN', 'lions': 'DET', 'packers': 'GB',
+    'texans': 'HOU', 'colts': 'IND', 'jaguars': 'JAX', 'chiefs': 'KC',
+    'raiders': 'LV', 'chargers': 'LAC', 'rams': 'LAR', 'dolphins': 'MIA',
+    'vikings': 'MIN', 'patriots': 'NE', 'saints': 'NO', 'giants': 'NYG',
+    'jets': 'NYJ', 'eagles': 'PHI', 'steelers': 'PIT', '49ers': 'SF',
+    'seahawks': 'SEA', 'buccaneers': 'TB', 'titans': 'TEN', 'commanders': 'WAS',
+}
+
+ROUND_WORDS = {'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5, 'sixth': 6,
+               'seventh': 7, 'eighth': 8, 'ninth': 9, 'tenth': 10}
+
+# "Ja'Marr Chase (WR, Bengals)", optionally bold and followed by notes
+_PICK = re.compile(r"^\**\s*(?P<name>[^*(\[]+?)\s*\**\s*\((?P<position>QB|RB|WR|TE|K|DEF|DST),\s*"
+                   r"(?P<team>[^)]+)\)")
+_NUMBERED = re.compile(r"^(\d+)\.\s+(.*)$")
+_ROUND = re.compile(r"\bround\s+(\d+)\b|\b(" + "|".join(ROUND_WORDS) + r")\s+round\b", re.I)
+_DATE = re.compile(r"((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+"
+                   r"(?:\d{1,2}(?:-\d{1,2})?,\s*)?\d{4})", re.I)
+
+
+@dataclass
+class MockPick:
+    """One pick of a mock draft (overall pick number, 1-based)."""
+
+    pick_number: int
+    round: int
+    player_name: str
+    position: str
+    team: str
+
+
+@dataclass
+class MockDraft:
+    """Picks of one mock draft, as read from a file."""
+
+    source_name: str
+    date: str = ""
+    picks: List[MockPick] = field(default_factory=list)
+
+
+@dataclass
+class IngestReport:
+    """
+    Outcome of a mock draft ingestion run.
+
+    Attributes:
+        files: Files read
+        skipped: Files already ingested (same content hash)
+        sources: Mock drafts added to mock_draft_sources
+        picks: Picks added to mock_draft_picks
+        seconds: Wall time of the run
+    """
+
+    files: int = 0
+    skipped: int = 0
+    sources: int = 0
+    picks: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        """Describe the run in one line."""
+        files = (f" in {self.files - self.skipped} new file(s) ({self.skipped} unchanged)"
+                 if self.files else "")
+        return (f"Ingested {self.picks:,} picks from {self.sources} mock draft(s){files} "
+                f"in {self.seconds:.2f}s")
+
+
+def _team(team: str) -> str:
+    """Abbreviate a team nickname ("Bengals" -> "CIN"); abbreviations pass through."""
+    team = team.strip()
+    return TEAM_ABBREVIATIONS.get(team.lower(), team.upper() if len(team) <= 3 else team)
+
+
+def _parse_pick(text: str) -> Optional[Tuple[str, str, str]]:
+    """Get (name, position, team) from pick text, or None for placeholders and notes."""
+    match = _PICK.match(text.strip().lstrip('*').strip())
+    if not match:
+        return None
+    position = 'DEF' if match['position'] == 'DST' else match['position']
+    return match['name'].strip(), position, _team(match['team'])
+
+
+def _round_of(heading: str) -> Optional[int]:
+    """Get the round a heading announces ("First Round", "Round 2")."""
+    match = _ROUND.search(heading)
+    if not match:
+        return None
+    return int(match[1]) if match[1] else ROUND_WORDS[match[2].lower()]
+
+
+def parse_mock_draft(lines: Iterable[str], default_name: str, league_size: int = 12) -> List[MockDraft]:
+    """
+    Parse the mock drafts described in a Markdown write-up.
+
+    Numbered pick lists belong to the file's own draft, named after its
+    title, unless a heading names one of the file's table drafts. Tables
+    with a "Pick" column contribute one draft per column of picks. List
+    numbers up to the league size are picks within the heading's round;
+    larger numbers are overall picks.
+
+    Args:
+        lines: Lines of the file
+        default_name: Draft name when the file has no title
+        league_size: Teams per round, to turn round picks into overall picks
+
+    Returns:
+        Drafts with at least one pick
+    """
+    main = MockDraft(default_name)
+    tables: Dict[str, MockDraft] = {}
+    target, current_round = main, 1
+    headers: Optional[List[str]] = None
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith('#'):
+            heading = line.lstrip('#').strip().strip('*').strip()
+            if line.startswith('# '):
+                main.source_name = re.sub(r'\s*mock draft.*$', '', heading, flags=re.I) or heading
+            current_round = _round_of(heading) or current_round
+            target = next((d for name, d in tables.items() if name.lower() in heading.lower()), main)
+            headers = None
+            continue
+        if line.startswith('*') and not main.date and 'source' in line.lower():
+            date = _DATE.search(line)
+            main.date = date[1] if date else ''
+            continue
+
+        if line.startswith('|'):
+            cells = [cell.strip() for cell in line.strip('|').split('|')]
+            if headers is None:
+                headers = cells
+                continue
+            if all(set(cell) <= set('-: ') for cell in cells) or headers[0].lower() != 'pick':
+                continue
+            try:
+                overall = int(cells[0])
+            except ValueError:
+                continue
+            for header, cell in zip(headers[1:], cells[1:]):
+                pick = _parse_pick(cell)
+                if pick:
+                    name = re.sub(r'\s*\(.*\)', '', header).strip()
+                    draft = tables.setdefault(name, MockDraft(name, main.date))
+                    draft.picks.append(MockPick(overall, (overall - 1) // league_size + 1, *pick))
+            continue
+        headers = None
+
+        numbered = _NUMBERED.match(line)
+        if numbered:
+            pick = _parse_pick(numbered[2])
+            if pick:
+                number = int(numbered[1])
+                overall = number if number > league_size else (current_round - 1) * league_size + number
+                target.picks.append(MockPick(overall, (overall - 1) // league_size + 1, *pick))
+
+    return [draft for draft in [main, *tables.values()] if draft.picks]
+
+
+def iter_mock_files(paths: Iterable[str]) -> Iterator[str]:
+    """Expand files, directories (their *.md files) and glob patterns, in order."""
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(glob.glob(os.path.join(path, '*.md')))
+        elif any(char in path for char in '*?['):
+            yield from sorted(glob.glob(path))
+        else:
+            yield path
+
+
+class _DraftWriter:
+    """Inserts mock drafts and their picks, buffering picks into batches."""
+
+    def __init__(self, conn, report: IngestReport, batch_size: int):
+        self.conn = conn
+        self.report = report
+        self.batch_size = batch_size
+        self.pending: List[tuple] = []
+        self.source_names: Dict[int, str] = {}
+
+    def add(self, draft: MockDraft, digest: Optional[str] = None):
+        if draft.source_name == OVERALL:
+            raise ValueError(f"Mock draft source name {OVERALL!r} is reserved for the overall ADP")
+        source_id = self.conn.execute("""
+            INSERT INTO mock_draft_sources (source_name, date, sample_size, content_hash)
+            VALUES (?, ?, 1, ?)
+        """, (draft.source_name, draft.date, digest)).lastrowid
+        self.source_names[source_id] = draft.source_name
+        self.report.sources += 1
+        self.pending.extend((source_id, p.pick_number, p.player_name, p.position, p.team, p.round)
+                            for p in draft.picks)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        self.conn.executemany("""
+            INSERT INTO mock_draft_picks (source_id, pick_number, player_name, position, team, round)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, self.pending)
+        update_adp_stats(self.conn, ((self.source_names[row[0]], row[2], row[1]) for row in self.pending))
+        self.report.picks += len(self.pending)
+        self.pending.clear()
+
+
+def store_mock_drafts(db: DatabaseManager, drafts: Iterable[MockDraft],
+                      batch_size: int = 5000) -> IngestReport:
+    """
+    Write already-parsed mock drafts, such as generated ones.
+
+    Picks are batched and folded into adp_stats as in ingest_mock_drafts,
+    all in one transaction.
+
+    Args:
+        db: Database manager to write to
+        drafts: Drafts to store; consumed lazily
+        batch_size: Picks per executemany call
+
+    Returns:
+        IngestReport with source and pick counts
+    """
+    started = time.perf_counter()
+    report = IngestReport()
+    with db.transaction() as conn:
+        writer = _DraftWriter(conn, report, batch_size)
+        for draft in drafts:
+            writer.add(draft)
+        writer.flush()
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def ingest_mock_drafts(db: DatabaseManager, paths: Iterable[str], league_size: int = 12,
+                       batch_size: int = 5000) -> IngestReport:
+    """
+    Load mock draft files into mock_draft_sources and mock_draft_picks.
+
+    Each file's SHA-256 is stored with the sources it produced, and a file
+    whose hash is already known is skipped without being parsed. Picks are
+    buffered across files and written with ``executemany`` every
+    ``batch_size`` picks, all in one transaction; each batch is also folded
+    into the adp_stats table.
+
+    Args:
+        db: Database manager to write to
+        paths: Files, directories or glob patterns
+        league_size: Teams per round in the mock drafts
+        batch_size: Picks per executemany call
+
+    Returns:
+        IngestReport with file, source and pick counts
+    """
+    started = time.perf_counter()
+    report = IngestReport()
+
+    with db.transaction() as conn:
+        writer = _DraftWriter(conn, report, batch_size)
+        known = {digest for (digest,) in conn.execute(
+            "SELECT DISTINCT content_hash FROM mock_draft_sources WHERE content_hash IS NOT NULL")}
+        for path in iter_mock_files(paths):
+            report.files += 1
+            with open(path, 'rb') as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if digest in known:
+                report.skipped += 1
+                continue
+            known.add(digest)
+
+            default_name = os.path.splitext(os.path.basename(path))[0]
+            lines = content.decode('utf-8').splitlines()
+            for draft in parse_mock_draft(lines, default_name, league_size):
+                writer.add(draft, digest)
+        writer.flush()
+
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,238 @@
+"""
+Local stand-in for a draft platform's pick feed.
+
+Replays a pick log (any format iter_draft_log reads, or DraftLogEntry
+records) as a Sleeper-style ``GET /draft/<id>/picks`` endpoint, revealing
+one pick per ``interval`` seconds (or on ``advance()``), so draft sync can
+be exercised offline:
+
+    python -m src.fantasy_assistant.services.pick_feed_server picks.csv --interval 2
+
+Beyond the plain Sleeper shape it supports what DraftSync uses to poll
+cheaply: ``ETag``/``If-None-Match`` (304 while nothing changed),
+``?since=N`` (only picks after overall pick N) and ``?wait=S`` long polls
+(held up to S seconds until a new pick arrives, flagged with an
+``X-Long-Poll`` response header). Connections are kept alive (HTTP/1.1).
+"""
+
+import argparse
+import json
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from ..models.pick_schedule import PickSchedule
+from .draft_log import DraftLogEntry, iter_draft_log
+
+MAX_WAIT = 30.0
+
+
+def sleeper_record(entry: DraftLogEntry, schedule: PickSchedule) -> Dict:
+    """Shape a log entry like a Sleeper pick (pick_no, round, draft_slot, metadata)."""
+    first, _, last = entry.player_name.partition(' ')
+    metadata = {'first_name': first, 'last_name': last}
+    if entry.team:
+        metadata['team'] = entry.team
+    if entry.position:
+        metadata['position'] = entry.position
+    return {
+        'pick_no': entry.overall_pick,
+        'round': schedule.round_for_pick(entry.overall_pick),
+        'draft_slot': entry.slot or schedule.slot_for_pick(entry.overall_pick),
+        'metadata': metadata,
+    }
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: '_FeedHTTPServer'
+
+    def setup(self):
+        super().setup()
+        self.server.feed._count_connection()
+
+    def do_GET(self):
+        feed = self.server.feed
+        url = urlsplit(self.path)
+        if not url.path.rstrip('/').endswith('/picks'):
+            self._send(404, {'error': f"Unknown path {url.path}"})
+            return
+        query = parse_qs(url.query)
+        since = int(query.get('since', ['0'])[0])
+        wait = min(float(query.get('wait', ['0'])[0]), MAX_WAIT)
+        etag = self.headers.get('If-None-Match')
+
+        revealed = feed.wait_for(lambda count: f'"{count}"' != etag and count > since, wait)
+        headers = {'ETag': f'"{revealed}"'}
+        if wait:
+            headers['X-Long-Poll'] = '1'
+        if etag == f'"{revealed}"':
+            self._send(304, None, headers)
+        else:
+            self._send(200, feed.records[since:revealed], headers)
+
+    def _send(self, status: int, payload, headers: Optional[Dict] = None):
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.feed._count_request()
+
+    def log_message(self, format, *args):  # Keep the draft console quiet
+        pass
+
+
+class _FeedHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, feed: 'PickFeedServer'):
+        self.feed = feed
+        super().__init__(address, _FeedHandler)
+
+
+class PickFeedServer:
+    """
+    Serves a pick log as a live feed on a background thread.
+
+    Attributes:
+        records: Every pick of the log, Sleeper-shaped, in pick order
+        connections: TCP connections accepted so far
+        requests: Responses sent so far
+    """
+
+    def __init__(self, entries: Iterable[DraftLogEntry], league_size: int = 12,
+                 interval: Optional[float] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Initialize the server (not yet listening).
+
+        Args:
+            entries: Picks to replay; numbered in order when the log has no pick numbers
+            league_size: Teams per round, for the records' round numbers
+            interval: Seconds between revealed picks, or None to reveal only on advance()
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        schedule = PickSchedule(league_size)
+        self.records: List[Dict] = []
+        for number, entry in enumerate(entries, 1):
+            if entry.overall_pick is None:
+                entry = replace(entry, overall_pick=number)
+            self.records.append(sleeper_record(entry, schedule))
+        self.interval = interval
+        self.connections = 0
+        self.requests = 0
+        self._released = 0
+        self._started: Optional[float] = None
+        self._condition = threading.Condition()
+        self._httpd = _FeedHTTPServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_log(cls, path: str, league_size: int = 12, **kwargs) -> 'PickFeedServer':
+        """Serve a pick log file (CSV, JSONL or JSON)."""
+        return cls(iter_draft_log(path, league_size), league_size, **kwargs)
+
+    @property
+    def url(self) -> str:
+        """Feed URL to give DraftSync."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/draft/local/picks"
+
+    @property
+    def revealed(self) -> int:
+        """Number of picks visible in the feed."""
+        with self._condition:
+            return self._revealed()
+
+    def _revealed(self) -> int:
+        count = self._released
+        if self.interval and self._started is not None:
+            count += int((time.monotonic() - self._started) / self.interval)
+        return min(count, len(self.records))
+
+    def advance(self, picks: int = 1):
+        """Reveal the next picks now."""
+        with self._condition:
+            self._released += picks
+            self._condition.notify_all()
+
+    def wait_for(self, ready, timeout: float) -> int:
+        """Wait until ready(revealed count) holds or the timeout passes; get the count."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                count = self._revealed()
+                remaining = deadline - time.monotonic()
+                if ready(count) or remaining <= 0 or count == len(self.records):
+                    return count
+                if self.interval:  # wake up for the next timed reveal
+                    remaining = min(remaining, self.interval)
+                self._condition.wait(remaining)
+
+    def _count_connection(self):
+        with self._condition:
+            self.connections += 1
+
+    def _count_request(self):
+        with self._condition:
+            self.requests += 1
+
+    def start(self) -> 'PickFeedServer':
+        """Start serving (and the reveal clock) on a background thread."""
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="pick-feed",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        with self._condition:
+            self._condition.notify_all()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'PickFeedServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Replay a pick log as a live pick feed")
+    parser.add_argument("log", help="Pick log (CSV, JSONL or JSON)")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between picks")
+    parser.add_argument("--league-size", type=int, default=12, help="Teams per round")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    server = PickFeedServer.from_log(args.log, args.league_size, interval=args.interval,
+                                     host=args.host, port=args.port).start()
+    print(f"📡 Serving {len(server.records)} picks at {server.url} "
+          f"(one every {args.interval:g}s); Ctrl+C to stop")
+    try:
+        while server.revealed < len(server.records):
+            time.sleep(0.5)
+        print("✅ Every pick revealed; still serving")
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+"""
+Bulk player pool loading for the fantasy football draft assistant.
+
+Streams player rows from ranking sources (the Markdown tables under
+``rankings/``, CSV or JSONL), merges them per player and writes the pool
+to the ``players`` table in one transaction, rewriting only the players
+whose content hash changed.
+"""
+
+import csv
+import functools
+import hashlib
+import json
+import os
+import re
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..models.database import DatabaseManager
+
+# Columns filled from sources, in insert order
+PLAYER_COLUMNS = ('name', 'position', 'team', 'bye_week', 'consensus_rank', 'adp',
+                  'ppg_projection', 'target_share', 'receptions_2024', 'injury_status',
+                  'notes', 'handcuff')
+REQUIRED_COLUMNS = ('name', 'position', 'team', 'bye_week')
+_REQUIRED = [PLAYER_COLUMNS.index(column) for column in REQUIRED_COLUMNS]
+
+# Source header (lowercased, spaces as underscores) -> players column
+HEADER_ALIASES = {
+    'player': 'name', 'name': 'name', 'player_name': 'name',
+    'pos': 'position', 'position': 'position',
+    'team': 'team', 'tm': 'team',
+    'bye': 'bye_week', 'bye_week': 'bye_week',
+    'rank': 'consensus_rank', 'consensus_rank': 'consensus_rank', 'overall': 'consensus_rank',
+    'adp': 'adp', 'avg_pick': 'adp',
+    'ppg': 'ppg_projection', 'ppg_projection': 'ppg_projection',
+    'target_share': 'target_share',
+    'receptions': 'receptions_2024', 'receptions_2024': 'receptions_2024',
+    'injury_status': 'injury_status', 'status': 'injury_status',
+    'notes': 'notes', 'ppr_notes': 'notes', 'ppr_value': 'notes',
+    'handcuff': 'handcuff',
+}
+
+_INTEGER_COLUMNS = {'bye_week', 'consensus_rank', 'receptions_2024'}
+_REAL_COLUMNS = {'adp', 'ppg_projection', 'target_share'}
+
+# Markdown section headings that say which position a table lists
+_SECTION_POSITIONS = (
+    ('quarterback', 'QB'), ('running back', 'RB'), ('wide receiver', 'WR'),
+    ('tight end', 'TE'), ('kicker', 'K'), ('defense', 'DEF'),
+)
+
+Source = Union[str, Iterable[Dict]]
+
+
+@dataclass
+class PlayerChanges:
+    """
+    Players touched by a reload.
+
+    Players are identified by name, position and team, so two players may
+    share a name; the ``*_ids`` lists hold their players-table ids, in the
+    same order as the names.
+
+    Attributes:
+        added: Names of players that were not stored before
+        updated: Names of stored players whose data changed
+        removed: Names of stored players missing from the new pool
+        unchanged: Number of players left untouched
+        added_ids: Ids of the added players
+        updated_ids: Ids of the updated players
+        removed_ids: Ids the removed players had
+    """
+
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    added_ids: List[int] = field(default_factory=list)
+    updated_ids: List[int] = field(default_factory=list)
+    removed_ids: List[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def summary(self) -> str:
+        """Describe the changes in one line."""
+        return (f"{len(self.added)} added, {len(self.updated)} updated, "
+                f"{len(self.removed)} removed, {self.unchanged} unchanged")
+
+
+@dataclass
+class LoadReport:
+    """
+    Outcome of a bulk load.
+
+    Attributes:
+        sources: Number of sources read
+        rows_read: Source rows read
+        players: Players written to the players table
+        skipped: Players missing a required field in every source
+        seconds: Wall time of the load
+        changes: Players added, updated and removed by the load
+    """
+
+    sources: int
+    rows_read: int
+    players: int
+    skipped: int
+    seconds: float
+    changes: PlayerChanges = field(default_factory=PlayerChanges)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Source rows processed per second."""
+        return self.rows_read / self.seconds if self.seconds > 0 else float('inf')
+
+    def summary(self) -> str:
+        """Describe the load in one line."""
+        skipped = f", skipped {self.skipped} incomplete" if self.skipped else ""
+        return (f"Loaded {self.players:,} players from {self.sources} source(s) "
+                f"({self.rows_read:,} rows) in {self.seconds:.2f}s "
+                f"({self.rows_per_second:,.0f} rows/s){skipped}: {self.changes.summary()}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _column(header: str) -> Optional[str]:
+    """Map a source header to a players column."""
+    return HEADER_ALIASES.get(re.sub(r'\s+', '_', header.strip().lower()))
+
+
+def _coerce(column: str, value):
+    """Convert a raw source value to the column's type (None if blank or invalid)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value or value in ('-', '—'):
+            return None
+    try:
+        if column in _INTEGER_COLUMNS:
+            return int(float(value))
+        if column in _REAL_COLUMNS:
+            return float(value)
+    except (TypeError, ValueError):
+        return None
+    return value
+
+
+def parse_markdown(path: str) -> Iterator[Dict]:
+    """
+    Stream player rows from the Markdown tables in a rankings file.
+
+    Tables without a position column take the position from the nearest
+    section heading (e.g. "Running Backs"). Their rank column is a
+    positional rank, so it is not used as the consensus rank.
+    """
+    section_position = None
+    headers: Optional[List[Optional[str]]] = None
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#'):
+                level = len(line) - len(line.lstrip('#'))
+                heading = line.lower()
+                matched = next((pos for key, pos in _SECTION_POSITIONS if key in heading), None)
+                if matched or level <= 2:
+                    section_position = matched
+                headers = None
+                continue
+            if not line.startswith('|'):
+                headers = None
+                continue
+
+            cells = [cell.strip().strip('*').strip() for cell in line.strip('|').split('|')]
+            if headers is None:
+                headers = [_column(cell) for cell in cells]
+                continue
+            if all(set(cell) <= set('-: ') for cell in cells):  # Header separator
+                continue
+
+            row = {column: cell for column, cell in zip(headers, cells) if column}
+            if 'name' not in row:
+                continue
+            if 'position' not in headers:
+                row.pop('consensus_rank', None)
+                row['position'] = section_position
+            yield row
+
+
+def parse_csv(path: str) -> Iterator[Dict]:
+    """Stream player rows from a CSV file with a header row."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Map the header once; rows are then zipped against the known columns
+        fields = [(i, _column(name)) for i, name in enumerate(header) if _column(name)]
+        for record in reader:
+            yield {column: record[i] for i, column in fields if i < len(record)}
+
+
+def parse_jsonl(path: str) -> Iterator[Dict]:
+    """Stream player rows from a JSON Lines file (one object per line)."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield {_column(key): value for key, value in json.loads(line).items()
+                       if _column(key)}
+
+
+PARSERS: Dict[str, Callable[[str], Iterator[Dict]]] = {
+    '.md': parse_markdown,
+    '.markdown': parse_markdown,
+    '.csv': parse_csv,
+    '.jsonl': parse_jsonl,
+    '.ndjson': parse_jsonl,
+}
+
+
+def iter_source(source: Source) -> Iterator[Dict]:
+    """
+    Stream rows from a file path (by extension) or an iterable of row dicts.
+
+    Raises:
+        ValueError: If a file's extension has no parser
+    """
+    if not isinstance(source, str):
+        return iter(source)
+    extension = os.path.splitext(source)[1].lower()
+    if extension not in PARSERS:
+        raise ValueError(f"Unsupported ranking source '{source}' (expected one of "
+                         f"{', '.join(sorted(PARSERS))})")
+    return PARSERS[extension](source)
+
+
+def _source_rows(sources: Sequence[Source]) -> Iterator[list]:
+    """Convert every source row to PLAYER_COLUMNS values, in source priority order."""
+    for source in sources:
+        for row in iter_source(source):
+            if not row.get('name'):
+                continue
+            values = [_coerce(column, row.get(column)) for column in PLAYER_COLUMNS]
+            if values[1]:
+                values[1] = values[1].upper()
+            yield values
+
+
+def content_hash(values: Sequence) -> str:
+    """Fingerprint a player's PLAYER_COLUMNS values for change detection."""
+    return hashlib.blake2b(repr(tuple(values)).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def match_stored_players(stored: Sequence[tuple], players: Sequence[Sequence]) -> Dict[int, tuple]:
+    """
+    Pair incoming players with the stored rows they update.
+
+    Players are matched on (name, position, team), repeats of one identity
+    pairing up in order. A player left over keeps the stored row of the
+    same name and position when exactly one of each is left on both sides,
+    so a team change updates the player instead of replacing him.
+
+    Args:
+        stored: (id, name, position, team, content_hash) rows
+        players: PLAYER_COLUMNS values per incoming player
+
+    Returns:
+        Stored row per matched index into ``players``
+    """
+    by_identity: Dict[tuple, deque] = defaultdict(deque)
+    for row in stored:
+        by_identity[row[1:4]].append(row)
+    matches: Dict[int, tuple] = {}
+    leftovers: Dict[tuple, List[int]] = defaultdict(list)
+    for i, values in enumerate(players):
+        rows = by_identity.get(tuple(values[:3]))
+        if rows:
+            matches[i] = rows.popleft()
+        else:
+            leftovers[tuple(values[:2])].append(i)
+
+    if leftovers:
+        unmatched: Dict[tuple, List[tuple]] = defaultdict(list)
+        for rows in by_identity.values():
+            for row in rows:
+                unmatched[row[1:3]].append(row)
+        for key, indexes in leftovers.items():
+            rows = unmatched.get(key, ())
+            if len(indexes) == 1 and len(rows) == 1:
+                matches[indexes[0]] = rows[0]
+    return matches
+
+
+def upsert_players(db: DatabaseManager, players: Iterable[Sequence], remove_missing: bool = True,
+                   batch_size: int = 2000) -> PlayerChanges:
+    """
+    Write a player pool, touching only players whose data changed.
+
+    Incoming players are paired with stored rows by match_stored_players
+    and their content hashes compared. Changed players are updated in
+    place (keeping their id, which drafted picks and injury reports refer
+    to) with ``updated_at`` stamped, new ones inserted and unchanged rows
+    left alone. Into an empty table the pool is bulk inserted instead, with
+    the players table's indexes dropped for the insert and rebuilt once.
+
+    Args:
+        db: Database manager to write to
+        players: PLAYER_COLUMNS values per player
+        remove_missing: Delete stored players absent from the pool, except
+            those drafted_players refers to (a pick is never left dangling)
+        batch_size: Rows per executemany call
+
+    Returns:
+        PlayerChanges naming the added, updated and removed players
+    """
+    insert = f"""
+        INSERT INTO players ({', '.join(PLAYER_COLUMNS)}, content_hash, updated_at)
+        VALUES ({', '.join('?' for _ in PLAYER_COLUMNS)}, ?, CURRENT_TIMESTAMP)
+    """
+    update = f"""
+        UPDATE players
+        SET {', '.join(f'{c} = ?' for c in PLAYER_COLUMNS)}, content_hash = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+    changes = PlayerChanges()
+
+    with db.transaction() as conn:
+        stored = conn.execute(
+            "SELECT id, name, position, team, content_hash FROM players ORDER BY id").fetchall()
+        players = players if isinstance(players, list) else list(players)
+        matches = match_stored_players(stored, players)
+        inserts, updates = [], []
+        for i, values in enumerate(players):
+            digest = content_hash(values)
+            row = matches.get(i)
+            if row is None:
+                changes.added.append(values[0])
+                inserts.append((*values, digest))
+            elif row[4] != digest:
+                changes.updated.append(values[0])
+                changes.updated_ids.append(row[0])
+                updates.append((*values, digest, row[0]))
+            else:
+                changes.unchanged += 1
+        if remove_missing:
+            kept = {row[0] for row in matches.values()}
+            kept.update(player_id for (player_id,) in conn.execute(
+                "SELECT DISTINCT player_id FROM drafted_players WHERE player_id IS NOT NULL"))
+            removed = [row for row in stored if row[0] not in kept]
+            changes.removed = [row[1] for row in removed]
+            changes.removed_ids = [row[0] for row in removed]
+
+        for start in range(0, len(updates), batch_size):
+            conn.executemany(update, updates[start:start + batch_size])
+        if not stored:  # First load: bulk insert without index maintenance
+            indexes = conn.execute("""
+                SELECT name, sql FROM sqlite_master
+                WHERE type = 'index' AND tbl_name = 'players' AND sql IS NOT NULL
+            """).fetchall()
+            for name, _ in indexes:
+                conn.execute(f'DROP INDEX "{name}"')
+            for start in range(0, len(inserts), batch_size):
+                conn.executemany(insert, inserts[start:start + batch_size])
+            for _, sql in indexes:
+                conn.execute(sql)
+            changes.added_ids = [player_id for (player_id,) in
+                                 conn.execute("SELECT id FROM players ORDER BY id")]
+        else:
+            changes.added_ids = [conn.execute(insert, row).lastrowid for row in inserts]
+        conn.executemany("DELETE FROM players WHERE id = ?", [(i,) for i in changes.removed_ids])
+
+    return changes
+
+
+def merge_player_rows(rows: Sequence[list]) -> List[list]:
+    """
+    Merge the source rows of one name into players.
+
+    Every row with all required fields stands for the player identified
+    by its position and team. Partial rows (a table without bye weeks, a
+    team column holding the position) only fill gaps: they go to the one
+    player of that name they fit, by position and then team, and are
+    dropped when they fit several. Each field takes its first non-empty
+    value in source order. A name with no complete row merges all its
+    rows into one (possibly incomplete) player.
+
+    Args:
+        rows: PLAYER_COLUMNS values per source row, in source priority order
+
+    Returns:
+        PLAYER_COLUMNS values per player
+    """
+    players: Dict[Optional[Tuple], list] = {}
+    for values in rows:
+        if all(values[i] is not None for i in _REQUIRED):
+            players.setdefault((values[1], values[2]), values[:3] + [None] * (len(values) - 3))
+    if not players:
+        players[None] = [None] * len(PLAYER_COLUMNS)
+
+    for values in rows:
+        target = players.get((values[1], values[2])) or players.get(None)
+        if target is None:
+            fits = [key for key in players if values[1] in (None, key[0])]
+            if len(fits) > 1:
+                fits = [key for key in fits if values[2] == key[1]]
+            if len(fits) != 1:
+                continue
+            target = players[fits[0]]
+        for i, value in enumerate(values):
+            if target[i] is None:
+                target[i] = value
+    return list(players.values())
+
+
+def load_players(db: DatabaseManager, sources: Sequence[Source], remove_missing: bool = True,
+                 batch_size: int = 2000,
+                 progress: Optional[Callable[[int, float], None]] = None) -> LoadReport:
+    """
+    Bulk load the player pool from ranking sources.
+
+    Rows are parsed lazily and merged per player by merge_player_rows,
+    taking the first non-empty value of each field in source order, so a
+    rankings table can supply ranks while a position guide fills in bye
+    weeks. Complete players are then written by upsert_players, so a
+    reload only rewrites the players whose data changed.
+
+    Args:
+        db: Database manager to load into
+        sources: File paths or iterables of row dicts, highest priority first
+        remove_missing: Delete stored players no source mentions (drafted
+            players are always kept)
+        batch_size: Rows per progress report and per executemany call
+        progress: Called with (rows read, seconds elapsed) every batch_size rows
+
+    Returns:
+        LoadReport with row counts, changes and throughput
+    """
+    started = time.perf_counter()
+    by_name: Dict[str, List[list]] = defaultdict(list)
+    rows_read = 0
+    for values in _source_rows(sources):
+        rows_read += 1
+        by_name[values[0]].append(values)
+        if progress and rows_read % batch_size == 0:
+            progress(rows_read, time.perf_counter() - started)
+
+    injury = PLAYER_COLUMNS.index('injury_status')
+    players, skipped = [], 0
+    for rows in by_name.values():
+        for values in (merge_player_rows(rows) if len(rows) > 1 else rows):
+            if all(values[i] is not None for i in _REQUIRED):
+                values[injury] = values[injury] or 'Healthy'
+                players.append(values)
+            else:
+                skipped += 1
+
+    changes = upsert_players(db, players, remove_missing, batch_size)
+
+    if progress and rows_read % batch_size:
+        progress(rows_read, time.perf_counter() - started)
+    return LoadReport(
+        sources=len(sources),
+        rows_read=rows_read,
+        players=len(players),
+        skipped=skipped,
+        seconds=time.perf_counter() - started,
+        changes=changes,
+    )
@@ -0,0 +1,250 @@
+"""
+Synthetic player pools and drafts for scale testing.
+
+Generates large, reproducible inputs for the benchmarks and the simulator
+without scraped data. The same seed always gives the same pool and drafts.
+
+Pools mix positions the way real rankings do (no kickers or defenses
+early), give ADP a spread around consensus rank that widens later in the
+draft, project points from each player's rank at the position, give every
+player the bye week of their team from ``bye_week_analysis`` and mark a
+share of players injured. Drafts have each team take one of the next few
+players by ADP, with simple positional limits.
+
+Output is streamed in the shapes the rest of the package already reads:
+player dicts for ``load_players``/``load_player_data``, DraftLogEntry
+picks for ``import_draft_log``, and MockDraft objects for
+``store_mock_drafts``.
+"""
+
+import math
+import random
+import sqlite3
+from typing import Dict, Iterator, Optional, Sequence
+
+from ..models.database import DatabaseManager
+from ..models.pick_schedule import DEFAULT_ROUNDS, PickSchedule
+from .draft_log import DraftLogEntry
+from .mock_draft_loader import MockDraft, MockPick
+
+# 2025 bye weeks, as seeded into bye_week_analysis by database_schema.sql
+BYE_WEEKS = {
+    5: ('ATL', 'CHI', 'GB', 'PIT'), 6: ('HOU', 'MIN'), 7: ('BAL', 'BUF'),
+    8: ('JAX', 'LV', 'DET', 'ARI', 'SEA', 'LAR'), 9: ('PHI', 'CLE', 'NYJ', 'TB'),
+    10: ('KC', 'CIN', 'TEN', 'DAL'), 11: ('IND', 'NO'), 12: ('MIA', 'DEN', 'LAC', 'WAS'),
+    14: ('NE', 'NYG', 'CAR', 'SF'),
+}
+
+# Share of each position in a ranking, and the rank before which it never appears
+POSITION_MIX = {'QB': 0.13, 'RB': 0.28, 'WR': 0.34, 'TE': 0.13, 'K': 0.06, 'DEF': 0.06}
+FIRST_RANK = {'K': 120, 'DEF': 110}
+
+# (best projection, replacement-level projection, decay in position ranks) in PPR points
+PPG_CURVES = {
+    'QB': (24.0, 9.0, 14.0), 'RB': (22.0, 3.0, 22.0), 'WR': (21.0, 3.0, 30.0),
+    'TE': (16.0, 3.0, 9.0), 'K': (9.5, 5.0, 10.0), 'DEF': (9.0, 4.0, 10.0),
+}
+
+INJURY_RATES = {'Questionable': 0.06, 'Doubtful': 0.015, 'Out': 0.025, 'IR': 0.02}
+
+# Most of each position a drafting team takes, and from which round K/DEF go
+ROSTER_LIMITS = {'QB': 3, 'RB': 7, 'WR': 7, 'TE': 3, 'K': 1, 'DEF': 1}
+KICKER_ROUND = 13
+
+_FIRST_NAMES = (
+    'Aaron', 'Andre', 'Anthony', 'Brandon', 'Brian', 'Caleb', 'Calvin', 'Chris', 'Cole', 'Darius',
+    'David', 'DeAndre', 'Derrick', 'Devin', 'Dylan', 'Elijah', 'Evan', 'Gabe', 'Isaiah', 'Jalen',
+    'Jamal', 'Jaylen', 'Jordan', 'Josh', 'Justin', 'Kareem', 'Keenan', 'Kevin', 'Kyle', 'Lamar',
+    'Malik', 'Marcus', 'Mario', 'Matt', 'Michael', 'Nate', 'Nick', 'Omar', 'Quentin', 'Rashid',
+    'Ricky', 'Sam', 'Terrell', 'Travis', 'Trey', 'Tyler', 'Tyreek', 'Xavier', 'Zach', 'Zay',
+)
+_SURNAME_STARTS = (
+    'Ad', 'Bar', 'Bel', 'Brad', 'Carl', 'Chan', 'Dav', 'Dun', 'Ed', 'Fair', 'Gar', 'Gor', 'Hal',
+    'Har', 'Hol', 'Jack', 'Jen', 'Kel', 'Kings', 'Lam', 'Mar', 'Mc', 'Mor', 'Nel', 'Os', 'Par',
+    'Ram', 'Rob', 'Sand', 'Staf', 'Thom', 'Wal', 'Wat', 'Whit', 'Wil', 'Young',
+)
+_SURNAME_ENDS = (
+    'ams', 'ard', 'bert', 'by', 'den', 'ers', 'ford', 'ham', 'ins', 'ison', 'ley', 'man',
+    'more', 'ner', 'ridge', 'son', 'ton', 'well', 'wood', 'worth',
+)
+_SUFFIXES = ('', '', '', ' Jr.', ' II', ' III')
+
+
+def load_bye_weeks(db: Optional[DatabaseManager] = None) -> Dict[str, int]:
+    """
+    Get each team's bye week.
+
+    Args:
+        db: Database to read bye_week_analysis from; BYE_WEEKS is used without one
+            or when the table is missing or empty
+
+    Returns:
+        Mapping of team abbreviation to bye week
+    """
+    weeks = BYE_WEEKS
+    if db is not None:
+        try:
+            rows = db.fetchall("SELECT week_number, teams_off FROM bye_week_analysis")
+        except sqlite3.OperationalError:  # the minimal fallback schema has no such table
+            rows = []
+        if rows:
+            weeks = {week: teams.split(',') for week, teams in rows}
+    return {team.strip(): week for week, teams in weeks.items() for team in teams}
+
+
+def _names(rng: random.Random) -> Iterator[str]:
+    """Yield unique, plausible player names."""
+    seen = set()
+    misses = 0
+    while True:
+        name = (f"{rng.choice(_FIRST_NAMES)} {rng.choice(_SURNAME_STARTS)}"
+                f"{rng.choice(_SURNAME_ENDS)}{rng.choice(_SUFFIXES)}")
+        if name in seen:
+            misses += 1
+            if misses < 20:
+                continue
+            name = f"{name} {len(seen)}"  # the name space is nearly used up
+        misses = 0
+        seen.add(name)
+        yield name
+
+
+def generate_players(size: int, seed: int = 0,
+                     bye_weeks: Optional[Dict[str, int]] = None) -> Iterator[Dict]:
+    """
+    Stream a ranked player pool.
+
+    Args:
+        size: Number of players
+        seed: Random seed; equal seeds give equal pools
+        bye_weeks: Team to bye week mapping (see load_bye_weeks)
+
+    Yields:
+        Player dicts keyed by players columns (name, position, team, bye_week,
+        consensus_rank, adp, ppg_projection, target_share, receptions_2024,
+        injury_status), in consensus rank order
+    """
+    rng = random.Random(seed)
+    bye_weeks = bye_weeks or load_bye_weeks()
+    teams = sorted(bye_weeks)
+    names = _names(rng)
+    position_ranks = dict.fromkeys(POSITION_MIX, 0)
+    injuries = list(INJURY_RATES.items())
+
+    for rank in range(1, size + 1):
+        positions = [p for p in POSITION_MIX if rank >= FIRST_RANK.get(p, 1)]
+        position = rng.choices(positions, [POSITION_MIX[p] for p in positions])[0]
+        position_ranks[position] += 1
+        best, floor, decay = PPG_CURVES[position]
+        ppg = floor + (best - floor) * math.exp(-(position_ranks[position] - 1) / decay)
+
+        share = None
+        if position in ('WR', 'TE', 'RB'):
+            top = {'WR': 0.28, 'TE': 0.22, 'RB': 0.14}[position]
+            share = round(max(0.01, top * (ppg - floor + 1) / (best - floor + 1) + rng.gauss(0, 0.02)), 3)
+
+        status, roll = 'Healthy', rng.random()
+        for candidate, rate in injuries:
+            if roll < rate:
+                status = candidate
+                break
+            roll -= rate
+
+        team = rng.choice(teams)
+        yield {
+            'name': next(names),
+            'position': position,
+            'team': team,
+            'bye_week': bye_weeks[team],
+            'consensus_rank': rank,
+            'adp': round(max(1.0, rank + rng.gauss(0, 1.0 + 0.12 * rank)), 1),
+            'ppg_projection': round(max(0.5, ppg + rng.gauss(0, 0.6)), 1),
+            'target_share': share,
+            'receptions_2024': None if share is None else max(0, round(share * 560 + rng.gauss(0, 6))),
+            'injury_status': status,
+        }
+
+
+def generate_draft(players: Sequence[Dict], league_size: int = 12, rounds: int = DEFAULT_ROUNDS,
+                   seed: int = 0, user_slot: Optional[int] = None,
+                   window: int = 6) -> Iterator[DraftLogEntry]:
+    """
+    Stream the pick log of one snake draft of a pool.
+
+    Each team takes, of the next ``window`` players by ADP it may still
+    roster, the one with the lowest ADP after random noise; injured (Out/IR)
+    players slide. Kickers and defenses wait for round KICKER_ROUND.
+
+    Args:
+        players: Pool as from generate_players (needs name, position, adp)
+        league_size: Teams in the league
+        rounds: Rounds to draft (stops early if the pool runs out)
+        seed: Random seed; equal seeds give equal drafts
+        user_slot: Draft slot whose picks are flagged as the user's
+        window: Players each team considers
+
+    Yields:
+        DraftLogEntry per pick, in pick order
+    """
+    rng = random.Random(seed)
+    schedule = PickSchedule(league_size, rounds)
+    board = sorted(players, key=lambda p: (p['adp'] if p.get('adp') is not None else math.inf,
+                                           p.get('consensus_rank') or math.inf))
+    taken = [False] * len(board)
+    counts = {slot: dict.fromkeys(ROSTER_LIMITS, 0) for slot in range(1, league_size + 1)}
+    start = 0
+
+    for overall in range(1, min(schedule.total_picks, len(board)) + 1):
+        slot = schedule.slot_for_pick(overall)
+        round_num = schedule.round_for_pick(overall)
+        while taken[start]:
+            start += 1
+
+        candidates = []
+        for index in range(start, len(board)):
+            if len(candidates) == window:
+                break
+            position = board[index]['position']
+            if taken[index] or counts[slot].get(position, 0) >= ROSTER_LIMITS.get(position, rounds):
+                continue
+            if position in ('K', 'DEF') and round_num < KICKER_ROUND:
+                continue
+            candidates.append(index)
+        if not candidates:  # every eligible player is capped; take the best left
+            candidates = [start]
+
+        def sampled(index: int) -> float:
+            player = board[index]
+            slide = 1.5 if player.get('injury_status') in ('Out', 'IR') else 1.0
+            return index * slide + rng.gauss(0, 1.0 + 0.03 * index)
+
+        choice = min(candidates, key=sampled)
+        taken[choice] = True
+        player = board[choice]
+        counts[slot][player['position']] = counts[slot].get(player['position'], 0) + 1
+        yield DraftLogEntry(player['name'], overall, None if user_slot is None else slot == user_slot,
+                            slot)
+
+
+def generate_mock_drafts(players: Sequence[Dict], count: int, league_size: int = 12,
+                         rounds: int = DEFAULT_ROUNDS, seed: int = 0) -> Iterator[MockDraft]:
+    """
+    Stream mock drafts of a pool, ready for store_mock_drafts.
+
+    Args:
+        players: Pool as from generate_players
+        count: Number of drafts
+        league_size: Teams per draft
+        rounds: Rounds per draft
+        seed: Random seed of the first draft; draft i uses seed + i
+
+    Yields:
+        MockDraft named "Synthetic <i>" per draft
+    """
+    by_name = {player['name']: player for player in players}
+    for number in range(count):
+        picks = [MockPick(entry.overall_pick, (entry.overall_pick - 1) // league_size + 1,
+                          entry.player_name, by_name[entry.player_name]['position'],
+                          by_name[entry.player_name]['team'])
+                 for entry in generate_draft(players, league_size, rounds, seed + number)]
+        yield MockDraft(f"Synthetic {number + 1}", "", picks)
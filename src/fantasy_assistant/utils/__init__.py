@@ -1,7 +1,19 @@
 """Utility functions for the fantasy football draft assistant."""
 
-from .player_search import PlayerSearch
-from .validation import ValidationError, validate_draft_input
-from .logging_config import setup_logging
+from importlib import import_module
 
-__all__ = ["PlayerSearch", "ValidationError", "validate_draft_input", "setup_logging"]
\ No newline at end of file
+# Imported on first access (PEP 562); PlayerSearch needs NumPy
+_EXPORTS = {
+    "PlayerSearch": ".player_search",
+    "ValidationError": ".validation",
+    "validate_draft_input": ".validation",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["PlayerSearch", "ValidationError", "validate_draft_input"]
@@ -0,0 +1,123 @@
+"""
+Versioned memoization for draft assistant queries.
+"""
+
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+def freeze(value: Any) -> Hashable:
+    """Turn dicts, lists and sets (nested) into hashable tuples for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(freeze(v) for v in value))
+    return value
+
+
+class VersionedLRUCache:
+    """
+    Bounded LRU cache whose entries belong to a state version.
+
+    Each entry is stored under (version, key). Readers pass the current
+    version, so bumping it makes every older entry unreachable; stale
+    entries are never touched again and fall off the LRU end first. Safe to
+    share between threads; values are computed outside the lock, so two
+    threads missing on the same key may both compute it.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, version: int, compute: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, computing and storing it on a miss.
+
+        Args:
+            key: Cache key within the version
+            version: Current state version
+            compute: Produces the value on a miss
+
+        Returns:
+            The cached or freshly computed value (shared; do not mutate)
+        """
+        entry_key = (version, key)
+        with self._lock:
+            if entry_key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(entry_key)
+                return self._entries[entry_key]
+            self.misses += 1
+
+        value = compute()
+        self.put(key, version, value)
+        return value
+
+    def put(self, key: Hashable, version: int, value: Any) -> None:
+        """Store a value for a key at a version, evicting the least recently used."""
+        with self._lock:
+            self._entries[(version, key)] = value
+            self._entries.move_to_end((version, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss counters, hit rate and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+
+def versioned(method: Callable) -> Callable:
+    """
+    Memoize a method per state version.
+
+    The instance must provide ``cache`` (a VersionedLRUCache) and
+    ``cache_version`` (an int that changes whenever results may change).
+    Arguments (with defaults filled in, so positional and keyword calls
+    share entries) are part of the key and must be hashable once frozen.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]  # Without self
+        key = (method.__name__, tuple((name, freeze(value)) for name, value in arguments))
+        return self.cache.get_or_compute(key, self.cache_version,
+                                         lambda: method(self, *args, **kwargs))
+    wrapper.uncached = method
+    return wrapper
@@ -0,0 +1,95 @@
+"""
+Trigram index for fast fuzzy player name matching.
+"""
+
+import heapq
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get the padded character trigrams of a string."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Character trigram postings over a set of names.
+
+    Candidate names are gathered from the postings of the query's trigrams,
+    so only names sharing some spelling with the query are scored. Scoring
+    is the same ``SequenceMatcher.ratio`` that ``difflib.get_close_matches``
+    uses, behind the same cheap upper-bound checks.
+    """
+
+    # Queries this short have too few trigrams to find every close match
+    MIN_INDEXED_QUERY = 4
+
+    def __init__(self, keys: Iterable[str]):
+        """
+        Build the index.
+
+        Args:
+            keys: Names to index (already normalized, e.g. lowercased)
+        """
+        self.keys: List[str] = list(dict.fromkeys(keys))
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for i, key in enumerate(self.keys):
+            for gram in trigrams(key):
+                self._postings[gram].append(i)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _candidates(self, query: str) -> List[int]:
+        """
+        Get indexes of keys sharing at least one trigram with the query,
+        most shared trigrams first.
+        """
+        if len(query) < self.MIN_INDEXED_QUERY:
+            return list(range(len(self.keys)))
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in trigrams(query):
+            for i in self._postings.get(gram, ()):
+                shared[i] += 1
+        return sorted(shared, key=shared.__getitem__, reverse=True)
+
+    def search(self, query: str, limit: int = 5, cutoff: float = 0.6) -> List[Tuple[float, str]]:
+        """
+        Find the closest names to a query.
+
+        Args:
+            query: Normalized search text
+            limit: Maximum matches to return
+            cutoff: Minimum similarity score (0.0 to 1.0)
+
+        Returns:
+            (similarity, name) pairs, best first
+        """
+        if limit <= 0 or not query:
+            return []
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)  # seq2 analysis is cached across candidates
+        best: List[Tuple[float, str]] = []  # Min-heap of the top matches so far
+        threshold = cutoff
+        for i in self._candidates(query):
+            key = self.keys[i]
+            matcher.set_seq1(key)
+            # Likely matches come first, so once the heap is full the
+            # threshold rises and the cheap bounds reject most candidates
+            if (matcher.real_quick_ratio() >= threshold and
+                    matcher.quick_ratio() >= threshold):
+                score = matcher.ratio()
+                if score < threshold:
+                    continue
+                if len(best) < limit:
+                    heapq.heappush(best, (score, key))
+                else:
+                    heapq.heappushpop(best, (score, key))
+                if len(best) == limit:
+                    threshold = max(cutoff, best[0][0])
+
+        return sorted(best, reverse=True)
@@ -0,0 +1,200 @@
+"""
+Per-command latency and SQL instrumentation for the draft assistant.
+
+While enabled, every measured command records its wall time, the SQL
+statements its thread ran, the SQLite virtual machine steps they took and
+the query cache hits and misses. Recent wall times are kept per command
+for rolling p50/p95/p99, and each measurement can be appended to a JSONL
+trace file.
+
+Python's sqlite3 has no per-statement row counters, so work done scanning
+rows shows up as VM steps (counted by a progress handler every
+``STEP_GRANULARITY`` instructions). Statements run by other threads, such
+as the write-behind writer, are not attributed to the command.
+
+While disabled, no SQLite hooks are installed and an ``@instrumented``
+method costs one attribute check.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+from ..models.database import DatabaseManager
+from .cache import VersionedLRUCache
+
+STEP_GRANULARITY = 1000
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CommandStats:
+    """Running totals and recent wall times of one command."""
+
+    def __init__(self, window: int):
+        self.calls = 0
+        self.queries = 0
+        self.sql_steps = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.total_ms = 0.0
+        self.recent_ms: Deque[float] = deque(maxlen=window)
+
+    def summary(self) -> Dict:
+        """Get call counts, latency percentiles (recent calls) and per-call averages."""
+        ordered = sorted(self.recent_ms)
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            'calls': self.calls,
+            'mean_ms': self.total_ms / self.calls if self.calls else 0.0,
+            'p50_ms': _percentile(ordered, 0.50) if ordered else 0.0,
+            'p95_ms': _percentile(ordered, 0.95) if ordered else 0.0,
+            'p99_ms': _percentile(ordered, 0.99) if ordered else 0.0,
+            'max_ms': ordered[-1] if ordered else 0.0,
+            'queries_per_call': self.queries / self.calls if self.calls else 0.0,
+            'sql_steps_per_call': self.sql_steps / self.calls if self.calls else 0.0,
+            'cache_hit_rate': self.cache_hits / lookups if lookups else None,
+        }
+
+
+class Instrumentation:
+    """
+    Collects per-command measurements for one assistant.
+
+    Measurements nest: a command that calls other measured methods counts
+    their queries and time as its own too.
+    """
+
+    def __init__(self, db: DatabaseManager, cache: Optional[VersionedLRUCache] = None,
+                 window: int = 1000):
+        """
+        Initialize instrumentation, disabled.
+
+        Args:
+            db: Database whose connections are hooked while enabled
+            cache: Query cache whose hits and misses are attributed to commands
+            window: Recent calls per command kept for percentiles
+        """
+        self.db = db
+        self.cache = cache
+        self.window = window
+        self.enabled = False
+        self.trace_path: Optional[str] = None
+        self.started = time.time()
+        self.commands: Dict[str, CommandStats] = {}
+        self._trace = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self, trace_path: Optional[str] = None):
+        """
+        Start measuring.
+
+        Args:
+            trace_path: JSONL file to append every measurement to
+        """
+        if trace_path and trace_path != self.trace_path:
+            self._close_trace()
+            self._trace = open(trace_path, 'a', buffering=1)
+            self.trace_path = trace_path
+        self.db.set_hooks(self._count_query, self._count_steps, STEP_GRANULARITY)
+        self.enabled = True
+
+    def disable(self):
+        """Stop measuring (collected stats are kept) and close the trace file."""
+        self.enabled = False
+        self.db.set_hooks()
+        self._close_trace()
+
+    def reset(self):
+        """Drop collected stats."""
+        with self._lock:
+            self.commands.clear()
+            self.started = time.time()
+
+    def _close_trace(self):
+        if self._trace is not None:
+            self._trace.close()
+        self._trace = None
+        self.trace_path = None
+
+    def _counters(self):
+        local = self._local
+        if not hasattr(local, 'queries'):
+            local.queries = local.steps = 0
+        return local
+
+    def _count_query(self, _sql: str):
+        self._counters().queries += 1
+
+    def _count_steps(self) -> int:
+        self._counters().steps += STEP_GRANULARITY
+        return 0
+
+    @contextmanager
+    def measure(self, command: str) -> Iterator[None]:
+        """Measure a block as one call of ``command`` (a no-op while disabled)."""
+        if not self.enabled:
+            yield
+            return
+        counters = self._counters()
+        queries, steps = counters.queries, counters.steps
+        hits, misses = (self.cache.hits, self.cache.misses) if self.cache else (0, 0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._record(command, elapsed_ms, counters.queries - queries, counters.steps - steps,
+                         (self.cache.hits - hits) if self.cache else 0,
+                         (self.cache.misses - misses) if self.cache else 0)
+
+    def _record(self, command: str, elapsed_ms: float, queries: int, steps: int,
+                hits: int, misses: int):
+        with self._lock:
+            stats = self.commands.get(command)
+            if stats is None:
+                stats = self.commands[command] = CommandStats(self.window)
+            stats.calls += 1
+            stats.queries += queries
+            stats.sql_steps += steps
+            stats.cache_hits += hits
+            stats.cache_misses += misses
+            stats.total_ms += elapsed_ms
+            stats.recent_ms.append(elapsed_ms)
+            if self._trace is not None:
+                self._trace.write(json.dumps({
+                    'ts': round(time.time(), 6), 'command': command, 'ms': round(elapsed_ms, 4),
+                    'queries': queries, 'sql_steps': steps, 'cache_hits': hits,
+                    'cache_misses': misses,
+                }) + "\n")
+
+    def stats(self) -> Dict[str, Dict]:
+        """Get the summary of every measured command, slowest p95 first."""
+        with self._lock:
+            summaries = {command: stats.summary() for command, stats in self.commands.items()}
+        return dict(sorted(summaries.items(), key=lambda item: -item[1]['p95_ms']))
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Measure every call of a method under its name.
+
+    The instance must provide ``instrumentation`` (an Instrumentation).
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if not instrumentation.enabled:
+            return method(self, *args, **kwargs)
+        with instrumentation.measure(name):
+            return method(self, *args, **kwargs)
+    return wrapper
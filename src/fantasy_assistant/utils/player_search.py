@@ -3,9 +3,14 @@ Player search and validation utilities to prevent typos and improve UX.
 """
 
 import re
-from typing import List, Optional, Tuple
-from difflib import SequenceMatcher, get_close_matches
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
 from ..models.player import Player
+from ..models.player_table import PlayerTable
+from .fuzzy_index import TrigramIndex
+from .prefix_trie import PrefixTrie
 
 
 class PlayerSearch:
@@ -16,16 +21,54 @@ class PlayerSearch:
     to prevent draft errors from typos.
     """
     
-    def __init__(self, players: List[Player]):
+    def __init__(self, players: Union[List[Player], PlayerTable]):
         """
         Initialize with list of available players.
         
         Args:
-            players: List of Player objects to search through
+            players: Player objects or a PlayerTable to search through. Player
+                objects are copied into a PlayerTable, and results are that
+                table's row views.
         """
-        self.players = players
+        if not isinstance(players, PlayerTable):
+            players = PlayerTable.from_players(players)
+        self.table = players
+        self.players = list(players)
         self._name_map = self._build_name_map()
         
+    @classmethod
+    def from_snapshot(cls, snapshot, is_drafted: Optional[Callable[[int], bool]] = None) -> 'PlayerSearch':
+        """Search a mapped player pool snapshot (see PlayerTable.from_snapshot)."""
+        return cls(PlayerTable.from_snapshot(snapshot, is_drafted))
+        
+    def apply_changes(self, records: Iterable[Dict], removed: Iterable[int] = ()) -> None:
+        """
+        Follow a reloaded pool without starting over.
+
+        The table is patched in place (see PlayerTable.apply_changes), so
+        players the reload did not touch keep their row views and earlier
+        lookups stay valid. Name lookups are rebuilt only if a player was
+        added or removed, or an updated one changed name or rank.
+
+        Args:
+            records: Player dicts (PlayerTable records, with ``id``) of the
+                added and updated players
+            removed: Ids of players that left the pool
+        """
+        records, removed = list(records), list(removed)
+        renamed = bool(removed)
+        for record in records:
+            row = self.table.row_of_id(record['id'])
+            if (row is None or self.table.names[row] != record['name']
+                    or self.table[row].consensus_rank != record.get('consensus_rank')):
+                renamed = True
+                break
+
+        self.table.apply_changes(records, removed)
+        self.players = list(self.table)
+        if renamed:
+            self._name_map = self._build_name_map()
+
     def _build_name_map(self) -> dict:
         """Build optimized name lookup map with variations."""
         name_map = {}
@@ -50,8 +93,26 @@ class PlayerSearch:
                 if "'" in player.name:  # Handle apostrophes
                     clean_name = player.name.replace("'", "").lower()
                     name_map[clean_name] = player
-                    
+        
+        # Fuzzy index over every variant, built once alongside the map
+        self._fuzzy_index = TrigramIndex(name_map.keys())
+        self._prefix_trie = self._build_prefix_trie(self.players, name_map)
+
         return name_map
+
+    @staticmethod
+    def _build_prefix_trie(players: List[Player], name_map: dict) -> PrefixTrie:
+        """Build the autocomplete trie, inserting players best rank first."""
+        # Every player under its own name, even one whose name another player shares
+        variants = {id(player): (player, [player.name.lower()]) for player in players}
+        for name, player in name_map.items():
+            variants.setdefault(id(player), (player, []))[1].append(name)
+
+        trie = PrefixTrie()
+        ordered = sorted(variants.values(), key=lambda v: (v[0].consensus_rank or 999, v[0].name))
+        for player, names in ordered:
+            trie.insert(names, player)
+        return trie
     
     def find_player(self, search_term: str) -> Optional[Player]:
         """
@@ -94,51 +155,37 @@ class PlayerSearch:
             
         search_term = search_term.strip().lower()
         
-        # Get close matches from name map
-        close_names = get_close_matches(
-            search_term, 
-            self._name_map.keys(),
-            n=limit * 2,  # Get more to filter by similarity
-            cutoff=min_similarity
-        )
-        
-        # Convert to players and sort by similarity
-        suggestions = []
-        for name in close_names:
-            player = self._name_map[name]
-            similarity = SequenceMatcher(None, search_term, name).ratio()
-            suggestions.append((similarity, player))
-        
-        # Sort by similarity descending and return players
-        suggestions.sort(key=lambda x: x[0], reverse=True)
-        return [player for _, player in suggestions[:limit]]
+        # Get close matches from the trigram index, best first
+        close_names = self._fuzzy_index.search(search_term, limit=limit, cutoff=min_similarity)
+        
+        return [self._name_map[name] for _, name in close_names]
     
-    def autocomplete(self, partial_name: str, limit: int = 10) -> List[str]:
+    def autocomplete(self, partial_name: str, limit: int = 10,
+                     is_drafted: Optional[Callable[[Player], bool]] = None) -> List[str]:
         """
         Provide autocomplete suggestions for partial player names.
-        
+
         Args:
             partial_name: Partial player name being typed
             limit: Maximum suggestions to return
-            
+            is_drafted: Check for drafted players (defaults to each
+                Player's is_drafted flag)
+
         Returns:
-            List of player names that match the partial input
+            Names of undrafted players matching the partial input, best
+            consensus rank first (a shared name once per player)
         """
+        return [p.name for p in self.autocomplete_players(partial_name, limit, is_drafted)]
+
+    def autocomplete_players(self, partial_name: str, limit: int = 10,
+                             is_drafted: Optional[Callable[[Player], bool]] = None) -> List[Player]:
+        """Get the players autocomplete() suggests, best consensus rank first."""
         if not partial_name or len(partial_name) < 2:
             return []
-            
+
         partial_lower = partial_name.lower().strip()
-        matches = []
-        
-        for name, player in self._name_map.items():
-            if name.startswith(partial_lower):
-                matches.append(player.name)
-        
-        # Remove duplicates and sort
-        unique_matches = list(set(matches))
-        unique_matches.sort()
-        
-        return unique_matches[:limit]
+        skip = is_drafted or (lambda p: p.is_drafted)
+        return self._prefix_trie.top(partial_lower, limit, skip)
     
     def search_by_position(self, position: str, limit: int = 20) -> List[Player]:
         """
@@ -151,15 +198,12 @@ class PlayerSearch:
         Returns:
             List of available players at the position, sorted by rank
         """
-        position_players = [
-            p for p in self.players 
-            if p.position.value.upper() == position.upper() and p.is_available
-        ]
-        
-        # Sort by consensus rank (lower is better)
-        position_players.sort(key=lambda p: p.consensus_rank or 999)
-        
-        return position_players[:limit]
+        rows = np.flatnonzero(self.table.position_mask(position) & self.table.available_mask())
+        return self._rows_to_players(self.table.sort_rows(rows)[:limit])
+    
+    def _rows_to_players(self, rows: np.ndarray) -> List[Player]:
+        """Get the row views for table rows."""
+        return [self.players[row] for row in rows]
     
     def validate_and_suggest(self, player_input: str) -> Tuple[Optional[Player], List[str]]:
         """
@@ -194,18 +238,8 @@ class PlayerSearch:
         Returns:
             List of available players sorted by specified criteria
         """
-        available = [p for p in self.players if p.is_available]
-        
-        if sort_by == "rank":
-            available.sort(key=lambda p: p.consensus_rank or 999)
-        elif sort_by == "adp":
-            available.sort(key=lambda p: p.adp or 999)
-        elif sort_by == "name":
-            available.sort(key=lambda p: p.name)
-        elif sort_by == "position":
-            available.sort(key=lambda p: (p.position.value, p.consensus_rank or 999))
-        
-        return available
+        rows = np.flatnonzero(self.table.available_mask())
+        return self._rows_to_players(self.table.sort_rows(rows, sort_by))
     
     def search_with_filters(self, search_term: str = "", position: str = "", 
                            max_bye_week: int = 18, exclude_injured: bool = False,
@@ -223,26 +257,22 @@ class PlayerSearch:
         Returns:
             Filtered list of players matching criteria
         """
-        results = self.players.copy()
+        # Apply filters as one mask over the table's columns
+        mask = self.table.available_mask()
         
-        # Apply filters
         if search_term:
-            search_lower = search_term.lower()
-            results = [p for p in results if search_lower in p.name.lower()]
+            mask &= self.table.name_contains(search_term)
             
         if position:
-            results = [p for p in results if p.position.value.upper() == position.upper()]
+            mask &= self.table.position_mask(position)
             
         if max_bye_week < 18:
-            results = [p for p in results if p.bye_week <= max_bye_week]
+            mask &= self.table.bye_weeks <= max_bye_week
             
         if exclude_injured:
-            results = [p for p in results if not p.is_injured]
+            mask &= ~self.table.injured_mask()
             
-        # Only available players
-        results = [p for p in results if p.is_available]
-        
         # Sort by rank
-        results.sort(key=lambda p: p.consensus_rank or 999)
+        rows = self.table.sort_rows(np.flatnonzero(mask))
         
-        return results[:limit]
\ No newline at end of file
+        return self._rows_to_players(rows[:limit])
\ No newline at end of file
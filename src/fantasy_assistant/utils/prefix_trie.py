@@ -0,0 +1,93 @@
+"""
+Prefix trie for player name autocomplete.
+"""
+
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class _Node(Generic[T]):
+    """One character of a trie path."""
+
+    __slots__ = ('children', 'items')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node[T]'] = {}
+        self.items: List[T] = []
+
+
+class PrefixTrie(Generic[T]):
+    """
+    Character trie whose nodes list every item under that prefix.
+
+    Items are expected to be inserted best first (e.g. by consensus rank),
+    so each node's list is already in rank order and the top-k items for a
+    prefix are its first k entries. An item with several keys (name
+    variants) is listed once per node however many of its keys share the
+    prefix. Items that should no longer be offered, such as drafted players,
+    are skipped at query time instead of being removed.
+    """
+
+    def __init__(self):
+        self._root: _Node[T] = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, keys: Iterable[str], item: T) -> None:
+        """
+        Add an item under every prefix of its keys.
+
+        Args:
+            keys: Normalized keys to index the item by
+            item: Item to return for matching prefixes
+        """
+        seen = set()
+        for key in keys:
+            node = self._root
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _Node()
+                node = child
+                if id(node) not in seen:  # Keys sharing a prefix list the item once
+                    seen.add(id(node))
+                    node.items.append(item)
+        self._size += 1
+
+    def _find(self, prefix: str) -> Optional[_Node[T]]:
+        """Walk to the node for a prefix."""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def top(self, prefix: str, limit: int = 10,
+            skip: Optional[Callable[[T], bool]] = None) -> List[T]:
+        """
+        Get the first items stored under a prefix.
+
+        Args:
+            prefix: Normalized prefix to complete
+            limit: Maximum items to return
+            skip: Predicate for items to leave out (e.g. drafted players)
+
+        Returns:
+            Up to ``limit`` items in insertion order
+        """
+        node = self._find(prefix)
+        if node is None or limit <= 0:
+            return []
+
+        results = []
+        for item in node.items:
+            if skip is not None and skip(item):
+                continue
+            results.append(item)
+            if len(results) == limit:
+                break
+        return results
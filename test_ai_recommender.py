@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for vectorized recommendation scoring"""
+
+import pytest
+
+from src.fantasy_assistant.services.ai_recommender import AIRecommender
+
+
+def reference_score(player, current_round, needs):
+    """The scoring rules one player at a time, without mock draft ADP"""
+    score = (200 - player['rank']) / 10 if player['rank'] else 0.0
+    if needs.get(player['position'], 0) > 0:
+        score *= 1 + needs[player['position']] * 0.5
+    if player['position'] == 'QB' and current_round < 6:
+        score *= 0.3
+    elif player['position'] in ('K', 'DEF') and current_round < 15:
+        score *= 0.1
+    if player['injury_status'] != 'Healthy':
+        score *= {'Out': 0.2, 'Questionable': 0.7}.get(player['injury_report'], 1.0)
+    return score * {8: 0.8, 14: 0.9}.get(player['bye_week'], 1.0)
+
+
+def test_scores_for_hand_computed_players():
+    players = [
+        {'id': 1, 'name': "A", 'position': 'RB', 'rank': 10, 'injury_status': 'Healthy',
+         'injury_report': None, 'bye_week': 8},
+        {'id': 2, 'name': "B", 'position': 'QB', 'rank': 20, 'injury_status': 'Injured',
+         'injury_report': 'Questionable', 'bye_week': 14},
+        {'id': 3, 'name': "C", 'position': 'K', 'rank': None, 'injury_status': 'Healthy',
+         'injury_report': None, 'bye_week': 5},
+    ]
+    scores = AIRecommender(players).scores(3, {'RB': 2, 'QB': 1})
+    # RB: 19 * 2 need * 0.8 bye; QB: 18 * 1.5 need * 0.3 early * 0.7 injury * 0.9 bye
+    assert list(scores) == pytest.approx([30.4, 5.103, 0.0])
+
+
+@pytest.mark.parametrize("current_round", [1, 5, 6, 14, 15])
+def test_vectorized_scores_match_scalar_rules(assistant, current_round):
+    needs = {'QB': 1, 'RB': 2, 'WR': 0, 'TE': -1, 'K': 1, 'DEF': 0}
+    players = assistant.recommender.players
+    scores = assistant.recommender.scores(current_round, needs)
+
+    for player, score in zip(players, scores):
+        expected = reference_score(player, current_round, needs)
+        assert score == pytest.approx(expected)
+
+
+def test_recommendations_consider_the_whole_pool(assistant):
+    for name in ["Ja'Marr Chase", "Jahmyr Gibbs", "Justin Jefferson", "Bijan Robinson",
+                 "Ashton Jeanty", "Saquon Barkley", "Christian McCaffrey", "CeeDee Lamb",
+                 "Malik Nabers", "Puka Nacua", "Amon-Ra St. Brown", "Brian Thomas Jr."]:
+        assistant.draft_player(name)
+
+    needs = assistant._calculate_position_needs({}, 2)
+    available = [p for p in assistant.index.players() if assistant.index.is_available(p['id'])]
+    expected = sorted(
+        ((p, reference_score(p, 2, needs)) for p in available),
+        key=lambda pair: pair[1], reverse=True,
+    )[:5]
+
+    top = assistant.recommender.top(2, needs, k=5)
+    assert [p['name'] for p, _ in top] == [p['name'] for p, _ in expected]
+
+    recommendation = assistant.get_ai_recommendation(num_recommendations=5)
+    assert [r['player']['name'] for r in recommendation['recommendations']] == [p['name'] for p, _ in top]
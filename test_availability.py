@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for the incremental best-available index"""
+
+
+def query_best_available(assistant, position=None, limit=10):
+    """The NOT IN query get_best_available used to run"""
+    drafted = list(assistant.state.drafted)
+    query = """
+        SELECT p.name, p.position, p.team, p.bye_week, p.consensus_rank, p.adp,
+               p.injury_status, p.notes, i.status as injury_report, p.id
+        FROM players p
+        LEFT JOIN injury_reports i ON p.name = i.player_name
+        WHERE p.id NOT IN ({})
+    """.format(','.join('?' * len(drafted)))
+    params = drafted.copy()
+    if position:
+        query += " AND p.position = ?"
+        params.append(position)
+    query += " ORDER BY p.consensus_rank LIMIT ?"
+    params.append(limit)
+    keys = ['name', 'position', 'team', 'bye_week', 'rank', 'adp',
+            'injury_status', 'notes', 'injury_report', 'id']
+    return [dict(zip(keys, row)) for row in assistant.db.fetchall(query, params)]
+
+
+def test_index_matches_sql_as_players_are_drafted(assistant):
+    for name in ["Ja'Marr Chase", "Jahmyr Gibbs", "Puka Nacua", "De'Von Achane",
+                 "Josh Allen", "Travis Kelce"]:
+        assistant.draft_player(name)
+        for position in [None, 'QB', 'RB', 'WR', 'TE']:
+            assert (assistant.get_best_available(position, limit=8)
+                    == query_best_available(assistant, position, limit=8))
+
+
+def test_restore_puts_player_back_in_rank_order(assistant):
+    index = assistant.index
+    for name in ["Ja'Marr Chase", "Jahmyr Gibbs"]:
+        assistant.draft_player(name)
+    assert index.top(limit=1)[0]['name'] == "Justin Jefferson"
+
+    index.restore(index.named("Ja'Marr Chase")[0]['id'])
+    assert [p['name'] for p in index.top('WR', limit=2)] == ["Ja'Marr Chase", "Justin Jefferson"]
+    assert index.top(limit=1)[0]['name'] == "Ja'Marr Chase"
+
+
+def test_returned_players_are_copies(assistant):
+    assistant.get_best_available(limit=1)[0]['name'] = "Someone Else"
+    assert assistant.get_best_available(limit=1)[0]['name'] == "Ja'Marr Chase"
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Tests for the benchmark suite"""
+
+import json
+
+from benchmark import compare, main, run_benchmarks
+
+
+def test_benchmark_writes_per_operation_results(tmp_path):
+    output = tmp_path / "results.json"
+    main(["--pools", "300", "--leagues", "10", "--picks", "30", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    results = {(r['operation'], r['league']): r for r in report['results']}
+    assert results['draft_player', 10]['n'] == 30
+    assert results['get_ai_recommendation', 10]['n'] == 30
+    assert results['find_player', None]['n'] == 200
+    assert results['import_draft_log', None]['n'] == 1
+    assert results['load_player_data', None]['p50_ms'] > 0
+    assert all(r['pool'] == 300 for r in report['results'])
+
+    again = run_benchmarks([300], [10], picks=30, verbose=False)
+    assert len(compare(again, report)) == len(report['results'])
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for the versioned query cache"""
+
+import time
+
+from src.fantasy_assistant.utils.cache import VersionedLRUCache
+
+
+def test_repeated_reads_between_picks_hit(assistant):
+    first = assistant.get_ai_recommendation()
+    misses = assistant.cache.misses
+
+    assert assistant.get_ai_recommendation() is first
+    assert assistant.get_best_available("RB", 5) == assistant.get_best_available(position="RB")[:5]
+    assert assistant.get_best_available(limit=5) == assistant.get_best_available(None, 5)
+    assert assistant.cache.misses == misses + 3  # RB/5, RB/10 and all/5
+    assert assistant.cache_stats()['hits'] >= 2
+
+
+def test_picks_and_reloads_invalidate(assistant):
+    before = assistant.get_ai_recommendation()
+    top = before['recommendations'][0]['player']['name']
+
+    assistant.draft_player(top)
+    after = assistant.get_ai_recommendation()
+    assert after is not before
+    assert top not in [r['player']['name'] for r in after['recommendations']]
+
+    assistant.load_player_data()  # Nothing changed, so cached results stay valid
+    assert assistant.get_ai_recommendation() is after
+
+    assistant.db.execute("UPDATE players SET content_hash = NULL WHERE name = 'Josh Allen'")
+    assert assistant.load_player_data().updated == ["Josh Allen"]
+    assert assistant.get_ai_recommendation() is not after
+
+
+def test_lru_is_bounded_and_versions_do_not_mix():
+    cache = VersionedLRUCache(maxsize=2)
+    for key in "abc":
+        cache.get_or_compute(key, 1, lambda: key.upper())
+
+    assert len(cache) == 2
+    assert cache.get_or_compute("a", 1, lambda: "recomputed") == "recomputed"
+    assert cache.get_or_compute("c", 2, lambda: "new version") == "new version"
+    assert cache.stats()['hits'] == 0
+
+
+def test_speculation_fills_cache_for_next_recommend(assistant):
+    assistant.draft_player("Ja'Marr Chase")
+    assert assistant.speculate().result(timeout=10) is True
+
+    misses = assistant.cache.misses
+    assistant.get_ai_recommendation()
+    assert assistant.cache.misses == misses
+
+
+def test_stale_speculation_is_dropped(assistant):
+    with assistant._lock:  # Hold the worker off while more picks land
+        running = assistant.speculate()
+        while not running.running():  # Worker is now waiting on the lock
+            time.sleep(0.001)
+        queued = assistant.speculate()
+        assistant.draft_player("Bijan Robinson")
+        latest = assistant.speculate()
+
+    assert queued.cancelled()
+    assert running.result(timeout=10) is False
+    assert latest.result(timeout=10) is True
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests for the shared database connection layer"""
+
+import threading
+
+import pytest
+
+from src.fantasy_assistant.models.database import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "draft.db"))
+    manager.execute("CREATE TABLE picks (id INTEGER PRIMARY KEY, name TEXT)")
+    yield manager
+    manager.close()
+
+
+def test_connection_reused_within_thread(db):
+    """One long-lived connection per thread, opened in WAL mode"""
+    assert db.connection is db.connection
+    assert db.fetchone("PRAGMA journal_mode")[0] == "wal"
+
+
+def test_each_thread_gets_its_own_connection(db):
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(db.connection))
+    worker.start()
+    worker.join()
+
+    assert seen[0] is not db.connection
+
+
+def test_transaction_commits_and_rolls_back(db):
+    with db.transaction():
+        db.execute("INSERT INTO picks (name) VALUES ('Ja''Marr Chase')")
+        with db.transaction():  # Nested scope joins the outer one
+            db.execute("INSERT INTO picks (name) VALUES ('Bijan Robinson')")
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.execute("INSERT INTO picks (name) VALUES ('Justin Jefferson')")
+            raise RuntimeError("abort")
+
+    assert not db.in_transaction
+    assert db.fetchone("SELECT COUNT(*) FROM picks")[0] == 2
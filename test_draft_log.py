@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for draft log replay"""
+
+import csv
+import json
+import time
+
+import pytest
+
+from draft_assistant import FantasyDraftAssistant
+from src.fantasy_assistant.models.draft_state import DraftState
+from src.fantasy_assistant.services.player_loader import PLAYER_COLUMNS
+
+POSITIONS = ["QB", "RB", "WR", "TE"]
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerows(rows)
+    return str(path)
+
+
+def test_csv_log_replays_in_schedule_order(assistant, tmp_path):
+    log = write_csv(tmp_path / "picks.csv", [["Round", "Pick", "Player"]] + [
+        [1, pick, name] for pick, name in enumerate(
+            ["Ja'Marr Chase", "jahmyr gibbs", "Justin Jefferson", "Bijan Robinson",
+             "Ashton Jeanty", "Saquon Barkley", "Christian McCaffrey", "CeeDee Lamb"], 1)
+    ])
+
+    report = assistant.import_draft_log(log)
+
+    assert (report.imported, report.skipped) == (8, 0)
+    assert assistant.state.overall_pick == 9
+    assert [e.player_name for e in assistant.state.user_roster.sorted_entries()] == ["CeeDee Lamb"]
+    assert not assistant.index.is_available(assistant.index.named("Jahmyr Gibbs")[0]['id'])
+    assert "Jahmyr Gibbs" not in [p['name'] for p in assistant.get_best_available(limit=20)]
+
+
+def test_replaying_a_longer_log_catches_up(assistant, tmp_path):
+    assistant.draft_player("Ja'Marr Chase")
+    log = tmp_path / "picks.jsonl"
+    log.write_text("".join(json.dumps({"pick_no": i, "metadata": {"first_name": first, "last_name": last}}) + "\n"
+                           for i, (first, last) in enumerate([("Ja'Marr", "Chase"), ("Jahmyr", "Gibbs")], 1)))
+
+    report = assistant.import_draft_log(str(log))
+
+    assert (report.imported, report.skipped) == (1, 1)
+    assert [p.player_name for p in assistant.state.picks] == ["Ja'Marr Chase", "Jahmyr Gibbs"]
+
+
+def test_bad_log_records_nothing(assistant, tmp_path):
+    log = write_csv(tmp_path / "picks.csv", [["Player"], ["Ja'Marr Chase"], ["Nobody Atall"]])
+
+    with pytest.raises(ValueError, match="Nobody Atall"):
+        assistant.import_draft_log(log)
+    assert assistant.state.picks == [] and assistant.state.overall_pick == 1
+
+    gap = write_csv(tmp_path / "gap.csv", [["Overall", "Player"], [1, "Ja'Marr Chase"], [3, "Jahmyr Gibbs"]])
+    with pytest.raises(ValueError, match="skips from pick 2 to 3"):
+        assistant.import_draft_log(gap)
+    assert assistant.index.is_available(assistant.index.named("Ja'Marr Chase")[0]['id'])
+
+
+def test_unnumbered_log_gives_every_entry_a_pick(assistant, tmp_path):
+    round_one = ["Ja'Marr Chase", "Jahmyr Gibbs", "Justin Jefferson", "Bijan Robinson",
+                 "Ashton Jeanty", "Saquon Barkley", "Christian McCaffrey", "CeeDee Lamb"]
+    assistant.draft_player("Ja'Marr Chase")
+    assistant.draft_player("Jahmyr Gibbs")
+    rows = [["Player"]] + [[name] for name in round_one]
+
+    rows[4] = ["Nobody Atall"]  # Unknown fourth pick
+    with pytest.raises(ValueError, match="Unknown players in draft log: Nobody Atall"):
+        assistant.import_draft_log(write_csv(tmp_path / "unknown.csv", rows))
+    assert assistant.state.overall_pick == 3
+
+    rows[4] = ["Jahmyr Gibbs"]  # Already on the board, yet still the fourth pick
+    with pytest.raises(ValueError, match="pick 4, Jahmyr Gibbs, is already on the board"):
+        assistant.import_draft_log(write_csv(tmp_path / "repeat.csv", rows))
+    assert assistant.state.overall_pick == 3
+
+    rows[4] = ["Bijan Robinson"]
+    report = assistant.import_draft_log(write_csv(tmp_path / "picks.csv", rows))
+    assert (report.imported, report.skipped) == (6, 2)
+    assert [p.player_name for p in assistant.state.picks] == round_one
+    assert [e.player_name for e in assistant.state.user_roster.sorted_entries()] == ["CeeDee Lamb"]
+
+
+def test_full_draft_imports_in_one_pass(tmp_path):
+    pool = write_csv(tmp_path / "pool.csv", [["Rank", "Player", "Pos", "Team", "Bye"]] + [
+        [i + 1, f"Player {i}", POSITIONS[i % 4], "DAL", 5 + i % 10] for i in range(300)])
+    log = write_csv(tmp_path / "draft.csv", [["Overall", "Player"]] + [[i + 1, f"Player {i}"] for i in range(192)])
+
+    assistant = FantasyDraftAssistant(str(tmp_path / "full.db"))
+    try:
+        assistant.load_player_data([pool])
+        assistant.set_draft_position(8)
+        started = time.perf_counter()
+        report = assistant.import_draft_log(log)
+        elapsed = time.perf_counter() - started
+
+        assert report.imported == 192 and elapsed < 0.5
+        assert len(assistant.state.user_roster.sorted_entries()) == 16
+        assert assistant.state.overall_pick == 193
+
+        reloaded = DraftState.load(assistant.db, async_writes=False)
+        assert [p.player_name for p in reloaded.picks] == [f"Player {i}" for i in range(192)]
+        assert (reloaded.current_round, reloaded.current_pick) == (17, 1)
+    finally:
+        assistant.close()
+
+
+def test_logged_team_tells_apart_players_sharing_a_name(assistant, tmp_path):
+    pool = [dict(zip(PLAYER_COLUMNS, row)) for row in assistant._builtin_players()]
+    pool.append({'name': "Josh Allen", 'position': "TE", 'team': "JAX", 'bye_week': 8})
+    assistant.load_player_data([pool])
+
+    vague = write_csv(tmp_path / "vague.csv", [["Player"], ["Josh Allen"]])
+    with pytest.raises(ValueError, match="Josh Allen could be any of"):
+        assistant.import_draft_log(vague)
+
+    log = tmp_path / "picks.json"
+    log.write_text(json.dumps([{"pick_no": 1, "metadata": {"first_name": "Josh", "last_name": "Allen",
+                                                           "team": "JAX", "position": "TE"}}]))
+    assert assistant.import_draft_log(str(log)).imported == 1
+    assert [(p.position, p.team) for p in assistant.state.picks] == [("TE", "JAX")]
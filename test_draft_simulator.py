@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for the Monte Carlo draft simulator"""
+
+import numpy as np
+
+from src.fantasy_assistant.services.draft_simulator import DraftSimulator
+
+
+def make_players(count):
+    return [{'name': f"Player {i}", 'adp': float(i), 'rank': i} for i in range(1, count + 1)]
+
+
+def test_availability_drops_as_more_opponents_pick():
+    simulator = DraftSimulator(make_players(60), min_sd=1.0, sd_ratio=0.1)
+    odds = simulator.availability([5, 15, 30], n_sims=4000, seed=7)
+
+    assert odds.shape == (60, 3)
+    assert np.all(np.diff(odds, axis=1) <= 0)  # Never more likely later
+    assert odds[0, 0] < 0.05  # ADP 1 is gone after five picks
+    assert odds[59, 2] > 0.95  # ADP 60 survives thirty picks
+
+
+def test_mock_draft_distributions_override_consensus_adp():
+    players = make_players(20)
+    faller = {"Player 1": (18.0, 1.0, 50)}  # Mocks take him much later
+    odds = DraftSimulator(players, faller).availability([5], n_sims=2000, seed=3)
+
+    assert odds[0, 0] > 0.95
+
+
+def test_process_pool_matches_inline_run():
+    simulator = DraftSimulator(make_players(40))
+    inline = simulator.availability([7, 17], n_sims=3000, seed=11, batch_size=1000)
+    pooled = simulator.availability([7, 17], n_sims=3000, seed=11, batch_size=1000, workers=2)
+
+    assert np.array_equal(inline, pooled)
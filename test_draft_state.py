@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for the in-memory draft state and its write-behind persistence"""
+
+import time
+
+from src.fantasy_assistant.models.draft_state import DraftState
+from src.fantasy_assistant.models.pick_schedule import PickSchedule
+from src.fantasy_assistant.services.player_loader import PLAYER_COLUMNS
+
+
+def test_picks_update_state_in_memory(assistant):
+    assistant.draft_player("Ja'Marr Chase", drafted_by_user=True)
+    assistant.draft_player("Bijan Robinson")
+
+    state = assistant.state
+    assert state.drafted == {assistant.index.named(name)[0]['id']
+                             for name in ["Ja'Marr Chase", "Bijan Robinson"]}
+    assert (state.current_pick, state.current_round) == (3, 1)
+    assert state.user_roster.position_counts() == {'WR': 1}
+    names = [p['name'] for p in assistant.get_best_available(limit=30)]
+    assert "Ja'Marr Chase" not in names and "Bijan Robinson" not in names
+
+
+def test_flushed_picks_reload_from_sqlite(assistant):
+    for name in ["Ja'Marr Chase", "Bijan Robinson", "Justin Jefferson"]:
+        assistant.draft_player(name, drafted_by_user=(name == "Justin Jefferson"))
+    assistant.state.flush()
+
+    reloaded = DraftState.load(assistant.db)
+    assert reloaded.drafted == assistant.state.drafted
+    assert reloaded.pointer() == assistant.state.pointer()
+    assert [e.player_name for e in reloaded.user_roster.entries] == ["Justin Jefferson"]
+
+
+def test_read_then_write_transaction_waits_for_the_writer(assistant):
+    assistant.draft_player("Ja'Marr Chase")
+    assistant.state.flush()  # The background writer is running
+
+    with assistant.db.transaction() as conn:
+        conn.execute("SELECT COUNT(*) FROM drafted_players").fetchone()
+        assistant.draft_player("Bijan Robinson")  # Queued while this transaction is open
+        time.sleep(0.2)  # Let the writer reach its own transaction
+        conn.execute("UPDATE draft_state SET snake_direction = snake_direction")
+    assistant.state.flush()
+
+    assert assistant.db.fetchone("SELECT COUNT(*) FROM drafted_players")[0] == 2
+
+
+def test_duplicate_pick_is_rejected(assistant):
+    assistant.draft_player("Ja'Marr Chase")
+    assistant.draft_player("Ja'Marr Chase")
+
+    assert len(assistant.state.picks) == 1
+    assert assistant.state.current_pick == 2
+
+
+def test_players_sharing_a_name_are_drafted_separately(assistant, capsys):
+    pool = [dict(zip(PLAYER_COLUMNS, row)) for row in assistant._builtin_players()]
+    pool.append({'name': "Josh Allen", 'position': "TE", 'team': "JAX", 'bye_week': 8,
+                 'consensus_rank': 120})
+    assistant.load_player_data([pool])
+    qb, te = (player['id'] for player in assistant.index.named("Josh Allen"))
+    capsys.readouterr()
+
+    assistant.draft_player("Josh Allen")  # Ambiguous: records nothing
+    assert "Josh Allen (QB BUF), Josh Allen (TE JAX)" in capsys.readouterr().out
+    assert assistant.complete_command("pick josh al") == ["pick Josh Allen (QB BUF)",
+                                                          "pick Josh Allen (TE JAX)"]
+
+    assistant.draft_player("Josh Allen (Jax)", drafted_by_user=True)
+    state = assistant.state
+    assert state.drafted == {te}
+    assert [entry.player_id for entry in state.user_roster.entries] == [te]
+    assert assistant.index.is_available(qb)
+    assert "Josh Allen" in [p['name'] for p in assistant.get_best_available('QB', limit=3)]
+    assert assistant.complete_command("pick josh al") == ["pick Josh Allen (QB BUF)"]
+
+    assistant.draft_player("Josh Allen")  # Only the QB is left
+    assert [pick.player_id for pick in state.picks] == [te, qb]
+    state.flush()
+    assert DraftState.load(assistant.db).drafted == {qb, te}
+
+
+def test_snake_schedule_tracks_turns():
+    schedule = PickSchedule(league_size=12, rounds=16, user_slot=8)
+
+    assert schedule.team_picks(8)[:3] == [8, 17, 32]
+    assert [schedule.slot_for_pick(o) for o in (12, 13, 24, 25)] == [12, 12, 1, 1]
+    assert schedule.label(29) == "3.05"
+    assert schedule.picks_until_next_turn(9) == 8
+    assert schedule.picks_until_next_turn(17) == 0
+    assert schedule.remaining_user_picks(180)[0] == 185
+    assert schedule.next_user_pick(193) is None
+
+
+def test_picks_follow_snake_order(assistant):
+    for player in assistant.get_best_available(limit=14):
+        assistant.draft_player(player['name'], drafted_by_user=(player['rank'] in (8, 17)))
+
+    state = assistant.state
+    assert (state.current_round, state.current_pick, state.overall_pick) == (2, 3, 15)
+    assert state.on_the_clock == 10  # 2.03 belongs to slot 10 going back up
+    assert [p.player_name for p in state.team_rosters[12]] == ["Brian Thomas Jr.", "Derrick Henry"]
+    assert assistant.get_ai_recommendation()['current_situation']['next_user_pick'] == 17
+
+
+def test_undo_and_redo_restore_board_and_pointer(assistant):
+    assistant.draft_player("Ja'Marr Chase")
+    assistant.draft_player("Bijan Robinson", drafted_by_user=True)
+
+    undone = assistant.undo()
+    assert undone.player_name == "Bijan Robinson"
+    assert (assistant.state.current_round, assistant.state.current_pick) == (1, 2)
+    assert assistant.state.user_roster.position_counts() == {}
+    assert "Bijan Robinson" in [p['name'] for p in assistant.get_best_available(limit=5)]
+
+    assert assistant.redo().player_name == "Bijan Robinson"
+    assert assistant.redo() is None
+    assert assistant.state.user_roster.position_counts() == {'RB': 1}
+    assert assistant.state.current_pick == 3
+
+    assistant.undo()
+    assistant.draft_player("Justin Jefferson")  # A new pick drops the redo stack
+    assert assistant.redo() is None
+
+
+def test_event_log_replays_from_latest_snapshot(assistant, monkeypatch):
+    monkeypatch.setattr(DraftState, "SNAPSHOT_INTERVAL", 3)
+    for name in ["Ja'Marr Chase", "Jahmyr Gibbs", "Justin Jefferson", "Bijan Robinson"]:
+        assistant.draft_player(name, drafted_by_user=(name == "Jahmyr Gibbs"))
+    assistant.undo()
+    assistant.undo()
+    assistant.redo()
+    assistant.state.flush()
+
+    events = assistant.db.fetchall("SELECT event FROM drafted_players ORDER BY id")
+    assert [e for (e,) in events] == ['pick'] * 4 + ['undo'] * 2 + ['pick']
+    assert assistant.db.fetchall("SELECT event_id FROM draft_snapshots") == [(3,), (6,)]
+    assert assistant.db.fetchall("SELECT player_name FROM user_roster") == [("Jahmyr Gibbs",)]
+
+    reloaded = DraftState.load(assistant.db)  # Snapshot at event 6 plus one redo
+    assert [p.player_name for p in reloaded.picks] == ["Ja'Marr Chase", "Jahmyr Gibbs", "Justin Jefferson"]
+    assert [p.player_name for p in reloaded.redo_stack] == ["Bijan Robinson"]
+    assert reloaded.pointer() == assistant.state.pointer()
+    assert reloaded.user_roster.position_counts() == {'RB': 1}
+
+    assistant.db.execute("DELETE FROM draft_snapshots")  # Full replay agrees
+    assert DraftState.load(assistant.db).picks == reloaded.picks
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for live draft sync against the stand-in pick feed"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.fantasy_assistant.services.draft_log import DraftLogEntry
+from src.fantasy_assistant.services.draft_sync import Backoff, DraftSync
+from src.fantasy_assistant.services.pick_feed_server import PickFeedServer
+
+PICKS = ["Ja'Marr Chase", "Bijan Robinson", "Justin Jefferson", "Saquon Barkley",
+         "Jahmyr Gibbs", "CeeDee Lamb"]
+
+
+@pytest.fixture
+def feed():
+    with PickFeedServer(DraftLogEntry(name) for name in PICKS) as server:
+        yield server
+
+
+def test_polls_apply_new_picks_over_one_connection(assistant, feed):
+    sync = DraftSync(assistant, feed.url, wait=0)
+
+    async def session():
+        counts = [await sync.poll_once()]
+        feed.advance(2)
+        counts.append(await sync.poll_once())
+        counts.append(await sync.poll_once())
+        feed.advance(3)
+        counts.append(await sync.poll_once())
+        return counts
+
+    assert asyncio.run(session()) == [0, 2, 0, 3]
+    assert [pick.player_name for pick in assistant.state.picks] == PICKS[:5]
+    assert sync.stats.not_modified == 2
+    assert sync.stats.connections == feed.connections == 1
+    assert feed.requests == 4
+
+
+def test_long_poll_returns_when_a_pick_lands(assistant, feed):
+    sync = DraftSync(assistant, feed.url, wait=5)
+    threading.Timer(0.2, feed.advance).start()
+
+    started = time.perf_counter()
+    assert asyncio.run(sync.poll_once()) == 1
+    assert time.perf_counter() - started < 4
+    assert assistant.state.is_drafted(assistant.index.named("Ja'Marr Chase")[0]['id'])
+
+
+def test_run_follows_a_replayed_draft_until_stopped(assistant, tmp_path):
+    with PickFeedServer((DraftLogEntry(name) for name in PICKS), interval=0.02) as feed:
+        sync = DraftSync(assistant, feed.url, wait=1, backoff=Backoff(min_interval=0.01))
+        sync.start()
+        deadline = time.monotonic() + 5
+        while len(assistant.state.picks) < len(PICKS) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        started = time.perf_counter()
+        sync.stop(timeout=5)
+
+        assert time.perf_counter() - started < 0.5  # The pending long poll is broken off
+        assert [pick.player_name for pick in assistant.state.picks] == PICKS
+        assert sync.stats.picks == len(PICKS)
+        assert sync.stats.errors == 0
+        assert feed.connections == 1
+
+
+def test_backoff_adapts_to_the_feed():
+    backoff = Backoff(min_interval=1.0, max_interval=4.0, growth=2.0, max_error_delay=8.0)
+    assert [backoff.on_idle() for _ in range(4)] == [2.0, 4.0, 4.0, 4.0]
+    assert backoff.on_picks() == 1.0
+    delays = [backoff.on_error() for _ in range(5)]
+    assert 1.0 <= delays[0] <= 2.0
+    assert all(4.0 <= delay <= 8.0 for delay in delays[2:])
+    assert backoff.on_idle() == 2.0
+
+
+def test_sync_command(assistant, feed, monkeypatch, capsys):
+    feed.advance(len(PICKS))
+    commands = iter([f"sync {feed.url}", "sync", "sync stop", "quit"])
+
+    def next_command(prompt=""):
+        command = next(commands)
+        if command == "sync":  # Let the first poll land
+            deadline = time.monotonic() + 5
+            while len(assistant.state.picks) < len(PICKS) and time.monotonic() < deadline:
+                time.sleep(0.02)
+        return command
+
+    monkeypatch.setattr("builtins.input", next_command)
+    assistant.run_interactive_draft()
+
+    output = capsys.readouterr().out
+    assert "Synced 6 pick(s)" in output
+    assert "Sync stopped: 6 picks synced" in output
+    assert len(assistant.state.picks) == len(PICKS)
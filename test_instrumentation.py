@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Tests for per-command instrumentation"""
+
+import json
+
+
+def test_disabled_by_default(assistant):
+    assistant.get_best_available()
+    assistant.draft_player("Ja'Marr Chase")
+
+    assert not assistant.instrumentation.enabled
+    assert assistant.instrumentation.stats() == {}
+    assert assistant.db._hooks is None
+
+
+def test_records_latency_queries_and_cache_hits(assistant):
+    assistant.instrumentation.enable()
+    assistant.get_ai_recommendation()
+    assistant.get_ai_recommendation()
+    assistant.load_player_data()
+    assistant.draft_player("Ja'Marr Chase")
+
+    stats = assistant.instrumentation.stats()
+    recommendation = stats['get_ai_recommendation']
+    assert recommendation['calls'] == 2
+    assert recommendation['cache_hit_rate'] > 0
+    assert recommendation['p50_ms'] <= recommendation['p99_ms'] <= recommendation['max_ms']
+    assert stats['load_player_data']['queries_per_call'] > 0
+    assert stats['draft_player']['calls'] == 1
+
+    with assistant.instrumentation.measure("scan"):
+        assistant.db.fetchall("SELECT * FROM players a CROSS JOIN players b")
+    assert assistant.instrumentation.stats()['scan']['sql_steps_per_call'] >= 1000
+
+    assistant.instrumentation.disable()
+    assistant.draft_player("Bijan Robinson")
+    assert assistant.instrumentation.stats()['draft_player']['calls'] == 1
+
+
+def test_trace_file_gets_one_line_per_measurement(assistant, tmp_path):
+    trace = tmp_path / "trace.jsonl"
+    assistant.instrumentation.enable(str(trace))
+    with assistant.instrumentation.measure("command:pick"):
+        assistant.draft_player("Ja'Marr Chase")
+    assistant.instrumentation.disable()
+
+    records = [json.loads(line) for line in trace.read_text().splitlines()]
+    assert [record['command'] for record in records] == ["draft_player", "command:pick"]
+    assert records[1]['ms'] >= records[0]['ms']
+    assert set(records[0]) == {'ts', 'command', 'ms', 'queries', 'sql_steps', 'cache_hits',
+                               'cache_misses'}
+
+
+def test_stats_command(assistant, monkeypatch, capsys):
+    commands = iter(["stats on", "best", "recommend", "pick bijan robinson", "stats", "quit"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(commands))
+    assistant.run_interactive_draft()
+
+    output = capsys.readouterr().out
+    assert "SESSION STATS" in output
+    stats = assistant.instrumentation.stats()
+    assert {'command:best', 'command:recommend', 'command:pick', 'get_best_available',
+            'get_ai_recommendation', 'draft_player'} <= set(stats)
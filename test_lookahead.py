@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Tests for the multi-pick lookahead planner"""
+
+import numpy as np
+import pytest
+
+from src.fantasy_assistant.services.lookahead import LookaheadPlanner, lineup_points
+
+
+def test_lineup_points_fills_starters_then_flex():
+    values = {'QB': [20.0], 'RB': [15.0, 12.0, 9.0], 'WR': [14.0, 11.0, 10.0, 8.0], 'TE': [7.0]}
+    # Starters 20 + 15 + 12 + 14 + 11 + 10 + 7, flex 9, bench 8 at 10%
+    assert lineup_points(values) == pytest.approx(98.0 + 0.8)
+
+
+def test_takes_scarce_position_now_and_deep_position_later():
+    players = [
+        {'id': 1, 'name': "RB A", 'position': 'RB'},
+        {'id': 2, 'name': "RB B", 'position': 'RB'},
+        {'id': 3, 'name': "WR A", 'position': 'WR'},
+        {'id': 4, 'name': "WR B", 'position': 'WR'},
+    ]
+    projections = {1: 16.0, 2: 8.0, 3: 15.0, 4: 14.8}
+    # Turn 0 is on the clock; by the next turn RB A is gone but a WR remains
+    availability = np.array([[1.0, 0.0], [1.0, 1.0], [1.0, 0.1], [1.0, 0.95]])
+    planner = LookaheadPlanner(players, projections, availability, [8, 17], ["1.08", "2.05"])
+
+    plan = planner.plan(horizon=2)
+    assert [step.position for step in plan['steps']] == ['RB', 'WR']
+    assert plan['steps'][0].player['name'] == "RB A"
+    assert plan['summary'].startswith("RB now (RB A), WR likely available at 2.05")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for mock draft ingestion"""
+
+import numpy as np
+import pytest
+
+from src.fantasy_assistant.models.adp_stats import load_adp_stats
+from src.fantasy_assistant.models.database import DatabaseManager
+from src.fantasy_assistant.models.migrations import migrate
+from src.fantasy_assistant.services.draft_simulator import load_adp_distributions
+from src.fantasy_assistant.services.mock_draft_loader import ingest_mock_drafts, parse_mock_draft
+
+ROUNDS_MD = """# Example 2025 12-Team PPR Mock Draft Results
+*Source: Example Site (August 2025)*
+
+## Drafters
+1. Someone Else
+
+## First Round
+1. **Ja'Marr Chase** (WR, Bengals)
+2. **[Player]** - Unknown drafter
+3. **Bijan Robinson** (RB, Falcons) - Note
+
+## Round 2
+1. **Derrick Henry** (RB, Ravens)
+"""
+
+TABLE_MD = """# Comparison
+
+| Pick | Site ADP | Bye | Expert (Aug 1) | Bye |
+|------|----------|-----|----------------|-----|
+| 1 | **Ja'Marr Chase** (WR, CIN) | 10 | **Jahmyr Gibbs** (RB, DET) | 8 |
+| 2 | **Bijan Robinson** (RB, ATL) | 5 | *[Unknown]* | - |
+
+### Site ADP Round 2
+13. Derrick Henry (RB, BAL)
+"""
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "mocks.db"))
+    with open("database_schema.sql") as f:
+        manager.connection.executescript(f.read())
+    migrate(manager)
+    yield manager
+    manager.close()
+
+
+def test_numbered_lists_become_overall_picks():
+    [draft] = parse_mock_draft(ROUNDS_MD.splitlines(), "example")
+
+    assert (draft.source_name, draft.date) == ("Example 2025 12-Team PPR", "August 2025")
+    assert [(p.pick_number, p.round, p.player_name, p.team) for p in draft.picks] == [
+        (1, 1, "Ja'Marr Chase", "CIN"),
+        (3, 1, "Bijan Robinson", "ATL"),
+        (13, 2, "Derrick Henry", "BAL"),
+    ]
+
+
+def test_table_columns_become_separate_drafts():
+    site, expert = parse_mock_draft(TABLE_MD.splitlines(), "comparison")
+
+    assert site.source_name == "Site ADP"
+    assert [(p.pick_number, p.player_name) for p in site.picks] == [
+        (1, "Ja'Marr Chase"), (2, "Bijan Robinson"), (13, "Derrick Henry")]
+    assert expert.source_name == "Expert"
+    assert [p.player_name for p in expert.picks] == ["Jahmyr Gibbs"]
+
+
+def test_reingesting_unchanged_files_is_skipped(db, tmp_path):
+    (tmp_path / "a.md").write_text(ROUNDS_MD)
+    (tmp_path / "b.md").write_text(TABLE_MD)
+
+    first = ingest_mock_drafts(db, [str(tmp_path)], batch_size=2)
+    assert (first.files, first.skipped, first.sources, first.picks) == (2, 0, 3, 7)
+
+    again = ingest_mock_drafts(db, [str(tmp_path / "*.md")])
+    assert (again.files, again.skipped, again.picks) == (2, 2, 0)
+    assert db.fetchone("SELECT COUNT(*) FROM mock_draft_picks")[0] == 7
+
+    mean, _, count = load_adp_distributions(db)["Derrick Henry"]
+    assert (mean, count) == (13.0, 2)
+
+
+def test_shipped_mock_drafts_load(db):
+    report = ingest_mock_drafts(db, ["mock_drafts"])
+
+    assert report.sources >= 5
+    picks = db.fetchall("SELECT pick_number, player_name FROM mock_draft_picks")
+    assert (1, "Ja'Marr Chase") in picks
+    assert all("[" not in name for _, name in picks)
+
+
+def test_adp_stats_update_incrementally(db, tmp_path):
+    drafts = [
+        "# Draft %d\n\n## Round 1\n%d. **Derrick Henry** (RB, Ravens)\n" % (i, pick)
+        for i, pick in enumerate([3, 7, 4, 12, 9, 5])
+    ]
+    for i, text in enumerate(drafts):
+        (tmp_path / f"{i}.md").write_text(text)
+    ingest_mock_drafts(db, [str(tmp_path / f"{i}.md") for i in range(3)])
+    ingest_mock_drafts(db, [str(tmp_path)])
+
+    picks = np.array([3, 7, 4, 12, 9, 5])
+    overall = load_adp_stats(db)["Derrick Henry"]
+    assert overall.picks == 6
+    assert overall.mean == pytest.approx(picks.mean())
+    assert overall.sd == pytest.approx(picks.std())
+    assert (overall.min_pick, overall.max_pick, overall.p50) == (3, 12, 5.0)
+    assert load_adp_stats(db, "Draft 3")["Derrick Henry"].mean == 12.0
+
+
+def test_overall_source_name_is_reserved(db, tmp_path):
+    (tmp_path / "star.md").write_text("| Pick | * |\n|---|---|\n| 40 | Derrick Henry (RB, BAL) |\n")
+    ingest_mock_drafts(db, ["mock_drafts"])
+    overall = load_adp_stats(db)["Derrick Henry"]
+
+    with pytest.raises(ValueError, match="reserved"):
+        ingest_mock_drafts(db, [str(tmp_path / "star.md")])
+    assert load_adp_stats(db)["Derrick Henry"] == overall
+    assert db.fetchone("SELECT COUNT(*) FROM mock_draft_sources WHERE source_name = '*'")[0] == 0
+
+
+def test_recommendations_favor_players_falling_past_mock_adp(assistant, tmp_path):
+    (tmp_path / "mock.md").write_text("# Mock\n\n## Round 1\n1. **Derrick Henry** (RB, Ravens)\n")
+    assistant.load_mock_drafts([str(tmp_path / "mock.md")])
+    for name in ["Ja'Marr Chase", "Jahmyr Gibbs", "Justin Jefferson", "Bijan Robinson"]:
+        assistant.draft_player(name)
+
+    needs = {'RB': 2, 'WR': 2}
+    vector = assistant.recommender.scores(1, needs, overall_pick=5)
+    expected = assistant.recommender.scores(1, needs).copy()
+    henry = [p['name'] for p in assistant.recommender.players].index("Derrick Henry")
+    expected[henry] *= 1.15  # Mock ADP 1.0 (sd 0) is behind pick 5; no one else was mocked
+    assert list(vector) == pytest.approx(list(expected))
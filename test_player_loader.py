@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Tests for bulk player pool loading"""
+
+import csv
+import json
+import time
+
+import pytest
+
+from src.fantasy_assistant.models.database import DatabaseManager
+from src.fantasy_assistant.models.migrations import MIGRATIONS, migrate, schema_version
+from src.fantasy_assistant.services.player_loader import load_players, parse_markdown
+
+POSITIONS = ["QB", "RB", "WR", "TE"]
+
+
+def write_pool(tmp_path, count):
+    """Split a synthetic pool across a CSV ranking and a JSONL projection file"""
+    csv_path, jsonl_path = tmp_path / "ranks.csv", tmp_path / "projections.jsonl"
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Rank", "Player", "Pos", "Team", "Bye", "ADP"])
+        for i in range(count):
+            writer.writerow([i + 1, f"Player {i}", POSITIONS[i % 4], "DAL", 5 + i % 10, i + 1.5])
+    with open(jsonl_path, "w") as f:
+        for i in range(count):
+            f.write(json.dumps({"name": f"Player {i}", "ppg": 20 - i / count, "handcuff": None}) + "\n")
+    return [str(csv_path), str(jsonl_path)]
+
+
+def test_markdown_tables_merge_across_files(assistant):
+    report = load_players(assistant.db, ["rankings/consensus_ppr_rankings.md",
+                                         "rankings/position_guides_with_byes.md"])
+
+    gibbs = assistant.db.fetchone("""
+        SELECT position, team, bye_week, consensus_rank, handcuff FROM players WHERE name = ?
+    """, ("Jahmyr Gibbs",))
+    assert gibbs == ("RB", "DET", 8, 2, "David Montgomery")  # Rankings first, guide fills gaps
+    # Position tables rank within the position, so they never set the overall rank
+    assert assistant.db.fetchone("SELECT consensus_rank FROM players WHERE name = 'Josh Allen'") == (None,)
+    assert report.players == assistant.db.fetchone("SELECT COUNT(*) FROM players")[0]
+    assert report.skipped > 0  # Position table entries with no bye week anywhere
+
+
+def test_large_pool_loads_quickly_in_one_pass(assistant, tmp_path):
+    sources = write_pool(tmp_path, 5000)
+    batches = []
+
+    started = time.perf_counter()
+    report = load_players(assistant.db, sources, progress=lambda rows, _: batches.append(rows))
+    elapsed = time.perf_counter() - started
+
+    assert (report.rows_read, report.players, report.skipped) == (10000, 5000, 0)
+    assert batches == [2000, 4000, 6000, 8000, 10000]
+    assert elapsed < 1.0
+    row = assistant.db.fetchone("SELECT consensus_rank, ppg_projection, injury_status FROM players "
+                                "WHERE name = 'Player 42'")
+    assert row == (43, 20 - 42 / 5000, "Healthy")
+    indexes = {name for (name,) in assistant.db.fetchall(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'players'")}
+    assert "idx_players_consensus_rank" in indexes
+
+
+def test_assistant_loads_rankings_files(assistant, tmp_path):
+    assistant.load_player_data(write_pool(tmp_path, 50))
+
+    assert [p['name'] for p in assistant.get_best_available(limit=2)] == ["Player 0", "Player 1"]
+
+
+def test_unknown_source_type_is_rejected(assistant):
+    with pytest.raises(ValueError):
+        load_players(assistant.db, ["players.xlsx"])
+    assert list(parse_markdown("rankings/consensus_ppr_rankings.md"))[0]['name'] == "Ja'Marr Chase"
+
+
+def test_reload_rewrites_only_changed_players(assistant, tmp_path):
+    sources = write_pool(tmp_path, 200)
+    load_players(assistant.db, sources)
+    assistant.db.execute("UPDATE players SET updated_at = '2000-01-01'")
+
+    rows = open(sources[0]).read().splitlines()
+    rows[1] = rows[1].replace(",1.5", ",3.5")  # Player 0's ADP moves
+    rows.append("201,Player New,WR,DAL,7,201.5")
+    del rows[5]  # Player 4 drops out of the rankings
+    with open(sources[0], "w") as f:
+        f.write("\n".join(rows) + "\n")
+    changes = load_players(assistant.db, sources).changes
+
+    assert (changes.added, changes.updated, changes.removed) == (["Player New"], ["Player 0"], ["Player 4"])
+    assert changes.unchanged == 198
+    touched = assistant.db.fetchall("SELECT name FROM players WHERE updated_at != '2000-01-01' ORDER BY name")
+    assert touched == [("Player 0",), ("Player New",)]
+    assert assistant.db.fetchone("SELECT adp FROM players WHERE name = 'Player 0'") == (3.5,)
+
+
+def test_players_may_share_a_name(assistant):
+    assert schema_version(assistant.db) == MIGRATIONS[-1][0]
+    pool = [{"name": "Josh Allen", "position": "QB", "team": "BUF", "bye_week": 7},
+            {"name": "Josh Allen", "position": "LB", "team": "JAX", "bye_week": 8},
+            {"name": "Josh Allen", "team": "BUF", "ppg_projection": 24.5}]  # Fills in the QB
+    changes = load_players(assistant.db, [pool]).changes
+    rows = assistant.db.fetchall("SELECT id, position, team, ppg_projection FROM players "
+                                 "WHERE name = 'Josh Allen' ORDER BY id")
+    assert [row[1:] for row in rows] == [("QB", "BUF", 24.5), ("LB", "JAX", None)]
+    assert (changes.updated_ids, changes.added_ids) == ([rows[0][0]], [rows[1][0]])  # QB is built in
+
+    pool[1]["team"] = "CLE"  # A trade keeps the player's id
+    changes = load_players(assistant.db, [pool]).changes
+    assert (changes.added, changes.removed, changes.updated_ids) == ([], [], [rows[1][0]])
+    assert assistant.db.fetchone("SELECT team FROM players WHERE id = ?", (rows[1][0],)) == ("CLE",)
+
+
+def test_migrations_keep_same_name_players(tmp_path):
+    db = DatabaseManager(str(tmp_path / "old.db"))
+    with open("database_schema.sql") as f:
+        db.connection.executescript(f.read())
+    db.executemany("INSERT INTO players (name, position, team, bye_week) VALUES (?, ?, ?, ?)",
+                   [("Josh Allen", "QB", "BUF", 7), ("Josh Allen", "LB", "JAX", 8)])
+
+    migrate(db)
+    assert db.fetchone("SELECT COUNT(*) FROM players WHERE name = 'Josh Allen'") == (2,)
+    assert db.fetchone("SELECT 1 FROM sqlite_master WHERE name = 'idx_players_identity'") == (1,)
+    db.close()
+
+
+def rewrite_ranks(path, edit):
+    rows = open(path).read().splitlines()
+    edit(rows)
+    with open(path, "w") as f:
+        f.write("\n".join(rows) + "\n")
+
+
+def test_one_player_update_keeps_other_lookups(assistant, tmp_path):
+    sources = write_pool(tmp_path, 50)
+    assistant.load_player_data(sources)
+    index, search, recommender = assistant.index, assistant.search, assistant.recommender
+    kept, kept_view = index.named("Player 1")[0], search.find_player("Player 1")
+
+    rewrite_ranks(sources[0], lambda rows: rows.__setitem__(1, rows[1].replace(",1.5", ",3.5")))
+    assert assistant.load_player_data(sources).updated == ["Player 0"]
+
+    assert (assistant.index, assistant.search, assistant.recommender) == (index, search, recommender)
+    assert index.named("Player 1")[0] is kept
+    assert search.find_player("Player 1") is kept_view
+    assert index.named("Player 0")[0]['adp'] == search.find_player("Player 0").adp == 3.5
+    assert recommender.players == index.players()
+
+
+def test_patched_lookups_match_a_fresh_build(assistant, tmp_path):
+    from src.fantasy_assistant.models.availability import AvailabilityIndex
+    from src.fantasy_assistant.services.ai_recommender import AIRecommender
+
+    sources = write_pool(tmp_path, 50)
+    assistant.load_player_data(sources)
+    assistant.draft_player("Player 2")
+    assistant.get_ai_recommendation(), assistant.search  # Build everything before the reload
+
+    def edit(rows):
+        rows[3] = rows[3].replace("3,", "60,", 1)  # Player 2 falls to the back
+        rows.append("1,Player New,WR,DAL,7,1.2")  # Ties with the number one
+        del rows[5]  # Player 4 drops out
+    rewrite_ranks(sources[0], edit)
+    changes = assistant.load_player_data(sources, remove_missing=True)
+    assert (changes.added, changes.updated, changes.removed) == (["Player New"], ["Player 2"], ["Player 4"])
+
+    fresh = AvailabilityIndex.from_database(assistant.db, assistant.state.drafted)
+    assert assistant.index.players() == fresh.players()
+    assert assistant.index.top(limit=60) == fresh.top(limit=60)
+    assert assistant.index.top("WR", limit=60) == fresh.top("WR", limit=60)
+    assert [p.name for p in assistant.search.get_available_players()] == [
+        p['name'] for p in fresh.top(limit=60)]
+    assert "Player 4" not in [p.name for p in assistant.search.players]
+    assert assistant.search.autocomplete("player n") == ["Player New"]
+    needs = {"RB": 2, "WR": 2}
+    assert assistant.recommender.top(3, needs, k=10) == AIRecommender(
+        fresh.players(), assistant.state.drafted).top(3, needs, k=10)
+
+
+def test_reload_keeps_drafted_players(assistant, tmp_path):
+    sources = write_pool(tmp_path, 50)
+    assistant.load_player_data(sources)
+    assistant.draft_player("Player 3")
+    drafted = assistant.index.named("Player 3")[0]['id']
+    full = [open(path).read() for path in sources]
+
+    rewrite_ranks(sources[0], lambda rows: rows.remove(rows[4]))
+    rewrite_ranks(sources[1], lambda rows: rows.remove(rows[3]))
+    assert not assistant.load_player_data(sources).removed  # A draft is in progress
+    assert not load_players(assistant.db, sources, remove_missing=True).changes.removed
+
+    for path, text in zip(sources, full):
+        with open(path, "w") as f:
+            f.write(text)
+    assistant.load_player_data(sources)
+    assert assistant.index.named("Player 3")[0]['id'] == drafted
+    assert drafted in assistant.state.drafted
+    assert not assistant.index.is_available(drafted)
+    assert assistant.db.fetchone("SELECT player_id FROM drafted_players")[0] == drafted
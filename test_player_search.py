@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for player search indexes"""
+
+import itertools
+from difflib import SequenceMatcher, get_close_matches
+
+import pytest
+
+from src.fantasy_assistant.models.player import Player
+from src.fantasy_assistant.utils.player_search import PlayerSearch
+
+FIRST = ["Ja'Marr", "Justin", "CeeDee", "Malik", "Puka", "Amon-Ra", "Brian", "Nico",
+         "Derrick", "Alvin", "Breece", "Josh", "Lamar", "Travis", "Mark", "Sam",
+         "Trey", "De'Von", "Tyreek", "Mike", "George", "Kyle", "David", "Evan"]
+LAST = ["Chase", "Jefferson", "Lamb", "Nabers", "Nacua", "St. Brown", "Thomas Jr.",
+        "Collins", "Henry", "Kamara", "Hall", "Allen", "Jackson", "Kelce", "Andrews",
+        "LaPorta", "McBride", "Achane", "Hill", "Evans", "Kittle", "Pitts", "Njoku",
+        "Engram", "Robinson"]
+
+
+@pytest.fixture(scope="module")
+def search():
+    players = [
+        Player(id=i, name=f"{first} {last}", position="WR", team="DAL",
+               bye_week=i % 14 + 5, consensus_rank=i + 1)
+        for i, (first, last) in enumerate(itertools.product(FIRST, LAST))
+    ]
+    return PlayerSearch(players)
+
+
+def reference_suggestions(search, term, limit=5, min_similarity=0.6):
+    """The difflib scan get_suggestions used to run"""
+    term = term.strip().lower()
+    names = get_close_matches(term, search._name_map.keys(), n=limit * 2, cutoff=min_similarity)
+    scored = [(SequenceMatcher(None, term, name).ratio(), search._name_map[name]) for name in names]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [player for _, player in scored[:limit]]
+
+
+@pytest.mark.parametrize("term", ["jamar chase", "justin jeferson", "ceedee lam", "kelce",
+                                  "tryeek hill", "amon ra st brown", "nico colins", "xyz",
+                                  "lamb", "mk"])
+def test_suggestions_match_difflib_scan(search, term):
+    assert search.get_suggestions(term) == reference_suggestions(search, term)
+
+
+def test_find_player_tolerates_typos(search):
+    assert search.find_player("Ja'Marr Chase").name == "Ja'Marr Chase"
+    assert search.find_player("jamarr chase").name == "Ja'Marr Chase"
+    assert search.find_player("Travis Kelcee").name == "Travis Kelce"
+
+
+def reference_autocomplete(search, partial):
+    """Every distinct player the old startswith scan over the name map returned"""
+    partial = partial.lower().strip()
+    return {p.name for name, p in search._name_map.items() if name.startswith(partial)}
+
+
+@pytest.mark.parametrize("partial", ["ja", "jus", "ceedee l", "kel", "st", "zz"])
+def test_autocomplete_returns_best_ranked_prefix_matches(search, partial):
+    expected = sorted(reference_autocomplete(search, partial),
+                      key=lambda name: search.find_player(name).consensus_rank)
+    assert search.autocomplete(partial, limit=8) == expected[:8]
+
+
+def test_autocomplete_skips_drafted_players(search):
+    top = search.autocomplete("justin", limit=3)
+    assert search.autocomplete("justin", limit=2, is_drafted=lambda player: player.name == top[0]) == top[1:]
+
+    player = search.find_player(top[0])
+    player.is_drafted = True
+    try:
+        assert search.autocomplete("justin", limit=2) == top[1:]
+    finally:
+        player.is_drafted = False
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for the columnar player table and its Player-compatible rows"""
+
+import random
+
+import pytest
+
+from src.fantasy_assistant.models.player import Player
+from src.fantasy_assistant.models.player_table import PlayerTable
+from src.fantasy_assistant.utils.player_search import PlayerSearch
+
+TEAMS = ["CIN", "MIN", "DAL", "NYG", "LAR", "DET", "KC", "BAL"]
+STATUSES = ["Healthy", "Healthy", "Healthy", "Questionable", "Out"]
+
+
+def make_players(count=300, seed=5):
+    rng = random.Random(seed)
+    players = []
+    for i in range(count):
+        players.append(Player(
+            id=i + 1,
+            name=f"{rng.choice(['Jay', 'Sam', 'Max', 'Ty'])} Player{i}",
+            position=rng.choice(["QB", "RB", "WR", "TE", "K", "DEF"]),
+            team=rng.choice(TEAMS),
+            bye_week=rng.randint(5, 14),
+            consensus_rank=rng.choice([None, rng.randint(1, 250)]),
+            adp=rng.choice([None, round(rng.uniform(1, 200), 1)]),
+            ppg_projection=rng.choice([None, round(rng.uniform(2, 25), 2)]),
+            target_share=rng.choice([None, round(rng.uniform(0, 0.3), 3)]),
+            receptions_2024=rng.choice([None, rng.randint(0, 120)]),
+            injury_status=rng.choice(STATUSES),
+            notes=rng.choice([None, "Note"]),
+            is_drafted=rng.random() < 0.2,
+        ))
+    return players
+
+
+@pytest.fixture
+def players():
+    return make_players()
+
+
+def test_rows_behave_like_players(players):
+    table = PlayerTable.from_players(players)
+
+    for player, row in zip(players, table):
+        assert row.to_dict() == player.to_dict()
+        assert (row.is_available, row.is_injured) == (player.is_available, player.is_injured)
+        assert (str(row), repr(row)) == (str(player), repr(player))
+    assert table[3] is table[3]
+
+
+def test_row_assignment_writes_through(players):
+    table = PlayerTable.from_players(players)
+    row = table[0]
+
+    row.is_drafted = True
+    row.injury_status = "Out"
+    assert table.drafted[0] and not table.available_mask()[0]
+    with pytest.raises(AttributeError):
+        row.name = "Someone Else"
+
+
+def test_invalid_columns_are_rejected():
+    with pytest.raises(ValueError):
+        PlayerTable([{'name': "A B", 'position': "WR", 'team': "DAL", 'bye_week': 20}])
+
+
+@pytest.mark.parametrize("sort_by", ["rank", "adp", "name", "position"])
+def test_available_players_match_list_sort(players, sort_by):
+    keys = {
+        "rank": lambda p: p.consensus_rank or 999,
+        "adp": lambda p: p.adp or 999,
+        "name": lambda p: p.name,
+        "position": lambda p: (p.position.value, p.consensus_rank or 999),
+    }
+    expected = sorted((p for p in players if p.is_available), key=keys[sort_by])
+
+    results = PlayerSearch(players).get_available_players(sort_by)
+    assert [p.name for p in results] == [p.name for p in expected]
+
+
+def test_filters_match_list_filters(players):
+    search = PlayerSearch(players)
+    expected = sorted(
+        (p for p in players if "jay" in p.name.lower() and p.position.value == "WR"
+         and p.bye_week <= 10 and not p.is_injured and p.is_available),
+        key=lambda p: p.consensus_rank or 999,
+    )
+
+    results = search.search_with_filters("JAY", "wr", max_bye_week=10, exclude_injured=True, limit=500)
+    assert [p.name for p in results] == [p.name for p in expected]
+    assert [p.name for p in search.search_by_position("TE", limit=5)] == \
+        [p.name for p in sorted((p for p in players if p.position.value == "TE" and p.is_available),
+                                key=lambda p: p.consensus_rank or 999)][:5]
+    assert search.search_by_position("XX") == []
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for the binary player pool snapshot"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import draft_assistant
+from draft_assistant import FantasyDraftAssistant
+from src.fantasy_assistant.models.availability import AvailabilityIndex
+from src.fantasy_assistant.models.pool_snapshot import PoolSnapshot, pool_token, write_pool_snapshot
+
+
+def test_snapshot_round_trip(assistant, tmp_path):
+    rows = AvailabilityIndex.pool_rows(assistant.db)
+    path = str(tmp_path / "pool.bin")
+    write_pool_snapshot(path, rows, "token")
+
+    snapshot = PoolSnapshot.open(path, "token")
+    assert len(snapshot) == len(rows)
+    assert snapshot.rows() == rows
+    assert list(snapshot.column('id')) == [row['id'] for row in rows]
+
+
+def test_stale_snapshot_is_ignored(assistant, tmp_path):
+    path = str(tmp_path / "pool.bin")
+    write_pool_snapshot(path, AvailabilityIndex.pool_rows(assistant.db), "old")
+
+    assert PoolSnapshot.open(path, "new") is None
+    assert PoolSnapshot.open(str(tmp_path / "missing.bin")) is None
+
+
+def test_assistant_starts_from_snapshot(assistant):
+    assert os.path.exists(assistant.snapshot_path)
+    expected = AvailabilityIndex.from_database(assistant.db).players()
+    assistant.draft_player("Ja'Marr Chase")
+    assistant.close()
+
+    reopened = FantasyDraftAssistant(assistant.db.db_path)
+    try:
+        assert reopened._snapshot is not None
+        assert reopened._snapshot.token == pool_token(reopened.db)
+        assert reopened.has_players()
+        assert reopened.index.players() == expected
+        assert not reopened.index.is_available(reopened.index.named("Ja'Marr Chase")[0]['id'])
+        assert reopened.search.find_player("jamarr chase").name == "Ja'Marr Chase"
+        assert reopened.search.find_player("Bijan Robinson").is_available
+    finally:
+        reopened.close()
+
+
+def test_import_defers_heavy_modules():
+    code = "import sys, draft_assistant; print(sorted({'numpy', 'requests'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    assert output.strip() == "[]"
+
+
+@pytest.mark.parametrize("damage", ["delete", "corrupt", "stale"])
+def test_startup_rebuilds_a_bad_snapshot(assistant, damage):
+    path, expected = assistant.snapshot_path, assistant.index.players()
+    rows = AvailabilityIndex.pool_rows(assistant.db)
+    assistant.close()
+    if damage == "delete":
+        os.remove(path)
+    elif damage == "corrupt":
+        with open(path, "r+b") as f:
+            f.write(b"garbage!")
+    else:
+        write_pool_snapshot(path, rows[:3], "old")
+
+    restarted = FantasyDraftAssistant(assistant.db.db_path)
+    try:
+        assert restarted._snapshot is not None
+        assert PoolSnapshot.open(path, pool_token(restarted.db)).rows() == rows
+        assert restarted.index.players() == expected
+    finally:
+        restarted.close()
+
+
+def test_close_waits_for_column_views(assistant):
+    snapshot = PoolSnapshot.open(assistant.snapshot_path)
+    ids = snapshot.array('id')
+    with pytest.raises(BufferError):
+        snapshot.close()
+    assert snapshot.strings()  # Still mapped
+
+    del ids
+    snapshot.close()
+    snapshot.close()
+    assert snapshot._buffer.closed
+
+
+def test_reload_unmaps_the_snapshot_before_replacing_it(assistant, monkeypatch):
+    assistant.close()
+    restarted = FantasyDraftAssistant(assistant.db.db_path)
+    try:
+        old = restarted._snapshot
+        assert restarted.search.find_player("Bijan Robinson").is_available  # Built over the mapping
+
+        write = draft_assistant.write_pool_snapshot
+
+        def replace_unmapped(path, rows, token):
+            assert old._buffer.closed  # Windows cannot replace a mapped file
+            return write(path, rows, token)
+        monkeypatch.setattr(draft_assistant, "write_pool_snapshot", replace_unmapped)
+        restarted.db.execute("UPDATE players SET content_hash = 'stale' WHERE name = 'Bijan Robinson'")
+        assert restarted.load_player_data().updated == ["Bijan Robinson"]
+
+        assert restarted._snapshot is not old
+        assert restarted._snapshot.token == pool_token(restarted.db)
+        assert restarted.search.find_player("Bijan Robinson").is_available
+    finally:
+        restarted.close()
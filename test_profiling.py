@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for session profiling"""
+
+import pstats
+import time
+
+from src.fantasy_assistant.utils.profiling import SAMPLE_INTERVAL, SessionProfiler
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def outer():
+    busy(0.05)
+    inner()
+
+
+def inner():
+    busy(0.05)
+
+
+def test_sampler_records_whole_stacks(tmp_path):
+    profiler = SessionProfiler(str(tmp_path / "unit"))
+    profiler.start()
+    with profiler.profile():
+        outer()
+    outer()  # outside a command: not sampled
+    profiler.stop()
+
+    samples = profiler.sampler.samples
+    assert any(stack.endswith("test_profiling:outer;test_profiling:inner;test_profiling:busy")
+               for stack in samples)
+    assert any(stack.endswith("test_profiling:outer;test_profiling:busy") for stack in samples)
+    assert sum(samples.values()) < 0.1 / SAMPLE_INTERVAL * 1.5
+    assert profiler.write() == (str(tmp_path / "unit.pstats"), str(tmp_path / "unit.collapsed"))
+
+
+def test_sampler_sleeps_between_commands():
+    profiler = SessionProfiler()
+    profiler.start()
+    with profiler.profile():
+        busy(0.02)
+    wakeups = profiler.sampler.wakeups
+    time.sleep(0.1)  # Waiting at the prompt
+    assert profiler.sampler.wakeups <= wakeups + 1
+    with profiler.profile():
+        busy(0.02)
+    profiler.stop()
+    assert profiler.sampler.wakeups > wakeups + 1
+
+    wakeups = profiler.sampler.wakeups
+    profiler.start()  # Restarts idle
+    time.sleep(0.05)
+    profiler.stop()
+    assert profiler.sampler.wakeups == wakeups
+
+
+def test_profile_command_writes_session_profile(assistant, tmp_path, monkeypatch, capsys):
+    base = tmp_path / "session"
+    commands = iter([f"profile on {base}", "best", "recommend", "odds", "pick bijan robinson", "profile",
+                     "profile off", "best", "quit"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(commands))
+    assistant.run_interactive_draft()
+
+    output = capsys.readouterr().out
+    assert "HOTSPOTS (4 profiled commands)" in output
+    assert assistant.profiler.commands == 4
+
+    stats = pstats.Stats(str(base) + ".pstats")
+    names = {name for _, _, name in stats.stats}
+    assert {"_dispatch", "get_ai_recommendation", "draft_player"} <= names
+
+    lines = (tmp_path / "session.collapsed").read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("draft_assistant:_dispatch;draft_assistant:_show_availability_odds;" in line
+               for line in lines)
+
+
+def test_profiler_off_by_default(assistant, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    commands = iter(["best", "quit"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(commands))
+    assistant.run_interactive_draft()
+
+    assert assistant.profiler.commands == 0
+    assert not list(tmp_path.glob("draft_profile.*"))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Tests for player id references and the indexes behind the SQL the assistant runs"""
+
+import sqlite3
+
+from draft_assistant import FantasyDraftAssistant
+
+
+def plan(db, sql):
+    return " | ".join(row[3] for row in db.fetchall("EXPLAIN QUERY PLAN " + sql))
+
+
+def traced_session(db_path, monkeypatch):
+    """Run a draft, then restart it; get the SQL executed, every connection included."""
+    statements = []
+    connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", traced_connect)
+    assistant = FantasyDraftAssistant(db_path)
+    assistant.load_player_data()
+    assistant.set_draft_position(8)
+    assistant.draft_player("Derrick Henry", drafted_by_user=True)
+    assistant.draft_player("Jahmyr Gibbs")
+    assistant.undo()
+    assistant.undo()
+    assistant.redo()
+    assistant.close()
+    FantasyDraftAssistant(db_path).close()  # Restart: replays the event log
+    monkeypatch.undo()
+    return list(dict.fromkeys(" ".join(sql.split()) for sql in statements))
+
+
+def executed(statements, prefix):
+    matches = [sql for sql in statements if sql.startswith(prefix)]
+    assert matches, f"no statement starting {prefix!r} was executed"
+    return matches[0]
+
+
+def test_executed_queries_use_indexes(assistant, tmp_path, monkeypatch):
+    statements = traced_session(str(tmp_path / "traced.db"), monkeypatch)
+    db = assistant.db
+
+    pool = plan(db, executed(statements, "SELECT p.name, p.position"))
+    assert "COVERING INDEX idx_injury_reports_player_id (player_id=?)" in pool
+
+    replay = plan(db, executed(statements, "SELECT d.event"))
+    assert "SEARCH d USING INTEGER PRIMARY KEY (rowid>?)" in replay
+    assert "SEARCH p USING INTEGER PRIMARY KEY (rowid=?)" in replay
+
+    injuries = plan(db, executed(statements, "SELECT id, name, team FROM players WHERE name IN"))
+    assert "COVERING INDEX idx_players_identity (name=?)" in injuries
+
+    # No join in the session walks its inner table
+    for sql in statements:
+        if " JOIN " in sql:
+            assert "SCAN" not in plan(db, sql).split(" | ", 1)[-1], sql
+
+
+def test_migrations_create_only_indexes_with_readers(assistant):
+    indexes = {name for name, in assistant.db.fetchall(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'")}
+    schema = {"idx_players_position", "idx_players_bye_week", "idx_players_consensus_rank",
+              "idx_drafted_players_position"}  # database_schema.sql
+    assert indexes - schema == {"idx_injury_reports_player_id", "idx_players_identity",
+                                "idx_mock_draft_sources_hash"}
+
+
+def test_picks_reference_players_by_id(assistant):
+    assistant.draft_player("Derrick Henry", drafted_by_user=True)
+    assistant.draft_player("Jahmyr Gibbs")
+    assistant.state.flush()
+
+    henry, gibbs = (assistant.index.named(name)[0]['id'] for name in ("Derrick Henry", "Jahmyr Gibbs"))
+    assert assistant.db.fetchone("SELECT player_id FROM user_roster")[0] == henry
+    assert [row[0] for row in assistant.db.fetchall(
+        "SELECT player_id FROM drafted_players ORDER BY id")] == [henry, gibbs]
+
+
+def test_injury_reports_follow_player_ids(assistant):
+    achane = assistant.index.named("De'Von Achane")[0]
+    assert achane['injury_report'] == "Questionable"
+    assert assistant.db.fetchone("""
+        SELECT COUNT(*) FROM injury_reports i JOIN players p ON p.id = i.player_id
+        WHERE p.name = "De'Von Achane"
+    """)[0] == 1
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for the synthetic player pool and draft generator"""
+
+import functools
+from collections import Counter
+
+import pytest
+
+import draft_assistant
+from draft_assistant import FantasyDraftAssistant
+from src.fantasy_assistant.models.adp_stats import load_adp_stats
+from src.fantasy_assistant.models.database import DatabaseManager
+from src.fantasy_assistant.services.mock_draft_loader import store_mock_drafts
+from src.fantasy_assistant.services.synthetic_league import (generate_draft, generate_mock_drafts,
+                                                             generate_players, load_bye_weeks)
+
+EMPTY = {"load": False, "draft_position": None}  # No player pool, no draft position
+
+
+def test_pool_is_seeded_ranked_and_unique():
+    players = list(generate_players(3_000, seed=7))
+
+    assert players == list(generate_players(3_000, seed=7))
+    assert players != list(generate_players(3_000, seed=8))
+    assert [p['consensus_rank'] for p in players] == list(range(1, 3_001))
+    assert len({p['name'] for p in players}) == 3_000
+    assert not {'K', 'DEF'} & {p['position'] for p in players[:100]}
+    assert Counter(p['position'] for p in players).most_common(1)[0][0] == 'WR'
+
+
+@pytest.mark.parametrize("assistant", [EMPTY], indirect=True)
+def test_pool_uses_bye_weeks_from_the_database(assistant):
+    bye_weeks = load_bye_weeks(assistant.db)
+    assert bye_weeks['DET'] == 8 and len(bye_weeks) == 32
+
+    for player in generate_players(500, bye_weeks=bye_weeks):
+        assert player['bye_week'] == bye_weeks[player['team']]
+
+
+def test_draft_log_covers_every_pick_once():
+    players = list(generate_players(1_000, seed=1))
+    log = list(generate_draft(players, league_size=14, seed=2, user_slot=3))
+
+    assert [entry.overall_pick for entry in log] == list(range(1, 14 * 16 + 1))
+    assert len({entry.player_name for entry in log}) == len(log)
+    assert sum(entry.drafted_by_user for entry in log) == 16
+    assert all(entry.drafted_by_user == (entry.slot == 3) for entry in log)
+
+    positions = {p['name']: p['position'] for p in players}
+    early = [positions[entry.player_name] for entry in log if entry.overall_pick <= 12 * 14]
+    assert 'K' not in early and 'DEF' not in early
+
+
+@pytest.mark.parametrize("assistant", [EMPTY], indirect=True)
+def test_generated_data_loads_into_the_assistant(assistant):
+    players = list(generate_players(2_000, seed=3))
+    assistant.load_player_data([players])
+    assistant.set_draft_position(5, league_size=10)
+
+    report = assistant.import_draft_log(generate_draft(players, league_size=10, seed=4))
+    assert report.imported == 160
+    assert assistant.state.overall_pick == 161
+    assert len(assistant.state.user_roster) == 16
+
+    stored = store_mock_drafts(assistant.db, generate_mock_drafts(players, 5, league_size=10))
+    assert (stored.sources, stored.picks) == (5, 800)
+    assert load_adp_stats(assistant.db)[players[0]['name']].picks == 5
+
+
+def test_draft_position_prompt_follows_league_size(tmp_path, monkeypatch, capsys):
+    db_path = str(tmp_path / "draft.db")
+    monkeypatch.setattr(draft_assistant, "FantasyDraftAssistant",
+                        functools.partial(FantasyDraftAssistant, db_path))
+    monkeypatch.setattr("sys.argv", ["draft_assistant.py", "--league-size", "10"])
+    answers = iter(["11", "10", "quit"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": print(prompt) or next(answers))
+    draft_assistant.main()
+
+    output = capsys.readouterr().out
+    assert "Enter your draft position (1-10)" in output
+    assert "Please enter a number between 1 and 10" in output
+    db = DatabaseManager(db_path)
+    assert db.fetchone("SELECT user_draft_position, league_size FROM draft_state") == (10, 10)
+    db.close()
+
+    monkeypatch.setattr("sys.argv", ["draft_assistant.py"])
+    answers = iter(["quit"])
+    draft_assistant.main()  # A saved draft keeps its size
+    monkeypatch.setattr("sys.argv", ["draft_assistant.py", "--league-size", "12"])
+    answers = iter(["quit"])
+    draft_assistant.main()
+    assert "Saved draft has 10 teams; ignoring --league-size" in capsys.readouterr().out